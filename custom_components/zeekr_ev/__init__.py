@@ -23,12 +23,15 @@ from .const import (
     CONF_VIN_KEY,
     CONF_COUNTRY_CODE,
     CONF_USE_LOCAL_API,
+    CONF_MAX_CONCURRENCY,
+    DEFAULT_MAX_CONCURRENCY,
     DOMAIN,
     PLATFORMS,
     STARTUP_MESSAGE,
 )
+from .async_client import ZeekrAsyncClient
 from .coordinator import ZeekrCoordinator
-from .request_stats import ZeekrRequestStats
+from .worker_pool import ZeekrWorkerPool
 
 _LOGGER: logging.Logger = logging.getLogger(__package__)
 
@@ -95,6 +98,12 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
         _LOGGER.error("Failed to import zeekr_ev_api: %s", ex)
         raise ConfigEntryNotReady from ex
 
+    # Blocking client calls run on this account's own bounded pool
+    worker_pool = ZeekrWorkerPool(
+        entry.data.get(CONF_MAX_CONCURRENCY, DEFAULT_MAX_CONCURRENCY),
+        name=f"{DOMAIN}_{entry.entry_id}",
+    )
+
     # Try to reuse client from config flow to avoid duplicate login
     client = hass.data.get(DOMAIN, {}).pop("_temp_client", None)
 
@@ -111,19 +120,37 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
             vin_iv=vin_iv,
             logger=_LOGGER,
         )
-        try:
-            # Count the login request
-            stats = ZeekrRequestStats(hass)
-            await stats.async_load()
-            await stats.async_inc_request()
-            await hass.async_add_executor_job(client.login)
-        except Exception as ex:
-            _LOGGER.error("Could not log in to Zeekr API: %s", ex)
-            raise ConfigEntryNotReady from ex
-
-    coordinator = ZeekrCoordinator(hass, client=client, entry=entry)
+
+    coordinator = ZeekrCoordinator(
+        hass,
+        client=client,
+        entry=entry,
+        async_client=ZeekrAsyncClient.from_client(hass, client, worker_pool),
+        worker_pool=worker_pool,
+    )
     await coordinator.async_init_stats()
-    await coordinator.async_config_entry_first_refresh()
+    if client.logged_in:
+        coordinator.async_save_session()
+    else:
+        # Reuse saved tokens; they are validated by the first poll
+        await coordinator.async_restore_session()
+
+    # With a saved snapshot, entities come up with last-known values at once
+    # and login plus the first poll run in the background.
+    restored = await coordinator.async_restore_snapshot()
+    if not restored:
+        if not client.logged_in:
+            try:
+                await coordinator.async_login()
+            except Exception as ex:
+                _LOGGER.error("Could not log in to Zeekr API: %s", ex)
+                worker_pool.shutdown()
+                raise ConfigEntryNotReady from ex
+        try:
+            await coordinator.async_config_entry_first_refresh()
+        except Exception:
+            worker_pool.shutdown()
+            raise
 
     if coordinator.vehicles:
         _LOGGER.info(
@@ -135,9 +162,15 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
         _LOGGER.warning("No vehicles found in account")
 
     hass.data[DOMAIN][entry.entry_id] = coordinator
+    entry.async_on_unload(coordinator.async_add_listener(coordinator.async_save_snapshot))
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    if restored:
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{DOMAIN}_{entry.entry_id}_refresh"
+        )
+
     entry.async_on_unload(entry.add_update_listener(async_reload_entry))
     return True
 
@@ -146,10 +179,13 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Handle removal of an entry."""
     coordinator = hass.data[DOMAIN].get(entry.entry_id)
     if coordinator:
+        coordinator.commands.async_cancel()
         await coordinator.request_stats.async_shutdown()
 
     if unloaded := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
         hass.data[DOMAIN].pop(entry.entry_id)
+        if coordinator and coordinator.worker_pool:
+            coordinator.worker_pool.shutdown()
     return unloaded
 
 
@@ -0,0 +1,320 @@
+"""Native asyncio transport for the Zeekr EV API."""
+
+from __future__ import annotations
+
+import json
+import logging
+import sys
+from typing import TYPE_CHECKING, Any
+
+import aiohttp
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+if TYPE_CHECKING:
+    from .worker_pool import ZeekrWorkerPool
+
+    try:
+        from zeekr_ev_api.client import ZeekrClient
+    except ImportError:
+        from custom_components.zeekr_ev_api.client import ZeekrClient
+
+_LOGGER = logging.getLogger(__name__)
+
+# zeekr_ev_api internals the async transport relies on, checked before use
+# so a library release that moves them falls back to the sync client
+_REQUIRED_MODULE_ATTRS = (
+    "const",
+    "network",
+    "zeekr_app_sig",
+    "requests",
+    "ZeekrException",
+    "AuthException",
+)
+_REQUIRED_URLS = (
+    "VEHICLESTATUS_URL",
+    "VEHICLEVTMSTATUS_URL",
+    "VEHICLECHARGINGSTATUS_URL",
+    "REMOTECONTROLSTATE_URL",
+    "CHARGING_LIMIT_URL",
+    "CHARGING_PLAN_URL",
+    "LATEST_TRAVEL_PLAN_URL",
+    "CHARGE_CONTROL_URL",
+    "REMOTECONTROL_URL",
+    "SET_CHARGE_PLAN_URL",
+    "SET_TRAVEL_PLAN_URL",
+)
+
+
+class ZeekrAsyncClient:
+    """Send signed app requests over Home Assistant's shared aiohttp session.
+
+    The sync ``ZeekrClient`` still owns login, token refresh and signing
+    state; this class only replaces the blocking HTTP round trip, so the
+    two can be used side by side.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        client: ZeekrClient,
+        module,
+        worker_pool: ZeekrWorkerPool | None = None,
+    ) -> None:
+        """Initialize with a logged-in client and its zeekr_ev_api module."""
+        self.hass = hass
+        self.client = client
+        # Blocking token refreshes run here; None means HA's shared executor
+        self._worker_pool = worker_pool
+        self._const = module.const
+        self._network = module.network
+        self._sign_request = module.zeekr_app_sig.sign_request
+        self._request_cls = module.requests.Request
+        self._zeekr_exception = module.ZeekrException
+        self._auth_exception = module.AuthException
+        self._session = async_get_clientsession(hass)
+        self._vehicles: dict[str, ZeekrAsyncVehicle] = {}
+
+    @classmethod
+    def from_client(
+        cls,
+        hass: HomeAssistant,
+        client: ZeekrClient,
+        worker_pool: ZeekrWorkerPool | None = None,
+    ) -> ZeekrAsyncClient | None:
+        """Return an async client, or None if this zeekr_ev_api can't support one."""
+        module = sys.modules.get(type(client).__module__)
+        if not cls._supports(module, client):
+            _LOGGER.debug("zeekr_ev_api has no async support, using executor calls")
+            return None
+        return cls(hass, client, module, worker_pool)
+
+    @staticmethod
+    def _supports(module, client: ZeekrClient) -> bool:
+        """Return True if the library exposes everything this transport uses."""
+        if module is None or not all(
+            hasattr(module, name) for name in _REQUIRED_MODULE_ATTRS
+        ):
+            return False
+        return (
+            all(hasattr(module.const, name) for name in _REQUIRED_URLS)
+            and hasattr(module.const, "REQUEST_TIMEOUT")
+            and callable(getattr(module.network, "_refresh_token", None))
+            and callable(getattr(module.zeekr_app_sig, "sign_request", None))
+            and callable(getattr(module.requests, "Request", None))
+            and callable(getattr(client, "_get_encrypted_vin", None))
+            and callable(getattr(getattr(client, "session", None), "prepare_request", None))
+        )
+
+    def vehicle(self, vin: str) -> ZeekrAsyncVehicle:
+        """Return the async counterpart of a Vehicle."""
+        if vin not in self._vehicles:
+            self._vehicles[vin] = ZeekrAsyncVehicle(self, vin)
+        return self._vehicles[vin]
+
+    def _timeout(self) -> aiohttp.ClientTimeout:
+        """Translate the client's requests-style timeout for aiohttp."""
+        timeout = getattr(self.client, "timeout", self._const.REQUEST_TIMEOUT)
+        if isinstance(timeout, tuple):
+            return aiohttp.ClientTimeout(sock_connect=timeout[0], sock_read=timeout[1])
+        return aiohttp.ClientTimeout(total=timeout)
+
+    async def async_signed_request(
+        self,
+        method: str,
+        vin: str,
+        path: str,
+        body: dict | None = None,
+        allow_retry: bool = True,
+    ) -> dict[str, Any]:
+        """Send an app-signed request for a vehicle and return the JSON block."""
+        client = self.client
+        if not client.logged_in:
+            raise self._zeekr_exception("Not logged in")
+
+        headers = client.logged_in_headers.copy() if client.logged_in_headers else {}
+        if not headers.get("authorization"):
+            headers["authorization"] = client.bearer_token
+        headers["X-VIN"] = client._get_encrypted_vin(vin)
+        data = json.dumps(body, separators=(",", ":")) if body is not None else None
+
+        # Sign with the library so the signature always matches the sync path
+        request = self._request_cls(
+            method, f"{client.region_login_server}{path}", headers=headers, data=data
+        )
+        prepped = self._sign_request(
+            client.session.prepare_request(request), client.prod_secret
+        )
+
+        _LOGGER.debug("[Zeekr API] Async request: %s %s", method, prepped.url)
+        async with self._session.request(
+            method,
+            prepped.url,
+            headers=dict(prepped.headers),
+            data=prepped.body,
+            timeout=self._timeout(),
+        ) as resp:
+            try:
+                result = await resp.json(content_type=None)
+            except ValueError as err:
+                _LOGGER.error("Failed to decode JSON response: %s", err)
+                result = {
+                    "success": False,
+                    "error": f"Invalid JSON response: {err}",
+                    "status_code": resp.status,
+                }
+
+        if isinstance(result, dict) and result.get("msg") == "Token expired":
+            if not allow_retry:
+                raise self._auth_exception("Token expired (retry failed)")
+            # Re-login through the sync client so its lock guards the refresh
+            refresh = (self._network._refresh_token, client, client.bearer_token)
+            if self._worker_pool is not None:
+                await self._worker_pool.async_run(*refresh)
+            else:
+                await self.hass.async_add_executor_job(*refresh)
+            return await self.async_signed_request(
+                method, vin, path, body, allow_retry=False
+            )
+
+        return result if isinstance(result, dict) else {}
+
+    async def async_get_data(self, vin: str, path: str, name: str) -> dict:
+        """GET a vehicle document, raising if the backend reports a failure.
+
+        The sync client returns {} for failed plan requests; raising here
+        lets the coordinator tell an unsupported plan from an empty one.
+        """
+        block = await self.async_signed_request("GET", vin, path)
+        if not block.get("success", False):
+            raise self._zeekr_exception(f"Failed to get {name}: {block}")
+        return block.get("data", {})
+
+    async def async_post(self, vin: str, path: str, body: dict) -> bool:
+        """POST a vehicle command and return whether it was accepted."""
+        block = await self.async_signed_request("POST", vin, path, body)
+        return block.get("success", False)
+
+
+class ZeekrAsyncVehicle:
+    """Awaitable versions of the Vehicle methods the integration uses.
+
+    Method names and arguments match ``zeekr_ev_api.client.Vehicle``.
+    """
+
+    def __init__(self, client: ZeekrAsyncClient, vin: str) -> None:
+        """Initialize."""
+        self._client = client
+        self.vin = vin
+
+    def __repr__(self) -> str:
+        return f"<ZeekrAsyncVehicle {self.vin}>"
+
+    @property
+    def _const(self):
+        return self._client._const
+
+    async def get_status(self) -> dict:
+        """Fetch the vehicle status."""
+        return await self._client.async_get_data(
+            self.vin,
+            f"{self._const.VEHICLESTATUS_URL}?latest=false&target=new",
+            "vehicle status",
+        )
+
+    async def get_vtm_status(self) -> dict:
+        """Fetch the vehicle VTM status."""
+        return await self._client.async_get_data(
+            self.vin, self._const.VEHICLEVTMSTATUS_URL, "vehicle VTM status"
+        )
+
+    async def get_charging_status(self) -> dict:
+        """Fetch the vehicle charging status."""
+        return await self._client.async_get_data(
+            self.vin, self._const.VEHICLECHARGINGSTATUS_URL, "vehicle charging status"
+        )
+
+    async def get_remote_control_state(self) -> dict:
+        """Fetch the vehicle remote control state."""
+        return await self._client.async_get_data(
+            self.vin, self._const.REMOTECONTROLSTATE_URL, "remote control state"
+        )
+
+    async def get_charging_limit(self) -> dict:
+        """Fetch the vehicle charging limit."""
+        return await self._client.async_get_data(
+            self.vin, self._const.CHARGING_LIMIT_URL, "vehicle charging limit"
+        )
+
+    async def get_charge_plan(self) -> dict:
+        """Fetch the vehicle charging plan."""
+        return await self._client.async_get_data(
+            self.vin, self._const.CHARGING_PLAN_URL, "charge plan"
+        )
+
+    async def get_travel_plan(self) -> dict:
+        """Fetch the vehicle travel plan."""
+        return await self._client.async_get_data(
+            self.vin, self._const.LATEST_TRAVEL_PLAN_URL, "travel plan"
+        )
+
+    async def do_remote_control(
+        self, command: str, serviceID: str, setting: dict[str, Any]
+    ) -> bool:
+        """Perform a remote control action on the vehicle."""
+        if serviceID == "RCS":
+            path = self._const.CHARGE_CONTROL_URL
+        else:
+            path = self._const.REMOTECONTROL_URL
+        body = {"command": command, "serviceId": serviceID, "setting": setting}
+        return await self._client.async_post(self.vin, path, body)
+
+    async def set_charge_plan(
+        self,
+        start_time: str,
+        end_time: str,
+        command: str = "start",
+        bc_cycle_active: bool = False,
+        bc_temp_active: bool = False,
+    ) -> bool:
+        """Set the vehicle charging plan."""
+        body = {
+            "bcCycleActive": bc_cycle_active,
+            "bcTempActive": bc_temp_active,
+            "command": command,
+            "endTime": end_time,
+            "scheduledTime": "",
+            "startTime": start_time,
+            "target": "2",
+            "timerId": "2",
+        }
+        return await self._client.async_post(
+            self.vin, self._const.SET_CHARGE_PLAN_URL, body
+        )
+
+    async def set_travel_plan(
+        self,
+        command: str = "start",
+        start_time: str = "",
+        scheduled_time: str = "",
+        ac_preconditioning: bool = True,
+        steering_wheel_heating: bool = False,
+        schedule_list: list[dict[str, str]] | None = None,
+        timer_id: str = "4",
+    ) -> bool:
+        """Set the vehicle travel plan."""
+        body = {
+            "ac": "true" if ac_preconditioning else "false",
+            "btActive": False,
+            "btTempActive": False,
+            "bw": "1" if steering_wheel_heating else "0",
+            "bwl": "1",
+            "command": command,
+            "scheduleList": schedule_list or [],
+            "scheduledTime": scheduled_time,
+            "timerId": timer_id,
+        }
+        return await self._client.async_post(
+            self.vin, self._const.SET_TRAVEL_PLAN_URL, body
+        )
@@ -11,8 +11,14 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, CONF_DRIVE_SIDE, DRIVE_SIDE_LHD
-from .coordinator import ZeekrCoordinator
+from .const import ATTR_STALE_SINCE, DOMAIN, CONF_DRIVE_SIDE, DRIVE_SIDE_LHD
+from .coordinator import ZeekrCoordinator, vehicle_context
+from .fields import (
+    BINARY_SENSOR_FIELDS,
+    ZeekrField,
+    compile_accessor,
+    tire_binary_sensor_fields,
+)
 
 
 class ZeekrBinarySensor(CoordinatorEntity, BinarySensorEntity):
@@ -28,24 +34,53 @@ class ZeekrBinarySensor(CoordinatorEntity, BinarySensorEntity):
         name: str,
         value_fn,
         device_class: BinarySensorDeviceClass | None = None,
+        paths: tuple = (),
+        accessor=None,
     ) -> None:
         """Initialize the binary sensor."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=vehicle_context(vin, *paths))
         self.vin = vin
         self.key = key
+        self._paths = paths
         self._attr_name = name
         self._attr_unique_id = f"{vin}_{key}"
         self._value_fn = value_fn
+        self._accessor = accessor
         self._attr_device_class = device_class
 
+    @classmethod
+    def from_field(
+        cls, coordinator: ZeekrCoordinator, vin: str, field: ZeekrField
+    ) -> ZeekrBinarySensor:
+        """Create a binary sensor for a field catalog entry."""
+        return cls(
+            coordinator,
+            vin,
+            field.key,
+            field.name,
+            None,
+            field.device_class,
+            paths=(field.path,),
+            accessor=compile_accessor(field, vin),
+        )
+
     @property
     def is_on(self) -> bool | None:
         """Return true if the binary sensor is on."""
+        if self._accessor is not None:
+            return self._accessor(self.coordinator.data_index)
         data = self.coordinator.data.get(self.vin, {})
         if not data:
             return None
         return self._value_fn(data)
 
+    @property
+    def extra_state_attributes(self):
+        """Return when the value was last fetched, if it is served from cache."""
+        if stale_since := self.coordinator.data_stale_since(self.vin, self._paths):
+            return {ATTR_STALE_SINCE: stale_since}
+        return None
+
     @property
     def device_info(self):
         """Return device info."""
@@ -65,119 +100,11 @@ async def async_setup_entry(
     coordinator: ZeekrCoordinator = hass.data[DOMAIN][entry.entry_id]
 
     entities = []
+    drive_side = entry.data.get(CONF_DRIVE_SIDE, DRIVE_SIDE_LHD)
+    fields = BINARY_SENSOR_FIELDS + tire_binary_sensor_fields(drive_side)
     for vin in coordinator.data:
-        # Charging Status
-        entities.append(
-            ZeekrBinarySensor(
-                coordinator,
-                vin,
-                "charging_status",
-                "Charging Status",
-                lambda d: int(
-                    d.get("additionalVehicleStatus", {})
-                    .get("electricVehicleStatus", {})
-                    .get("chargerState", "0")
-                ) in [1, 2, 15],
-                BinarySensorDeviceClass.BATTERY_CHARGING,
-            )
+        entities.extend(
+            ZeekrBinarySensor.from_field(coordinator, vin, field) for field in fields
         )
-        # Plugged In Status
-        entities.append(
-            ZeekrBinarySensor(
-                coordinator,
-                vin,
-                "plugged_in",
-                "Plugged In",
-                lambda d: int(
-                    d.get("additionalVehicleStatus", {})
-                    .get("electricVehicleStatus", {})
-                    .get("statusOfChargerConnection")
-                ),
-                BinarySensorDeviceClass.PLUG,
-            )
-        )
-
-        # Door open sensors from drivingSafetyStatus
-        door_fields = {
-            "door_open_driver": ("doorOpenStatusDriver", "Driver door open"),
-            "door_open_passenger": ("doorOpenStatusPassenger", "Passenger door open"),
-            "door_open_driver_rear": (
-                "doorOpenStatusDriverRear",
-                "Driver rear door open",
-            ),
-            "door_open_passenger_rear": (
-                "doorOpenStatusPassengerRear",
-                "Passenger rear door open",
-            ),
-            "trunk_open": ("trunkOpenStatus", "Trunk open"),
-            "hood_open": ("engineHoodOpenStatus", "Hood open"),
-        }
-
-        for key, (field_name, label) in door_fields.items():
-            entities.append(
-                ZeekrBinarySensor(
-                    coordinator,
-                    vin,
-                    key,
-                    label,
-                    lambda d, f=field_name: (
-                        None
-                        if (
-                            v := d.get("additionalVehicleStatus", {})
-                            .get("drivingSafetyStatus", {})
-                            .get(f)
-                        )
-                        is None
-                        else str(v) == "1"
-                    ),
-                    BinarySensorDeviceClass.DOOR,
-                )
-            )
-
-        # Tire Pre-Warning & Temp Warning
-        from .sensor import get_tire_position_label
-        drive_side = entry.data.get(CONF_DRIVE_SIDE, DRIVE_SIDE_LHD)
-        for tire in ["Driver", "Passenger", "DriverRear", "PassengerRear"]:
-            display_label = get_tire_position_label(tire, drive_side)
-            # Pre-Warning
-            entities.append(
-                ZeekrBinarySensor(
-                    coordinator,
-                    vin,
-                    f"tire_pre_warning_{tire.lower()}",
-                    f"Tire Pre-Warning {display_label}",
-                    lambda d, t=tire: (
-                        None
-                        if (
-                            v := d.get("additionalVehicleStatus", {})
-                            .get("maintenanceStatus", {})
-                            .get(f"tyrePreWarning{t}")
-                        )
-                        is None
-                        else str(v) != "0"
-                    ),
-                    BinarySensorDeviceClass.PROBLEM,
-                )
-            )
-            # Temp Warning
-            entities.append(
-                ZeekrBinarySensor(
-                    coordinator,
-                    vin,
-                    f"tire_temp_warning_{tire.lower()}",
-                    f"Tire Temp Warning {display_label}",
-                    lambda d, t=tire: (
-                        None
-                        if (
-                            v := d.get("additionalVehicleStatus", {})
-                            .get("maintenanceStatus", {})
-                            .get(f"tyreTempWarning{t}")
-                        )
-                        is None
-                        else str(v) != "0"
-                    ),
-                    BinarySensorDeviceClass.PROBLEM,
-                )
-            )
 
     async_add_entities(entities)
@@ -0,0 +1,69 @@
+"""Daily API request budget for Zeekr EV API Integration."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+# Share of the daily budget held back for operator commands
+COMMAND_RESERVE_FRACTION = 0.1
+# Below this share of the budget, background polls fetch only essential endpoints
+ESSENTIAL_ONLY_FRACTION = 0.25
+
+
+class ZeekrRequestBudget:
+    """Spread a daily request quota over the rest of the day.
+
+    Background polls may only spend the budget above the command reserve,
+    so commands always have requests left; commands themselves are never
+    blocked. A budget of 0 disables all limits.
+    """
+
+    def __init__(self, daily_budget: int) -> None:
+        """Initialize with the configured requests per day."""
+        self.daily_budget = max(0, int(daily_budget or 0))
+        self.command_reserve = int(self.daily_budget * COMMAND_RESERVE_FRACTION)
+
+    @property
+    def enabled(self) -> bool:
+        """Return True if a budget is configured."""
+        return self.daily_budget > 0
+
+    def remaining(self, requests_today: int) -> int | None:
+        """Return the requests left today, or None if unlimited."""
+        if not self.enabled:
+            return None
+        return max(0, self.daily_budget - requests_today)
+
+    def poll_allowance(self, requests_today: int) -> int | None:
+        """Return the requests background polls may still spend today."""
+        if not self.enabled:
+            return None
+        return max(0, self.daily_budget - self.command_reserve - requests_today)
+
+    def can_poll(self, requests_today: int) -> bool:
+        """Return True if a background poll fits in the budget."""
+        allowance = self.poll_allowance(requests_today)
+        return allowance is None or allowance > 0
+
+    def essential_only(self, requests_today: int) -> bool:
+        """Return True if polls should be cut back to essential endpoints."""
+        allowance = self.poll_allowance(requests_today)
+        if allowance is None:
+            return False
+        return allowance < self.daily_budget * ESSENTIAL_ONLY_FRACTION
+
+    def min_interval(
+        self, requests_today: int, requests_per_poll: int, now: datetime | None = None
+    ) -> timedelta | None:
+        """Return the shortest poll interval that lasts the budget until midnight."""
+        allowance = self.poll_allowance(requests_today)
+        if allowance is None:
+            return None
+
+        now = now or datetime.now()
+        midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+        seconds_left = max(1.0, (midnight - now).total_seconds())
+        polls_left = allowance / max(1, requests_per_poll)
+        if polls_left < 1:
+            return timedelta(seconds=seconds_left)
+        return timedelta(seconds=seconds_left / polls_left)
@@ -64,9 +64,8 @@ class ZeekrFlashBlinkersButton(ZeekrEntity, ButtonEntity):
             ]
         }
 
-        await self.coordinator.async_inc_invoke()
-        await self.hass.async_add_executor_job(
-            vehicle.do_remote_control, command, service_id, setting
+        await self.coordinator.async_send_command(
+            vehicle, command, service_id, setting
         )
         _LOGGER.info("Flash blinkers requested for vehicle %s", self.vin)
 
@@ -99,9 +98,8 @@ class ZeekrHonkFlashButton(ZeekrEntity, ButtonEntity):
             ]
         }
 
-        await self.coordinator.async_inc_invoke()
-        await self.hass.async_add_executor_job(
-            vehicle.do_remote_control, command, service_id, setting
+        await self.coordinator.async_send_command(
+            vehicle, command, service_id, setting
         )
         _LOGGER.info("Honk horn and flash blinkers requested for vehicle %s", self.vin)
 
@@ -134,9 +132,8 @@ class ZeekrParkingComfortDisableButton(ZeekrEntity, ButtonEntity):
             ]
         }
 
-        await self.coordinator.async_inc_invoke()
-        await self.hass.async_add_executor_job(
-            vehicle.do_remote_control, command, service_id, setting
+        await self.coordinator.async_send_command(
+            vehicle, command, service_id, setting
         )
         _LOGGER.info("Parking comfort disabled for vehicle %s", self.vin)
 
@@ -161,4 +158,6 @@ class ZeekrForceUpdateButton(ZeekrEntity, ButtonEntity):
         """Handle the button press."""
         _LOGGER.info("Poll vehicle data requested for vehicle %s", self.vin)
         self.coordinator.latest_poll_time = datetime.now().isoformat()
-        await self.coordinator.async_request_refresh()
+        # Only this vehicle; fall back to a full poll if it has no data yet
+        if await self.coordinator.async_refresh_vehicle(self.vin) is None:
+            await self.coordinator.async_request_refresh()
@@ -0,0 +1,106 @@
+"""Per-vehicle endpoint capability cache for Zeekr EV API Integration."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+import logging
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+CAPABILITIES_VERSION = 1
+# Consecutive failed calls before an endpoint is marked unsupported
+CAPABILITY_PROBE_ATTEMPTS = 3
+# How long an endpoint stays skipped before it is probed again
+CAPABILITY_REPROBE_INTERVAL = timedelta(days=1)
+CAPABILITIES_SAVE_DELAY = 10
+
+
+class ZeekrCapabilities:
+    """Remember which endpoints return usable data for each vehicle.
+
+    Every poll doubles as a probe: an endpoint that keeps failing is
+    skipped for a day, or until the vehicle's displayOSVersion changes,
+    whichever comes first. An empty answer (e.g. no plan set) counts as
+    supported.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the store for one config entry."""
+        self._store: Store = Store(
+            hass, CAPABILITIES_VERSION, f"{DOMAIN}.{entry_id}.capabilities"
+        )
+        # vin -> {"os_version": str | None, "unsupported": {endpoint: iso time}}
+        self._vehicles: dict[str, dict] = {}
+        self._failures: dict[tuple[str, str], int] = {}
+
+    async def async_load(self) -> None:
+        """Load the saved capabilities."""
+        try:
+            stored = await self._store.async_load()
+        except Exception as ex:  # noqa: BLE001
+            _LOGGER.warning("Could not load vehicle capabilities: %s", ex)
+            return
+        if isinstance(stored, dict):
+            self._vehicles = stored
+
+    def unsupported(self, vin: str) -> dict[str, str]:
+        """Return the endpoints currently skipped for a vehicle."""
+        return dict(self._vehicles.get(vin, {}).get("unsupported", {}))
+
+    def supported(self, vin: str, endpoint: str, os_version: str | None) -> bool:
+        """Return False if the endpoint is known not to work for this vehicle."""
+        record = self._vehicles.get(vin)
+        if record is None:
+            return True
+        if record.get("os_version") != os_version:
+            _LOGGER.debug("OS version of %s changed, probing all endpoints", vin)
+            self._vehicles.pop(vin)
+            self._async_schedule_save()
+            return True
+
+        unsupported = record.get("unsupported", {})
+        if endpoint not in unsupported:
+            return True
+        try:
+            since = datetime.fromisoformat(unsupported[endpoint])
+        except (TypeError, ValueError):
+            since = datetime.min
+        if datetime.now() - since >= CAPABILITY_REPROBE_INTERVAL:
+            # Give it another chance; a single failure marks it again
+            self._failures[(vin, endpoint)] = CAPABILITY_PROBE_ATTEMPTS - 1
+            del unsupported[endpoint]
+            self._async_schedule_save()
+            return True
+        return False
+
+    def record(
+        self, vin: str, endpoint: str, usable: bool, os_version: str | None
+    ) -> None:
+        """Record the outcome of a completed endpoint call."""
+        key = (vin, endpoint)
+        if usable:
+            self._failures.pop(key, None)
+            return
+
+        self._failures[key] = self._failures.get(key, 0) + 1
+        if self._failures[key] < CAPABILITY_PROBE_ATTEMPTS:
+            return
+        del self._failures[key]
+        _LOGGER.info(
+            "%s returned no usable data for %s, skipping it for now", endpoint, vin
+        )
+        record = self._vehicles.setdefault(
+            vin, {"os_version": os_version, "unsupported": {}}
+        )
+        record["os_version"] = os_version
+        record.setdefault("unsupported", {})[endpoint] = datetime.now().isoformat()
+        self._async_schedule_save()
+
+    def _async_schedule_save(self) -> None:
+        """Save the capabilities after a short delay."""
+        self._store.async_delay_save(lambda: self._vehicles, CAPABILITIES_SAVE_DELAY)
@@ -0,0 +1,105 @@
+"""Per-endpoint circuit breaker for Zeekr EV API Integration."""
+
+from __future__ import annotations
+
+import logging
+import time
+
+_LOGGER = logging.getLogger(__name__)
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+CIRCUIT_STATES = [STATE_CLOSED, STATE_HALF_OPEN, STATE_OPEN]
+
+# Consecutive failures (across the account's vehicles) that open the circuit
+CIRCUIT_FAILURE_THRESHOLD = 3
+# Cool-down after opening; doubles each time a trial call fails (seconds)
+CIRCUIT_BASE_COOLDOWN = 60
+CIRCUIT_MAX_COOLDOWN = 1800
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling an endpoint whose circuit is open."""
+
+
+class ZeekrCircuitBreaker:
+    """Stop calling an endpoint that keeps failing.
+
+    Closed: calls go through. After CIRCUIT_FAILURE_THRESHOLD failures in a
+    row it opens and rejects calls until the cool-down has passed, then lets
+    a single trial call through (half-open). Success closes it again; a
+    failure reopens it with twice the cool-down.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+        base_cooldown: float = CIRCUIT_BASE_COOLDOWN,
+        max_cooldown: float = CIRCUIT_MAX_COOLDOWN,
+    ) -> None:
+        """Initialize a closed breaker."""
+        self.name = name
+        self.threshold = threshold
+        self.base_cooldown = base_cooldown
+        self.max_cooldown = max_cooldown
+        self.failures = 0
+        self.cooldown = base_cooldown
+        self.opened_until: float | None = None
+        self._trial_running = False
+
+    @property
+    def state(self) -> str:
+        """Return closed, open or half_open."""
+        if self.opened_until is None:
+            return STATE_CLOSED
+        if time.monotonic() < self.opened_until:
+            return STATE_OPEN
+        return STATE_HALF_OPEN
+
+    def retry_in(self) -> float:
+        """Return the seconds left until the next trial call."""
+        if self.opened_until is None:
+            return 0
+        return max(0.0, self.opened_until - time.monotonic())
+
+    def allow(self) -> bool:
+        """Return True if a call may be made now."""
+        state = self.state
+        if state == STATE_CLOSED:
+            return True
+        if state == STATE_HALF_OPEN and not self._trial_running:
+            self._trial_running = True
+            return True
+        return False
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful call."""
+        if self.opened_until is not None:
+            _LOGGER.info("%s is answering again, closing its circuit", self.name)
+        self.failures = 0
+        self.cooldown = self.base_cooldown
+        self.opened_until = None
+        self._trial_running = False
+
+    def record_ignored(self) -> None:
+        """Release a call that failed for a reason the breaker does not count."""
+        self._trial_running = False
+
+    def record_failure(self) -> None:
+        """Count a failed call, opening the circuit when needed."""
+        self.failures += 1
+        if self._trial_running:
+            # The trial call failed: back off for longer
+            self._trial_running = False
+            self.cooldown = min(self.cooldown * 2, self.max_cooldown)
+        elif self.opened_until is not None or self.failures < self.threshold:
+            return
+        self.opened_until = time.monotonic() + self.cooldown
+        _LOGGER.warning(
+            "%s failed %s times in a row, pausing calls for %ss",
+            self.name,
+            self.failures,
+            self.cooldown,
+        )
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import asyncio
 from datetime import datetime, timezone
 from typing import Any
 
@@ -17,8 +16,9 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
-from .coordinator import ZeekrCoordinator
+from .confirm import AnyExcept
+from .const import DOMAIN, ENDPOINT_STATUS
+from .coordinator import ZeekrCoordinator, vehicle_context
 
 
 async def async_setup_entry(
@@ -47,7 +47,16 @@ class ZeekrClimate(CoordinatorEntity, ClimateEntity):
 
     def __init__(self, coordinator: ZeekrCoordinator, vin: str) -> None:
         """Initialize the climate entity."""
-        super().__init__(coordinator)
+        super().__init__(
+            coordinator,
+            context=vehicle_context(
+                vin,
+                *(
+                    ("additionalVehicleStatus", "climateStatus", key)
+                    for key in ("interiorTemp", "preClimateActive", "updateTime")
+                ),
+            ),
+        )
         self.vin = vin
         self._attr_unique_id = f"{vin}_climate"
         self._target_temperature = 20.0  # Default since vehicle doesn't report setpoint
@@ -129,20 +138,25 @@ class ZeekrClimate(CoordinatorEntity, ClimateEntity):
             }
 
         if setting:
-            await self.coordinator.async_inc_invoke()
-            await self.hass.async_add_executor_job(
-                vehicle.do_remote_control, command, service_id, setting
+            await self.coordinator.async_send_command(
+                vehicle, command, service_id, setting
             )
 
             # Optimistic update
             self._update_local_state_optimistically(hvac_mode)
             self.async_write_ha_state()
 
-            # delayed refresh
-            async def delayed_refresh():
-                await asyncio.sleep(10)
-                await self.coordinator.async_request_refresh()
-            self.hass.async_create_task(delayed_refresh())
+            self.coordinator.async_confirm(
+                self.vin,
+                ENDPOINT_STATUS,
+                {
+                    ("additionalVehicleStatus", "climateStatus", "preClimateActive"): (
+                        ("1", "true")
+                        if hvac_mode == HVACMode.HEAT_COOL
+                        else AnyExcept(("1", "true"))
+                    )
+                },
+            )
 
     def _update_local_state_optimistically(self, hvac_mode: HVACMode) -> None:
         """Update the coordinator data to reflect the change immediately."""
@@ -0,0 +1,152 @@
+"""Per-vehicle remote command queue for Zeekr EV API Integration."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import callback
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from .coordinator import ZeekrCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+# Commands for these services issued within the window are merged (seconds)
+COALESCE_WINDOW = 0.5
+# Climate service: AC, seats, steering wheel and defrost share one request
+COALESCED_SERVICES = ("ZAF",)
+
+
+class _Batch:
+    """Parameters and waiting callers for one merged command."""
+
+    def __init__(self, vehicle: Any, command: str, service_id: str) -> None:
+        self.vehicle = vehicle
+        self.command = command
+        self.service_id = service_id
+        # Keyed by parameter key so a later value replaces an earlier one
+        self.parameters: dict[str, dict] = {}
+        self.waiters: list[asyncio.Future] = []
+
+    def add(self, setting: dict) -> None:
+        parameters = setting.get("serviceParameters", [])
+        keys = {parameter["key"] for parameter in parameters}
+        # A new value for a base key (AC, SH.11) also replaces the sub-
+        # parameters (AC.temp, SH.11.level) sent with the earlier value
+        for key in list(self.parameters):
+            if key not in keys and any(key.startswith(f"{base}.") for base in keys):
+                del self.parameters[key]
+        for parameter in parameters:
+            self.parameters.pop(parameter["key"], None)
+            self.parameters[parameter["key"]] = parameter
+
+    @property
+    def setting(self) -> dict:
+        return {"serviceParameters": list(self.parameters.values())}
+
+
+class ZeekrCommandQueue:
+    """Send remote commands one at a time per vehicle.
+
+    "start" commands for the climate service that arrive within a short
+    window are merged into one request with the combined parameters; each
+    caller gets the merged request's result.
+    """
+
+    def __init__(
+        self, coordinator: ZeekrCoordinator, window: float = COALESCE_WINDOW
+    ) -> None:
+        """Initialize the queue."""
+        self.coordinator = coordinator
+        self.window = window
+        self._locks: dict[str, asyncio.Lock] = {}
+        self._batches: dict[tuple, _Batch] = {}
+        self._flushes: dict[tuple, asyncio.Task] = {}
+        self.sent = 0
+        self.merged = 0
+
+    def _lock(self, vin: str) -> asyncio.Lock:
+        if vin not in self._locks:
+            self._locks[vin] = asyncio.Lock()
+        return self._locks[vin]
+
+    async def async_send(
+        self, vehicle: Any, command: str, service_id: str, setting: dict
+    ) -> Any:
+        """Queue a remote command and return the API result."""
+        if command != "start" or service_id not in COALESCED_SERVICES:
+            return await self._async_send(vehicle, command, service_id, setting)
+
+        key = (vehicle.vin, command, service_id)
+        batch = self._batches.get(key)
+        if batch is None:
+            batch = self._batches[key] = _Batch(vehicle, command, service_id)
+            self._flushes[key] = self.coordinator.entry.async_create_background_task(
+                self.coordinator.hass,
+                self._async_flush(key),
+                f"{DOMAIN}_command_{vehicle.vin}_{service_id}",
+            )
+        else:
+            self.merged += 1
+        batch.add(setting)
+        waiter = asyncio.get_running_loop().create_future()
+        batch.waiters.append(waiter)
+        return await waiter
+
+    async def _async_flush(self, key: tuple) -> None:
+        """Send a batch once its window has closed."""
+        batch = self._batches[key]
+        try:
+            await asyncio.sleep(self.window)
+            del self._batches[key]
+            _LOGGER.debug(
+                "Sending %s for %s merged from %d command(s)",
+                batch.service_id,
+                batch.vehicle.vin,
+                len(batch.waiters),
+            )
+            result = await self._async_send(
+                batch.vehicle, batch.command, batch.service_id, batch.setting
+            )
+        except asyncio.CancelledError:
+            # Unloading: the merged command is dropped
+            self._batches.pop(key, None)
+            for waiter in batch.waiters:
+                waiter.cancel()
+            raise
+        except Exception as err:  # noqa: BLE001
+            for waiter in batch.waiters:
+                if not waiter.done():
+                    waiter.set_exception(err)
+        else:
+            for waiter in batch.waiters:
+                if not waiter.done():
+                    waiter.set_result(result)
+        finally:
+            self._flushes.pop(key, None)
+
+    @callback
+    def async_cancel(self) -> None:
+        """Cancel commands still waiting for their window, e.g. on unload."""
+        for task in self._flushes.values():
+            task.cancel()
+        self._flushes.clear()
+        # A flush task that has not started yet never reaches its handler
+        for batch in self._batches.values():
+            for waiter in batch.waiters:
+                waiter.cancel()
+        self._batches.clear()
+
+    async def _async_send(
+        self, vehicle: Any, command: str, service_id: str, setting: dict
+    ) -> Any:
+        async with self._lock(vehicle.vin):
+            self.sent += 1
+            self.coordinator.inc_invoke()
+            return await self.coordinator.async_call(
+                vehicle.do_remote_control, command, service_id, setting
+            )
@@ -15,6 +15,9 @@ from .const import (
     CONF_HMAC_SECRET_KEY,
     CONF_PASSWORD,
     CONF_PASSWORD_PUBLIC_KEY,
+    CONF_DAILY_REQUEST_BUDGET,
+    CONF_MAX_CONCURRENCY,
+    CONF_MAX_STALENESS,
     CONF_POLLING_INTERVAL,
     CONF_PROD_SECRET,
     CONF_USERNAME,
@@ -25,6 +28,9 @@ from .const import (
     CONF_DRIVE_SIDE,
     DRIVE_SIDE_LHD,
     DRIVE_SIDE_RHD,
+    DEFAULT_DAILY_REQUEST_BUDGET,
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_MAX_STALENESS,
     DEFAULT_POLLING_INTERVAL,
     DOMAIN,
     COUNTRY_CODE_MAPPING,
@@ -174,6 +180,18 @@ class ZeekrEVAPIFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):  # type:
                         CONF_POLLING_INTERVAL,
                         default=defaults.get(CONF_POLLING_INTERVAL, DEFAULT_POLLING_INTERVAL),
                     ): int,
+                    vol.Optional(
+                        CONF_MAX_CONCURRENCY,
+                        default=defaults.get(CONF_MAX_CONCURRENCY, DEFAULT_MAX_CONCURRENCY),
+                    ): vol.All(int, vol.Range(min=1, max=16)),
+                    vol.Optional(
+                        CONF_DAILY_REQUEST_BUDGET,
+                        default=defaults.get(CONF_DAILY_REQUEST_BUDGET, DEFAULT_DAILY_REQUEST_BUDGET),
+                    ): vol.All(int, vol.Range(min=0)),
+                    vol.Optional(
+                        CONF_MAX_STALENESS,
+                        default=defaults.get(CONF_MAX_STALENESS, DEFAULT_MAX_STALENESS),
+                    ): vol.All(int, vol.Range(min=0)),
                     vol.Optional(
                         CONF_HMAC_ACCESS_KEY,
                         default=defaults.get(CONF_HMAC_ACCESS_KEY, ""),
@@ -394,6 +412,18 @@ class ZeekrEVAPIOptionsFlowHandler(config_entries.OptionsFlow):
                         CONF_POLLING_INTERVAL,
                         default=data.get(CONF_POLLING_INTERVAL, DEFAULT_POLLING_INTERVAL),
                     ): int,
+                    vol.Optional(
+                        CONF_MAX_CONCURRENCY,
+                        default=data.get(CONF_MAX_CONCURRENCY, DEFAULT_MAX_CONCURRENCY),
+                    ): vol.All(int, vol.Range(min=1, max=16)),
+                    vol.Optional(
+                        CONF_DAILY_REQUEST_BUDGET,
+                        default=data.get(CONF_DAILY_REQUEST_BUDGET, DEFAULT_DAILY_REQUEST_BUDGET),
+                    ): vol.All(int, vol.Range(min=0)),
+                    vol.Optional(
+                        CONF_MAX_STALENESS,
+                        default=data.get(CONF_MAX_STALENESS, DEFAULT_MAX_STALENESS),
+                    ): vol.All(int, vol.Range(min=0)),
                     vol.Optional(
                         CONF_HMAC_ACCESS_KEY,
                         default=data.get(CONF_HMAC_ACCESS_KEY, ""),
@@ -0,0 +1,71 @@
+"""Confirm remote commands by polling the state they change."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Awaitable, Callable
+
+# Wait before each check (seconds); the last step repeats until the deadline
+CONFIRM_STEPS = (3, 3, 5, 8, 13)
+CONFIRM_TIMEOUT = 60
+
+
+class AnyExcept(tuple):
+    """Expected values matching any reported value except these."""
+
+
+def get_path(data: Any, path: tuple[str, ...]) -> Any:
+    """Return the value at path in nested dicts, or None."""
+    for key in path:
+        if not isinstance(data, dict):
+            return None
+        data = data.get(key)
+    return data
+
+
+def state_matches(data: dict, expected: dict[tuple[str, ...], tuple[str, ...]]) -> bool:
+    """Return True if every path holds one of its expected values.
+
+    A missing value never matches, not even AnyExcept.
+    """
+    for path, values in expected.items():
+        value = get_path(data, path)
+        if value is None:
+            return False
+        if (str(value).lower() in values) == isinstance(values, AnyExcept):
+            return False
+    return True
+
+
+async def async_confirm_state(
+    refresh: Callable[[], Awaitable[dict | None]],
+    expected: dict[tuple[str, ...], tuple[str, ...]],
+    steps: tuple[float, ...] = CONFIRM_STEPS,
+    timeout: float = CONFIRM_TIMEOUT,
+) -> bool | None:
+    """Poll until the vehicle reports the expected state or the deadline passes.
+
+    refresh fetches the vehicle data (or None on failure). Returns True once
+    the state matches, False if fresh data never matched, and None if no
+    fetch succeeded.
+    """
+    expected = {
+        path: type(values)(str(value).lower() for value in values)
+        for path, values in expected.items()
+    }
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    fetched = False
+    attempt = 0
+    while True:
+        delay = steps[min(attempt, len(steps) - 1)]
+        if loop.time() + delay > deadline:
+            return False if fetched else None
+        await asyncio.sleep(delay)
+        attempt += 1
+        data = await refresh()
+        if data is None:
+            continue
+        fetched = True
+        if state_matches(data, expected):
+            return True
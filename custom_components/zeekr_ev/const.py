@@ -61,6 +61,9 @@ CONF_PROD_SECRET = "prod_secret"
 CONF_VIN_KEY = "vin_key"
 CONF_VIN_IV = "vin_iv"
 CONF_POLLING_INTERVAL = "polling_interval"
+CONF_MAX_CONCURRENCY = "max_concurrency"
+CONF_DAILY_REQUEST_BUDGET = "daily_request_budget"
+CONF_MAX_STALENESS = "max_staleness"
 CONF_USE_LOCAL_API = "use_local_api"
 CONF_DRIVE_SIDE = "drive_side"
 DRIVE_SIDE_LHD = "lhd"
@@ -69,6 +72,53 @@ DRIVE_SIDE_RHD = "rhd"
 # Defaults
 DEFAULT_NAME = DOMAIN
 DEFAULT_POLLING_INTERVAL = 5  # minutes
+DEFAULT_MAX_CONCURRENCY = 4  # concurrent blocking API calls per account
+DEFAULT_DAILY_REQUEST_BUDGET = 0  # requests per day, 0 = unlimited
+DEFAULT_MAX_STALENESS = 30  # minutes a cached section is served after failed fetches
+
+# API endpoints fetched for each vehicle
+ENDPOINT_STATUS = "status"
+ENDPOINT_REMOTE_CONTROL_STATE = "remote_control_state"
+ENDPOINT_CHARGING_STATUS = "charging_status"
+ENDPOINT_CHARGING_LIMIT = "charging_limit"
+ENDPOINT_CHARGE_PLAN = "charge_plan"
+ENDPOINT_TRAVEL_PLAN = "travel_plan"
+ENDPOINTS = [
+    ENDPOINT_STATUS,
+    ENDPOINT_REMOTE_CONTROL_STATE,
+    ENDPOINT_CHARGING_STATUS,
+    ENDPOINT_CHARGING_LIMIT,
+    ENDPOINT_CHARGE_PLAN,
+    ENDPOINT_TRAVEL_PLAN,
+]
+
+# Attribute marking values served from cache after a failed fetch
+ATTR_STALE_SINCE = "stale_since"
+
+# Endpoints still polled when the daily request budget runs low
+ESSENTIAL_ENDPOINTS = [ENDPOINT_STATUS]
+
+# Minimum time between fetches of each endpoint (seconds, 0 = every poll).
+# Plans and the charging limit only change when the user edits them.
+ENDPOINT_INTERVALS = {
+    ENDPOINT_STATUS: 0,
+    ENDPOINT_REMOTE_CONTROL_STATE: 0,
+    ENDPOINT_CHARGING_STATUS: 0,
+    ENDPOINT_CHARGING_LIMIT: 3600,
+    ENDPOINT_CHARGE_PLAN: 3600,
+    ENDPOINT_TRAVEL_PLAN: 3600,
+}
+
+# Deadline for each endpoint call (seconds). A vehicle update is built from
+# whatever finished in time; late results are merged when they arrive.
+ENDPOINT_TIMEOUTS = {
+    ENDPOINT_STATUS: 20,
+    ENDPOINT_REMOTE_CONTROL_STATE: 15,
+    ENDPOINT_CHARGING_STATUS: 15,
+    ENDPOINT_CHARGING_LIMIT: 10,
+    ENDPOINT_CHARGE_PLAN: 10,
+    ENDPOINT_TRAVEL_PLAN: 10,
+}
 
 # Country code to (country_name, region) mapping
 COUNTRY_CODE_MAPPING = {
@@ -3,19 +3,62 @@
 from __future__ import annotations
 
 import asyncio
+from collections import deque
+from contextvars import ContextVar
+import copy
 from datetime import timedelta, datetime
 import logging
-from typing import TYPE_CHECKING, Optional
+import random
+import sys
+import time
+from typing import TYPE_CHECKING, Any, Callable, Optional
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 import homeassistant.helpers.event as event
 
 
-from .const import CONF_POLLING_INTERVAL, DEFAULT_POLLING_INTERVAL, DOMAIN
+from .const import (
+    CONF_DAILY_REQUEST_BUDGET,
+    CONF_MAX_STALENESS,
+    CONF_PASSWORD,
+    CONF_POLLING_INTERVAL,
+    DEFAULT_DAILY_REQUEST_BUDGET,
+    DEFAULT_MAX_STALENESS,
+    DEFAULT_POLLING_INTERVAL,
+    DOMAIN,
+    ENDPOINT_CHARGE_PLAN,
+    ENDPOINT_CHARGING_LIMIT,
+    ENDPOINT_CHARGING_STATUS,
+    ENDPOINT_INTERVALS,
+    ENDPOINT_TIMEOUTS,
+    ENDPOINTS,
+    ENDPOINT_REMOTE_CONTROL_STATE,
+    ENDPOINT_STATUS,
+    ENDPOINT_TRAVEL_PLAN,
+    ESSENTIAL_ENDPOINTS,
+)
+from .async_client import ZeekrAsyncClient
+from .budget import ZeekrRequestBudget
+from .capabilities import ZeekrCapabilities
+from .circuit_breaker import STATE_OPEN, CircuitOpenError, ZeekrCircuitBreaker
+from .commands import ZeekrCommandQueue
+from .confirm import async_confirm_state
+from .errors import (
+    ERROR_AUTH_EXPIRED,
+    ERROR_PERMANENT,
+    ERROR_THROTTLED,
+    ERROR_TRANSIENT,
+    classify_error,
+)
+from .polling import ZeekrAdaptivePollingPolicy, ZeekrPollingPolicy
 from .request_stats import ZeekrRequestStats
+from .session import ZeekrSessionStore
+from .snapshot import ZeekrSnapshot
+from .throttle import ZeekrThrottle
+from .worker_pool import ZeekrWorkerPool
 
 if TYPE_CHECKING:
     # Import for type checking only
@@ -26,6 +69,114 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+# Poll a vehicle on a tick that lands this close before its due time (seconds)
+POLL_DUE_TOLERANCE = 5
+
+# Set while a caller has already waited for its throttle slot
+_THROTTLE_SLOT: ContextVar[bool] = ContextVar("zeekr_throttle_slot", default=False)
+# Set while a scheduled update runs, so its requests can be told apart from
+# those of commands and their confirmations running at the same time
+_IN_POLL: ContextVar[bool] = ContextVar("zeekr_in_poll", default=False)
+
+# Number of recent update durations kept for diagnostics
+UPDATE_HISTORY = 20
+
+# How often the account's vehicle list is read again to pick up added or
+# removed vehicles (seconds)
+VEHICLE_LIST_INTERVAL = 24 * 60 * 60
+
+# Retry delay during an API outage doubles from the base interval up to this
+BACKOFF_MAX_INTERVAL = timedelta(hours=1)
+# Spread retries by up to this fraction so they don't land all at once
+BACKOFF_JITTER = 0.2
+
+# Vehicle methods for the endpoints fetched alongside get_status
+ENDPOINT_METHODS = {
+    ENDPOINT_REMOTE_CONTROL_STATE: "get_remote_control_state",
+    ENDPOINT_CHARGING_STATUS: "get_charging_status",
+    ENDPOINT_CHARGING_LIMIT: "get_charging_limit",
+    ENDPOINT_CHARGE_PLAN: "get_charge_plan",
+    ENDPOINT_TRAVEL_PLAN: "get_travel_plan",
+}
+
+
+# Top-level snapshot keys filled in from auxiliary endpoints
+SECTION_ENDPOINTS = {
+    "chargingStatus": ENDPOINT_CHARGING_STATUS,
+    "chargingLimit": ENDPOINT_CHARGING_LIMIT,
+    "chargePlan": ENDPOINT_CHARGE_PLAN,
+    "travelPlan": ENDPOINT_TRAVEL_PLAN,
+}
+
+
+def endpoint_for_path(path: tuple[str, ...]) -> str:
+    """Return the endpoint that supplies a path of the vehicle snapshot."""
+    if tuple(path[:2]) == ("additionalVehicleStatus", "remoteControlState"):
+        return ENDPOINT_REMOTE_CONTROL_STATE
+    return SECTION_ENDPOINTS.get(path[0] if path else None, ENDPOINT_STATUS)
+
+
+def vehicle_os_version(vehicle: Vehicle) -> str | None:
+    """Return the vehicle's display OS version from the vehicle list."""
+    data = getattr(vehicle, "data", None)
+    return data.get("displayOSVersion") if isinstance(data, dict) else None
+
+
+def merge_sections(vehicle_data: dict, sections: dict[str, dict]) -> dict:
+    """Merge auxiliary endpoint documents into a vehicle status document.
+
+    Sections are copied, so entities writing optimistic values into the
+    published data cannot alter the section cache.
+    """
+    if remote_state := sections.get(ENDPOINT_REMOTE_CONTROL_STATE):
+        vehicle_data.setdefault("additionalVehicleStatus", {})[
+            "remoteControlState"
+        ] = copy.deepcopy(remote_state)
+
+    if charging_status := sections.get(ENDPOINT_CHARGING_STATUS):
+        vehicle_data.setdefault("chargingStatus", {}).update(
+            copy.deepcopy(charging_status)
+        )
+
+    if charging_limit := sections.get(ENDPOINT_CHARGING_LIMIT):
+        vehicle_data["chargingLimit"] = copy.deepcopy(charging_limit)
+
+    if charge_plan := sections.get(ENDPOINT_CHARGE_PLAN):
+        vehicle_data["chargePlan"] = copy.deepcopy(charge_plan)
+
+    if travel_plan := sections.get(ENDPOINT_TRAVEL_PLAN):
+        vehicle_data["travelPlan"] = copy.deepcopy(travel_plan)
+
+    return vehicle_data
+
+
+def flatten_snapshot(data: Any, prefix: tuple = ()) -> dict[tuple, Any]:
+    """Flatten nested dicts into a {path: leaf value} index."""
+    if isinstance(data, dict) and data:
+        flat: dict[tuple, Any] = {}
+        for key, value in data.items():
+            flat.update(flatten_snapshot(value, (*prefix, key)))
+        return flat
+    return {prefix: data}
+
+
+def changed_paths(old: dict[tuple, Any], new: dict[tuple, Any]) -> set[tuple]:
+    """Return the paths whose leaf value differs between two indexes."""
+    missing = object()
+    return {
+        path
+        for path in old.keys() | new.keys()
+        if old.get(path, missing) != new.get(path, missing)
+    }
+
+
+def vehicle_context(vin: str, *paths: tuple[str, ...]) -> tuple:
+    """Return a listener context for entities reading these paths of a vehicle.
+
+    With no paths the entity is woken by any change to the vehicle.
+    """
+    return (vin, paths or ((),))
+
 
 class ZeekrCoordinator(DataUpdateCoordinator):
     """Class to manage fetching Zeekr data."""
@@ -35,23 +186,86 @@ class ZeekrCoordinator(DataUpdateCoordinator):
         hass: HomeAssistant,
         client: ZeekrClient,
         entry: ConfigEntry,
+        async_client: ZeekrAsyncClient | None = None,
+        worker_pool: ZeekrWorkerPool | None = None,
     ) -> None:
         """Initialize."""
         self.client = client
+        # Native asyncio transport; None means every call uses the executor
+        self.async_client = async_client
+        # Bounded pool for blocking calls; None means HA's shared executor
+        self.worker_pool = worker_pool
+        self.commands = ZeekrCommandQueue(self)
+        self._confirmations: dict[tuple, asyncio.Task] = {}
+        self._endpoint_fetches: dict[tuple, asyncio.Task] = {}
         self.entry = entry
         self.vehicles: list[Vehicle] = []
+        # Monotonic time of the last vehicle list fetch; None after a restore
+        self._vehicles_fetched: float | None = None
         # Shared settings for command durations
         self.seat_duration = 15
         self.ac_duration = 15
         self.steering_wheel_duration = 15
-        self.request_stats = ZeekrRequestStats(hass)
+        self.request_stats = ZeekrRequestStats(hass, entry.entry_id)
         self.latest_poll_time: Optional[str] = None  # Track latest poll time
+        # Last good document and monotonic fetch time per VIN and endpoint
+        self._sections: dict[str, dict[str, dict]] = {}
+        self._last_fetched: dict[str, dict[str, float]] = {}
+        # Wall-clock time of each section's last good fetch, and the
+        # sections currently served from cache after a failed fetch
+        self._fetched_at: dict[str, dict[str, float]] = {}
+        self._stale: dict[str, set[str]] = {}
+        # (VIN, endpoint) pairs that became or stopped being stale since
+        # listeners were last woken; their stale_since attribute changed
+        self._stale_changed: set[tuple[str, str]] = set()
+        # Calls that missed their deadline and are still running
+        self._late_fetches: dict[tuple, asyncio.Future] = {}
+        self.endpoint_timeouts: dict[str, int] = {}
+        self.consecutive_failures = 0
+        self.throttle = ZeekrThrottle()
+        self._relogging_in = False
+        # Shared by all vehicles of the account
+        self.breakers = {endpoint: ZeekrCircuitBreaker(endpoint) for endpoint in ENDPOINTS}
+        self.max_staleness = timedelta(
+            minutes=entry.data.get(CONF_MAX_STALENESS, DEFAULT_MAX_STALENESS)
+        )
         polling_interval = entry.data.get(CONF_POLLING_INTERVAL, DEFAULT_POLLING_INTERVAL)
+        self.base_interval = timedelta(minutes=polling_interval)
+        # Pluggable policy choosing each vehicle's polling mode and interval
+        self.polling_policy: ZeekrPollingPolicy = ZeekrAdaptivePollingPolicy(
+            self.base_interval
+        )
+        self.polling_modes: dict[str, str] = {}
+        # Seconds taken by recent updates, and by each vehicle's last fetch
+        self.update_durations: deque[float] = deque(maxlen=UPDATE_HISTORY)
+        self.vehicle_fetch_times: dict[str, float] = {}
+        self.vehicle_intervals: dict[str, timedelta] = {}
+        self._next_poll: dict[str, float] = {}
+        self._poll_all = False
+        # Daily request quota shared by polls and commands
+        self.budget = ZeekrRequestBudget(
+            entry.data.get(CONF_DAILY_REQUEST_BUDGET, DEFAULT_DAILY_REQUEST_BUDGET)
+        )
+        self.essential_only = False
+        self._requests_per_poll = 1
+        self._poll_requests = 0
+        # Flattened copy of the last published data, for change detection
+        self.data_index: dict[tuple, Any] = {}
+        self._live_index: dict[tuple, Any] | None = None
+        self._published_success = True
+        self.snapshot = ZeekrSnapshot(hass, entry.entry_id)
+        self.capabilities = ZeekrCapabilities(hass, entry.entry_id)
+        self.session_store = ZeekrSessionStore(
+            hass, entry.entry_id, entry.data.get(CONF_PASSWORD, "")
+        )
+        self._saved_token: str | None = None
+        # Set while a restored session has not yet served a request
+        self._session_unverified = False
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(minutes=polling_interval),
+            update_interval=self.base_interval,
         )
 
         # Schedule daily reset at midnight
@@ -66,11 +280,98 @@ class ZeekrCoordinator(DataUpdateCoordinator):
         )
 
     async def async_init_stats(self):
-        """Initialize stats (load from storage)."""
+        """Initialize stats and capabilities (load from storage)."""
         await self.request_stats.async_load()
+        await self.capabilities.async_load()
+
+    async def async_login(self) -> None:
+        """Log the client in, counting the request.
+
+        Forced, as the client skips logging in while it holds tokens, even
+        when those tokens have just been rejected.
+        """
+        self._count_request()
+        await self.async_call(self.client.login, True)
+        self._session_unverified = False
+        self.async_save_session()
+
+    async def async_restore_session(self) -> bool:
+        """Load saved auth tokens into the client instead of logging in.
 
-    async def _handle_daily_reset(self, now):
-        await self.request_stats.async_reset_today()
+        The tokens are only checked by the first poll, which logs in
+        again if they are rejected.
+        """
+        session = await self.session_store.async_load()
+        if not session:
+            return False
+        self.client.load_session(session)
+        if not self.client.logged_in:
+            return False
+        self._saved_token = self.client.bearer_token
+        self._session_unverified = True
+        _LOGGER.debug("Restored saved auth session")
+        return True
+
+    @callback
+    def async_save_session(self) -> None:
+        """Persist the client's tokens if they changed since the last save."""
+        token = getattr(self.client, "bearer_token", None)
+        if not token or token == self._saved_token:
+            return
+        self._saved_token = token
+        self.session_store.async_save(self.client.export_session())
+
+    async def async_restore_snapshot(self) -> bool:
+        """Load the last saved data and vehicle list, if any.
+
+        Returns True if entities can be set up from the restored data.
+        """
+        stored = await self.snapshot.async_load()
+        if not stored:
+            return False
+        module = sys.modules.get(type(self.client).__module__)
+        vehicle_cls = getattr(module, "Vehicle", None)
+        if vehicle_cls is None:
+            return False
+
+        self.vehicles = [
+            vehicle_cls(self.client, vehicle["vin"], vehicle.get("data") or {})
+            for vehicle in stored.get("vehicles", [])
+            if vehicle.get("vin")
+        ]
+        self.data = stored["data"]
+        self.data_index = flatten_snapshot(self.data)
+        self.latest_poll_time = stored.get("saved_at")
+        try:
+            saved_at = datetime.fromisoformat(self.latest_poll_time).timestamp()
+        except (TypeError, ValueError):
+            saved_at = None
+        if saved_at is not None:
+            # The restored status counts as the last good copy
+            for vin in self.data:
+                self._fetched_at.setdefault(vin, {})[ENDPOINT_STATUS] = saved_at
+        _LOGGER.debug(
+            "Restored snapshot of %d vehicle(s) from %s",
+            len(self.data),
+            self.latest_poll_time,
+        )
+        return True
+
+    @callback
+    def async_save_snapshot(self) -> None:
+        """Persist the current data after a successful update."""
+        if self.last_update_success and self.data:
+            self.snapshot.async_schedule_save(self.data, self.vehicles)
+
+    @callback
+    def _handle_daily_reset(self, now):
+        self.request_stats.reset_today()
+
+    def _count_request(self) -> None:
+        """Count a request, and whether a scheduled update made it."""
+        self.request_stats.inc_request()
+        if _IN_POLL.get():
+            self._poll_requests += 1
 
     def get_vehicle_by_vin(self, vin: str) -> Vehicle | None:
         """Get a vehicle by VIN."""
@@ -79,130 +380,721 @@ class ZeekrCoordinator(DataUpdateCoordinator):
                 return vehicle
         return None
 
-    async def _async_update_vehicle(self, vehicle: Vehicle) -> tuple[str, dict] | None:
-        """Fetch data for a single vehicle."""
+    async def async_call(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Call a ZeekrClient or Vehicle method without blocking the event loop.
+
+        Vehicle methods the async transport implements are awaited directly;
+        everything else runs through the sync client on the worker pool.
+        Calls are paced by the account's throttle, which tightens when the
+        backend throttles us; commands take its priority lane so they are
+        not stuck behind a poll. An expired session is flagged for a new
+        login. Latency and outcome are recorded per method and per VIN.
+        """
+        if not _THROTTLE_SLOT.get():
+            name = getattr(func, "__name__", "")
+            await self.throttle.async_acquire(
+                priority=name == "do_remote_control" or name.startswith("set_")
+            )
+        vin = getattr(getattr(func, "__self__", None), "vin", None)
+        started = time.monotonic()
+        failed = True
         try:
-            await self.request_stats.async_inc_request()
-            vehicle_data = await self.hass.async_add_executor_job(
-                vehicle.get_status
+            if native := self._native_method(func):
+                result = await native(*args)
+            elif self.worker_pool is not None:
+                result = await self.worker_pool.async_run(func, *args)
+            else:
+                result = await self.hass.async_add_executor_job(func, *args)
+            failed = False
+            return result
+        except Exception as err:
+            category = classify_error(err)
+            if category == ERROR_THROTTLED:
+                self.throttle.record_throttled()
+            elif category == ERROR_AUTH_EXPIRED:
+                self._session_unverified = True
+            raise
+        finally:
+            self.request_stats.record_call(
+                getattr(func, "__name__", "call"),
+                vin if isinstance(vin, str) else None,
+                time.monotonic() - started,
+                failed,
             )
-        except Exception as charge_err:
-            _LOGGER.error("Error fetching status for %s: %s", vehicle.vin, charge_err)
+
+    def _native_method(self, func: Callable[..., Any]) -> Callable[..., Any] | None:
+        """Return the async transport's version of a bound Vehicle method."""
+        if self.async_client is None:
+            return None
+        owner = getattr(func, "__self__", None)
+        vin = getattr(owner, "vin", None)
+        if not isinstance(vin, str):
             return None
+        return getattr(self.async_client.vehicle(vin), func.__name__, None)
 
-        # Define parallel tasks
-        async def fetch_remote_control_state():
-            try:
-                await self.request_stats.async_inc_request()
-                return await self.hass.async_add_executor_job(
-                    vehicle.get_remote_control_state
-                )
-            except Exception as e:
-                _LOGGER.debug("Error fetching remote control status for %s: %s", vehicle.vin, e)
-                return None
-
-        async def fetch_charging_status():
-            try:
-                await self.request_stats.async_inc_request()
-                return await self.hass.async_add_executor_job(
-                    vehicle.get_charging_status
-                )
-            except Exception as e:
-                _LOGGER.debug("Error fetching charging status for %s: %s", vehicle.vin, e)
-                return None
-
-        async def fetch_charging_limit():
-            try:
-                await self.request_stats.async_inc_request()
-                return await self.hass.async_add_executor_job(
-                    vehicle.get_charging_limit
-                )
-            except Exception as e:
-                _LOGGER.debug("Error fetching charging limit for %s: %s", vehicle.vin, e)
-                return None
-
-        async def fetch_charge_plan():
-            try:
-                await self.request_stats.async_inc_request()
-                return await self.hass.async_add_executor_job(
-                    vehicle.get_charge_plan
-                )
-            except Exception as e:
-                _LOGGER.debug("Error fetching charge plan for %s: %s", vehicle.vin, e)
-                return None
-
-        async def fetch_travel_plan():
-            try:
-                await self.request_stats.async_inc_request()
-                return await self.hass.async_add_executor_job(
-                    vehicle.get_travel_plan
-                )
-            except Exception as e:
-                _LOGGER.debug("Error fetching travel plan for %s: %s", vehicle.vin, e)
-                return None
-
-        # Execute parallel tasks
-        results = await asyncio.gather(
-            fetch_remote_control_state(),
-            fetch_charging_status(),
-            fetch_charging_limit(),
-            fetch_charge_plan(),
-            fetch_travel_plan(),
-            return_exceptions=True
-        )
+    def _endpoint_due(self, vin: str, endpoint: str, now: float) -> bool:
+        """Return True if an endpoint should be fetched on this poll."""
+        last_fetched = self._last_fetched.get(vin, {}).get(endpoint)
+        if last_fetched is None:
+            return True
+        return now - last_fetched >= ENDPOINT_INTERVALS.get(endpoint, 0)
+
+    def invalidate_endpoint(self, vin: str, endpoint: str) -> None:
+        """Force an endpoint to be fetched on the next poll (e.g. after a write)."""
+        self._last_fetched.get(vin, {}).pop(endpoint, None)
+
+    async def _async_fetch_endpoint(self, vehicle: Vehicle, endpoint: str) -> dict | None:
+        """Fetch a single auxiliary endpoint and cache the result."""
+        os_version = vehicle_os_version(vehicle)
+        try:
+            result = await self._async_call_endpoint(vehicle, endpoint)
+        except (asyncio.TimeoutError, CircuitOpenError) as e:
+            # Slow or paused is not unsupported; leave the capability cache alone
+            _LOGGER.debug("Skipped %s for %s: %s", endpoint, vehicle.vin, e)
+            result = None
+        except Exception as e:
+            _LOGGER.debug("Error fetching %s for %s: %s", endpoint, vehicle.vin, e)
+            result = None
+            if classify_error(e) == ERROR_PERMANENT:
+                self.capabilities.record(vehicle.vin, endpoint, False, os_version)
+        else:
+            # An empty answer still means the endpoint works (e.g. no plan set)
+            self.capabilities.record(vehicle.vin, endpoint, result is not None, os_version)
+
+        sections = self._sections.setdefault(vehicle.vin, {})
+        if isinstance(result, dict):
+            # Empty sections (no plan or limit set) keep their interval too
+            sections[endpoint] = result
+            self._last_fetched.setdefault(vehicle.vin, {})[endpoint] = time.monotonic()
+            self._mark_fetched(vehicle.vin, endpoint)
+            return result
+
+        # Serve the last good copy through a transient failure; once it is
+        # too old the section is dropped. The endpoint stays due either way.
+        if endpoint in sections and self._serve_stale(vehicle.vin, endpoint):
+            return sections[endpoint]
+        sections.pop(endpoint, None)
+        return None
+
+    async def _async_call_endpoint(self, vehicle: Vehicle, endpoint: str) -> Any:
+        """Call an endpoint within its deadline, counting the request.
+
+        A call that misses the deadline raises TimeoutError but keeps
+        running; its result is merged into the snapshot when it arrives.
+        """
+        key = (vehicle.vin, endpoint)
+        if key in self._late_fetches:
+            raise asyncio.TimeoutError(f"previous {endpoint} call still running")
+        breaker = self.breakers[endpoint]
+        if not breaker.allow():
+            raise CircuitOpenError(
+                f"{endpoint} circuit open, retrying in {breaker.retry_in():.0f}s"
+            )
+
+        if endpoint == ENDPOINT_STATUS:
+            method = vehicle.get_status
+        else:
+            method = getattr(vehicle, ENDPOINT_METHODS[endpoint])
+        self._count_request()
+        # Wait for the throttle before the deadline starts
+        await self.throttle.async_acquire()
+        slot = _THROTTLE_SLOT.set(True)
+        try:
+            call = asyncio.ensure_future(self.async_call(method))
+        finally:
+            _THROTTLE_SLOT.reset(slot)
+        timeout = ENDPOINT_TIMEOUTS.get(endpoint, ENDPOINT_TIMEOUTS[ENDPOINT_STATUS])
+        try:
+            result = await asyncio.wait_for(asyncio.shield(call), timeout)
+        except asyncio.TimeoutError:
+            breaker.record_failure()
+            self.endpoint_timeouts[endpoint] = self.endpoint_timeouts.get(endpoint, 0) + 1
+            _LOGGER.warning(
+                "Fetching %s for %s timed out after %ss", endpoint, vehicle.vin, timeout
+            )
+            self._late_fetches[key] = call
+            call.add_done_callback(lambda task: self._async_merge_late_result(key, task))
+            raise
+        except Exception as err:
+            if classify_error(err) in (ERROR_THROTTLED, ERROR_TRANSIENT):
+                breaker.record_failure()
+            else:
+                # The endpoint answered: unsupported calls and expired
+                # sessions are handled elsewhere and must not open it
+                breaker.record_ignored()
+            raise
+        breaker.record_success()
+        return result
+
+    @callback
+    def _async_merge_late_result(self, key: tuple, task: asyncio.Future) -> None:
+        """Merge the result of a call that finished after its deadline."""
+        self._late_fetches.pop(key, None)
+        if task.cancelled() or task.exception() is not None:
+            return
+        vin, endpoint = key
+        self.breakers[endpoint].record_success()
+        result = task.result()
+        if not isinstance(result, dict) or (endpoint == ENDPOINT_STATUS and not result):
+            return
+
+        _LOGGER.debug("Merging late %s result for %s", endpoint, vin)
+        self._mark_fetched(vin, endpoint)
+        sections = self._sections.setdefault(vin, {})
+        if endpoint != ENDPOINT_STATUS:
+            sections[endpoint] = result
+            self._last_fetched.setdefault(vin, {})[endpoint] = time.monotonic()
+        if self.consecutive_failures:
+            # Publishing would flag entities available in the middle of an
+            # outage; cached sections are merged by the next good update
+            return
+
+        if endpoint == ENDPOINT_STATUS:
+            if self.data is None:
+                return
+            vehicle_data = merge_sections(result, sections)
+        else:
+            if not self.data or vin not in self.data:
+                return
+            vehicle_data = merge_sections(
+                copy.deepcopy(self.data[vin]), {endpoint: result}
+            )
+        self.async_publish({**self.data, vin: vehicle_data})
+
+    def _mark_fetched(self, vin: str, endpoint: str) -> None:
+        """Record a good fetch of an endpoint."""
+        self._fetched_at.setdefault(vin, {})[endpoint] = time.time()
+        self._set_stale(vin, endpoint, False)
 
-        remote_state, charging_status, charging_limit, charge_plan, travel_plan = results
+    def _serve_stale(self, vin: str, endpoint: str) -> bool:
+        """Return True if the cached copy of a failed endpoint may still be used."""
+        fetched_at = self._fetched_at.get(vin, {}).get(endpoint)
+        if (
+            fetched_at is None
+            or time.time() - fetched_at > self.max_staleness.total_seconds()
+        ):
+            self._set_stale(vin, endpoint, False)
+            return False
+        self._set_stale(vin, endpoint, True)
+        return True
 
-        # Process results
-        if isinstance(remote_state, dict) and remote_state:
-            vehicle_data.setdefault("additionalVehicleStatus", {})[
-                "remoteControlState"
-            ] = remote_state
+    def _set_stale(self, vin: str, endpoint: str, stale: bool) -> None:
+        """Flag or unflag a section as served from cache."""
+        endpoints = self._stale.setdefault(vin, set())
+        if (endpoint in endpoints) == stale:
+            return
+        if stale:
+            endpoints.add(endpoint)
+        else:
+            endpoints.discard(endpoint)
+        self._stale_changed.add((vin, endpoint))
+
+    def data_stale_since(self, vin: str, paths: tuple = ()) -> str | None:
+        """Return the oldest fetch time among stale sections behind these paths."""
+        endpoints = {endpoint_for_path(path) for path in paths} or {ENDPOINT_STATUS}
+        since = [
+            stale for endpoint in endpoints if (stale := self.stale_since(vin, endpoint))
+        ]
+        return min(since, default=None)
+
+    def stale_since(self, vin: str, endpoint: str) -> str | None:
+        """Return when a section served from cache was last fetched, if it is stale."""
+        if endpoint not in self._stale.get(vin, ()):
+            return None
+        return datetime.fromtimestamp(self._fetched_at[vin][endpoint]).isoformat()
+
+    async def _async_fetch_status(self, vehicle: Vehicle) -> dict | None:
+        """Fetch the status document, or None if the call failed."""
+        try:
+            status = await self._async_call_endpoint(vehicle, ENDPOINT_STATUS)
+        except CircuitOpenError as err:
+            _LOGGER.debug("Skipped status for %s: %s", vehicle.vin, err)
+            return None
+        except Exception as err:
+            _LOGGER.error("Error fetching status for %s: %s", vehicle.vin, err)
+            return None
+        if status is None:
+            return None
+        self._mark_fetched(vehicle.vin, ENDPOINT_STATUS)
+        return status
 
-        if isinstance(charging_status, dict) and charging_status:
-            vehicle_data.setdefault("chargingStatus", {}).update(charging_status)
+    def fetch_plan(self) -> dict[str, set[str]] | None:
+        """Return the endpoints each vehicle's enabled entities read.
 
-        if isinstance(charging_limit, dict) and charging_limit:
-            vehicle_data["chargingLimit"] = charging_limit
+        Built from the contexts of the registered listeners, so it follows
+        entities being enabled, disabled or removed. None while no vehicle
+        entity is listening (e.g. the first refresh), meaning fetch all.
+        Entities listening to the whole vehicle read every section, and
+        charging status is always fetched: its sensors are only created
+        for vehicles that report it.
+        """
+        plan: dict[str, set[str]] = {}
+        for _, context in self._listeners.values():
+            if not context:
+                continue
+            vin, paths = context
+            endpoints = plan.setdefault(vin, {ENDPOINT_CHARGING_STATUS})
+            for path in paths:
+                if path:
+                    endpoints.add(endpoint_for_path(path))
+                else:
+                    endpoints.update(ENDPOINTS)
+        return plan or None
 
-        if isinstance(charge_plan, dict) and charge_plan:
-            vehicle_data["chargePlan"] = charge_plan
+    async def _async_update_vehicle(
+        self,
+        vehicle: Vehicle,
+        essential_only: bool = False,
+        endpoints: set[str] | None = None,
+    ) -> tuple[str, dict] | None:
+        """Fetch data for a single vehicle.
 
-        if isinstance(travel_plan, dict) and travel_plan:
-            vehicle_data["travelPlan"] = travel_plan
+        The status document and the due auxiliary endpoints are fetched
+        together; auxiliary results land in the section cache whichever
+        finishes first, and are merged once status is in. Status is always
+        fetched; auxiliary endpoints only if listed in endpoints (default all).
+        """
+        # Endpoints that are not due reuse their last good copy
+        now = time.monotonic()
+        due = [
+            endpoint
+            for endpoint in ENDPOINT_METHODS
+            if self._endpoint_due(vehicle.vin, endpoint, now)
+            and (not essential_only or endpoint in ESSENTIAL_ENDPOINTS)
+            and (endpoints is None or endpoint in endpoints)
+            and self.capabilities.supported(
+                vehicle.vin, endpoint, vehicle_os_version(vehicle)
+            )
+        ]
+        started = time.monotonic()
+        vehicle_data, *_ = await asyncio.gather(
+            self._async_fetch_status(vehicle),
+            *(self._async_fetch_endpoint(vehicle, endpoint) for endpoint in due),
+        )
+        self.vehicle_fetch_times[vehicle.vin] = round(time.monotonic() - started, 3)
+        if vehicle_data is None:
+            return None
 
-        return vehicle.vin, vehicle_data
+        return vehicle.vin, merge_sections(
+            vehicle_data, self._sections.get(vehicle.vin, {})
+        )
 
     async def _async_update_data(self) -> dict[str, dict]:
         """Fetch data from API endpoint."""
+        started = time.monotonic()
+        in_poll = _IN_POLL.set(True)
+        if not self._relogging_in:
+            self._poll_requests = 0
         try:
-            # Refresh vehicle list if empty (first run)
+            # Started from a snapshot: the client logs in on the first poll
+            if not getattr(self.client, "logged_in", True):
+                await self.async_login()
+
+            # Read the vehicle list on the first run, on the first poll
+            # after a restore and then daily
             if not self.vehicles:
-                await self.request_stats.async_inc_request()
-                self.vehicles = await self.hass.async_add_executor_job(
-                    self.client.get_vehicle_list
+                await self._async_refresh_vehicle_list()
+            elif self._vehicle_list_due():
+                try:
+                    await self._async_refresh_vehicle_list()
+                except Exception as err:
+                    _LOGGER.warning("Could not refresh the vehicle list: %s", err)
+
+            # Once the daily budget is spent, keep the last snapshot and
+            # leave the remaining requests for commands.
+            requests_today = self.request_stats.api_requests_today
+            if self.data and not self.budget.can_poll(requests_today):
+                _LOGGER.debug("Daily request budget spent, skipping poll")
+                self.update_interval = self.budget.min_interval(
+                    requests_today, self._requests_per_poll
                 )
+                return self.data
+            self.essential_only = self.budget.essential_only(requests_today)
 
-            # Update all vehicles in parallel
-            tasks = [self._async_update_vehicle(vehicle) for vehicle in self.vehicles]
+            # Update the vehicles that are due in parallel; the others keep
+            # their previous snapshot until their polling interval elapses.
+            now = time.monotonic()
+            poll_all, self._poll_all = self._poll_all, False
+            previous = self.data or {}
+            data = {}
+            due = []
+            for vehicle in self.vehicles:
+                next_poll = self._next_poll.get(vehicle.vin, 0)
+                if (
+                    poll_all
+                    or vehicle.vin not in previous
+                    or now >= next_poll - POLL_DUE_TOLERANCE
+                ):
+                    due.append(vehicle)
+                else:
+                    data[vehicle.vin] = previous[vehicle.vin]
+
+            # Skip endpoints that no enabled entity displays
+            plan = self.fetch_plan()
+            tasks = [
+                self._async_update_vehicle(
+                    vehicle,
+                    self.essential_only,
+                    None if plan is None else plan.get(vehicle.vin, set()),
+                )
+                for vehicle in due
+            ]
             results = await asyncio.gather(*tasks, return_exceptions=True)
 
-            data = {}
-            for result in results:
+            updated = set()
+            for vehicle, result in zip(due, results):
                 if isinstance(result, BaseException):
                     _LOGGER.error("Error updating vehicle: %s", result)
-                    continue
+                    result = None
                 if result:
                     vin, vehicle_data = result
                     data[vin] = vehicle_data
+                    updated.add(vin)
+                    self._apply_polling_policy(vin, vehicle_data, now)
+                elif vehicle.vin in previous and self._serve_stale(
+                    vehicle.vin, ENDPOINT_STATUS
+                ):
+                    # Keep the vehicle's entities available through API blips
+                    data[vehicle.vin] = previous[vehicle.vin]
+
+            self.update_interval = min(
+                (self.vehicle_intervals[vin] for vin in data if vin in self.vehicle_intervals),
+                default=self.base_interval,
+            )
+            if self.budget.enabled:
+                self._apply_budget()
+
+            if self._session_unverified and due and not updated:
+                raise UpdateFailed("No vehicle data returned with this auth session")
+            status_breaker = self.breakers[ENDPOINT_STATUS]
+            if due and not updated and status_breaker.state == STATE_OPEN:
+                # Other sections are served from cache; only status fails the update
+                raise UpdateFailed(
+                    f"Status endpoint unavailable, retrying in {status_breaker.retry_in():.0f}s"
+                )
 
             # Update latest poll time on every automatic poll
             self.latest_poll_time = datetime.now().isoformat()
 
         except Exception as err:
-            raise UpdateFailed(f"Error communicating with API: {err}") from err
+            if self._session_unverified and not self._relogging_in:
+                # The saved or expired tokens were rejected; log in and poll again
+                self._session_unverified = False
+                _LOGGER.info("Auth session rejected, logging in: %s", err)
+                try:
+                    await self.async_login()
+                except Exception as login_err:
+                    raise self._outage(
+                        f"Error logging in to API: {login_err}"
+                    ) from login_err
+                self._relogging_in = True
+                try:
+                    return await self._async_update_data()
+                finally:
+                    self._relogging_in = False
+            raise self._outage(f"Error communicating with API: {err}") from err
         else:
+            if self.consecutive_failures:
+                _LOGGER.info("API is answering again, resuming normal polling")
+                self.consecutive_failures = 0
+            self._session_unverified = False
+            # The library logs in again by itself when a token expires
+            self.async_save_session()
+            # Entities may have written optimistic values into the live data
+            self._live_index = flatten_snapshot(self.data or {})
             return data
+        finally:
+            _IN_POLL.reset(in_poll)
+            # A retry after logging in again is timed as part of this update
+            if not self._relogging_in:
+                self.update_durations.append(round(time.monotonic() - started, 3))
+
+    def _vehicle_list_due(self) -> bool:
+        """Return True if the vehicle list should be read again."""
+        return (
+            self._vehicles_fetched is None
+            or time.monotonic() - self._vehicles_fetched >= VEHICLE_LIST_INTERVAL
+        )
+
+    async def _async_refresh_vehicle_list(self) -> None:
+        """Fetch the vehicle list and reconcile the known vehicles with it.
+
+        Removed vehicles are dropped from the data and caches; new ones
+        are polled right away and the entry is reloaded to add their
+        entities.
+        """
+        self._count_request()
+        vehicles = await self.async_call(self.client.get_vehicle_list)
+        self._vehicles_fetched = time.monotonic()
+        known = {vehicle.vin for vehicle in self.vehicles}
+        if known and not vehicles:
+            # More likely an API hiccup than an emptied account
+            _LOGGER.warning("Vehicle list came back empty, keeping the known vehicles")
+            return
+
+        self.vehicles = vehicles
+        current = {vehicle.vin for vehicle in vehicles}
+        for vin in known - current:
+            _LOGGER.info("Vehicle %s is no longer in the account", vin)
+            self._forget_vehicle(vin)
+        if known and (added := current - known):
+            _LOGGER.info(
+                "Found new vehicle(s) %s, reloading to add their entities",
+                ", ".join(sorted(added)),
+            )
+            self.hass.async_create_task(
+                self.hass.config_entries.async_reload(self.entry.entry_id)
+            )
+
+    def _forget_vehicle(self, vin: str) -> None:
+        """Drop everything kept for a vehicle that left the account."""
+        if self.data and vin in self.data:
+            self.data = {key: value for key, value in self.data.items() if key != vin}
+        for cache in (
+            self._sections,
+            self._last_fetched,
+            self._fetched_at,
+            self._stale,
+            self._next_poll,
+            self.vehicle_intervals,
+            self.polling_modes,
+            self.vehicle_fetch_times,
+        ):
+            cache.pop(vin, None)
+
+    def _outage(self, message: str) -> UpdateFailed:
+        """Back off the next attempt after a failed update."""
+        self.consecutive_failures += 1
+        delay = self.base_interval * 2 ** min(self.consecutive_failures - 1, 10)
+        delay = min(delay, max(BACKOFF_MAX_INTERVAL, self.base_interval))
+        self.update_interval = delay * random.uniform(1 - BACKOFF_JITTER, 1 + BACKOFF_JITTER)
+        _LOGGER.debug(
+            "Update failed %s times in a row, retrying in %s",
+            self.consecutive_failures,
+            self.update_interval,
+        )
+        return UpdateFailed(message)
+
+    def _apply_polling_policy(self, vin: str, vehicle_data: dict, now: float) -> None:
+        """Ask the polling policy when this vehicle should next be polled."""
+        try:
+            self.polling_policy.request_rates = self.request_stats.rates()
+            mode, interval = self.polling_policy.select(vehicle_data)
+        except Exception as err:
+            _LOGGER.error("Polling policy failed for %s: %s", vin, err)
+            mode, interval = None, self.base_interval
+
+        if mode != self.polling_modes.get(vin):
+            _LOGGER.debug("Polling %s in %s mode every %s", vin, mode, interval)
+        self.polling_modes[vin] = mode
+        self.vehicle_intervals[vin] = interval
+        self._next_poll[vin] = now + interval.total_seconds()
+
+    def _apply_budget(self) -> None:
+        """Stretch the poll interval so the budget lasts until midnight."""
+        requests_today = self.request_stats.api_requests_today
+        if self._poll_requests:
+            self._requests_per_poll = self._poll_requests
+        floor = self.budget.min_interval(requests_today, self._requests_per_poll)
+        if floor and floor > self.update_interval:
+            _LOGGER.debug("Request budget limits polling to every %s", floor)
+            self.update_interval = floor
+
+    @callback
+    def async_set_updated_data(self, data: dict[str, dict]) -> None:
+        """Publish new data, diffing against any optimistic live values."""
+        self._live_index = flatten_snapshot(self.data or {})
+        super().async_set_updated_data(data)
+
+    @callback
+    def async_publish(self, data: dict[str, dict]) -> None:
+        """Publish data fetched outside a scheduled update.
+
+        Unlike async_set_updated_data this leaves the refresh timer and
+        last_update_success alone, so a targeted fetch does not push back
+        the polls of the other vehicles.
+        """
+        self._live_index = flatten_snapshot(self.data or {})
+        self.data = data
+        self.async_update_listeners()
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Wake only the entities whose data paths changed.
+
+        Listener contexts are ``(vin, paths)`` tuples from vehicle_context();
+        listeners without a context are always updated.
+        """
+        new_index = flatten_snapshot(self.data or {})
+        changed = changed_paths(self.data_index, new_index)
+        if self._live_index is not None:
+            changed |= changed_paths(self._live_index, new_index)
+        self.data_index = new_index
+        self._live_index = None
+        # A section going stale or fresh changes no value, only attributes
+        stale_changed, self._stale_changed = self._stale_changed, set()
+
+        if self.last_update_success != self._published_success:
+            # Availability changed, every entity must write its state
+            self._published_success = self.last_update_success
+            super().async_update_listeners()
+            return
+
+        prefixes = {path[:i] for path in changed for i in range(len(path) + 1)}
+        for update_callback, context in list(self._listeners.values()):
+            if (
+                context is None
+                or self._context_changed(context, changed, prefixes)
+                or self._context_stale_changed(context, stale_changed)
+            ):
+                update_callback()
+
+    @staticmethod
+    def _context_changed(context: tuple, changed: set[tuple], prefixes: set[tuple]) -> bool:
+        """Return True if a change touches any path in a listener context."""
+        vin, paths = context
+        for path in paths:
+            subscribed = (vin, *path)
+            # A change at or below the path, or to one of its ancestors
+            if subscribed in prefixes:
+                return True
+            if any(subscribed[:i] in changed for i in range(1, len(subscribed))):
+                return True
+        return False
+
+    @staticmethod
+    def _context_stale_changed(context: tuple, stale_changed: set[tuple]) -> bool:
+        """Return True if a section behind a listener context changed staleness."""
+        if not stale_changed:
+            return False
+        vin, paths = context
+        return any((vin, endpoint_for_path(path)) in stale_changed for path in paths)
+
+    async def async_request_refresh(self) -> None:
+        """Request a refresh of every vehicle, regardless of its polling mode."""
+        if self.consecutive_failures:
+            # During an outage the scheduled retry is the one pending attempt
+            _LOGGER.debug("API unavailable, leaving refresh to the scheduled retry")
+            return
+        self._poll_all = True
+        await super().async_request_refresh()
+
+    async def async_send_command(
+        self, vehicle: Vehicle, command: str, service_id: str, setting: dict
+    ) -> Any:
+        """Send a remote command through the vehicle's command queue."""
+        return await self.commands.async_send(vehicle, command, service_id, setting)
+
+    async def async_refresh_vehicle(
+        self,
+        vin: str,
+        endpoints: list[str] | tuple[str, ...] | None = None,
+        publish: bool = True,
+    ) -> dict | None:
+        """Fetch some endpoints of one vehicle and publish the merged result.
+
+        Only the requested sections are fetched (all of them by default);
+        the rest of the snapshot is kept, and only entities whose values
+        changed are notified. With publish False the result is only
+        returned. Concurrent callers asking for the same endpoints share
+        one in-flight fetch. Returns the vehicle's updated data, or None if
+        nothing could be fetched or the API is unavailable.
+        """
+        if self.consecutive_failures:
+            return None
+        key = (vin, tuple(endpoints or ENDPOINTS), publish)
+        if (fetch := self._endpoint_fetches.get(key)) is None:
+            fetch = asyncio.get_running_loop().create_task(
+                self._async_refresh_vehicle(vin, key[1], publish)
+            )
+            self._endpoint_fetches[key] = fetch
+            fetch.add_done_callback(lambda _: self._endpoint_fetches.pop(key, None))
+        return await asyncio.shield(fetch)
+
+    async def _async_refresh_vehicle(
+        self, vin: str, endpoints: tuple[str, ...], publish: bool
+    ) -> dict | None:
+        vehicle = self.get_vehicle_by_vin(vin)
+        if vehicle is None or not self.data or vin not in self.data:
+            return None
+
+        aux = [endpoint for endpoint in endpoints if endpoint in ENDPOINT_METHODS]
+        fetches = [self._async_fetch_endpoint(vehicle, endpoint) for endpoint in aux]
+        if ENDPOINT_STATUS in endpoints:
+            fetches.append(self._async_fetch_status(vehicle))
+        results = await asyncio.gather(*fetches)
+        status = results.pop() if ENDPOINT_STATUS in endpoints else None
+        sections = {
+            endpoint: result for endpoint, result in zip(aux, results) if result
+        }
+        if status is None and not sections:
+            return None
+
+        if status is not None:
+            vehicle_data = merge_sections(status, self._sections.get(vin, {}))
+        else:
+            vehicle_data = merge_sections(copy.deepcopy(self.data[vin]), sections)
+
+        if publish:
+            self.async_publish({**self.data, vin: vehicle_data})
+        return vehicle_data
+
+    @callback
+    def async_confirm(
+        self,
+        vin: str,
+        endpoint: str,
+        expected: dict[tuple[str, ...], tuple[str, ...]],
+    ) -> None:
+        """Confirm a command in the background.
+
+        Polls only the endpoint that reflects the command until the
+        vehicle data holds the expected values, replacing the optimistic
+        state with what the vehicle reports. The data is published once,
+        when it matches or at the deadline, so entities do not flip back
+        while the vehicle catches up.
+        """
+        key = (vin, endpoint, tuple(expected))
+        if previous := self._confirmations.pop(key, None):
+            previous.cancel()
+        self._confirmations[key] = self.entry.async_create_background_task(
+            self.hass,
+            self._async_confirm(key, vin, endpoint, expected),
+            f"{DOMAIN}_confirm_{vin}_{endpoint}",
+        )
+
+    async def _async_confirm(
+        self,
+        key: tuple,
+        vin: str,
+        endpoint: str,
+        expected: dict[tuple[str, ...], tuple[str, ...]],
+    ) -> None:
+        fetched: dict | None = None
+
+        async def refresh() -> dict | None:
+            nonlocal fetched
+            data = await self.async_refresh_vehicle(vin, [endpoint], publish=False)
+            if data is not None:
+                fetched = data
+            return data
+
+        try:
+            confirmed = await async_confirm_state(refresh, expected)
+        finally:
+            if self._confirmations.get(key) is asyncio.current_task():
+                del self._confirmations[key]
+
+        if fetched is not None and self.data and vin in self.data:
+            self.async_publish({**self.data, vin: fetched})
+        if confirmed:
+            _LOGGER.debug("Confirmed %s change for %s", endpoint, vin)
+        elif confirmed is False:
+            _LOGGER.debug("%s for %s did not reach the expected state", endpoint, vin)
+        else:
+            # The endpoint could not be fetched; try the whole vehicle once
+            await self.async_refresh_vehicle(vin)
 
-    async def async_inc_invoke(self):
-        await self.request_stats.async_inc_invoke()
+    @callback
+    def inc_invoke(self):
+        self.request_stats.inc_invoke()
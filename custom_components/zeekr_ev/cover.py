@@ -14,8 +14,8 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
-from .coordinator import ZeekrCoordinator
+from .const import DOMAIN, ENDPOINT_STATUS
+from .coordinator import ZeekrCoordinator, vehicle_context
 
 
 async def async_setup_entry(
@@ -47,7 +47,14 @@ class ZeekrSunshade(CoordinatorEntity, CoverEntity):
 
     def __init__(self, coordinator: ZeekrCoordinator, vin: str) -> None:
         """Initialize the cover entity."""
-        super().__init__(coordinator)
+        super().__init__(
+            coordinator,
+            context=vehicle_context(
+                vin,
+                ("additionalVehicleStatus", "climateStatus", "curtainOpenStatus"),
+                ("additionalVehicleStatus", "climateStatus", "curtainPos"),
+            ),
+        )
         self.vin = vin
         self._attr_name = "Sunshade"
         self._attr_unique_id = f"{vin}_sunshade"
@@ -104,13 +111,12 @@ class ZeekrSunshade(CoordinatorEntity, CoverEntity):
             ]
         }
 
-        await self.coordinator.async_inc_invoke()
-        await self.hass.async_add_executor_job(
-            vehicle.do_remote_control, command, service_id, setting
+        await self.coordinator.async_send_command(
+            vehicle, command, service_id, setting
         )
         self._update_local_state_optimistically(is_open=True)
         self.async_write_ha_state()
-        await self.coordinator.async_request_refresh()
+        self._confirm_state(is_open=True)
 
     async def async_close_cover(self, **kwargs: Any) -> None:
         """Close cover."""
@@ -129,13 +135,19 @@ class ZeekrSunshade(CoordinatorEntity, CoverEntity):
             ]
         }
 
-        await self.coordinator.async_inc_invoke()
-        await self.hass.async_add_executor_job(
-            vehicle.do_remote_control, command, service_id, setting
+        await self.coordinator.async_send_command(
+            vehicle, command, service_id, setting
         )
         self._update_local_state_optimistically(is_open=False)
         self.async_write_ha_state()
-        await self.coordinator.async_request_refresh()
+        self._confirm_state(is_open=False)
+
+    def _confirm_state(self, is_open: bool) -> None:
+        """Poll the vehicle status until the sunshade reports the new state."""
+        path = ("additionalVehicleStatus", "climateStatus", "curtainOpenStatus")
+        self.coordinator.async_confirm(
+            self.vin, ENDPOINT_STATUS, {path: ("2",) if is_open else ("1",)}
+        )
 
     def _update_local_state_optimistically(self, is_open: bool) -> None:
         """Update the coordinator data to reflect the change immediately."""
@@ -174,7 +186,17 @@ class ZeekrWindows(CoordinatorEntity, CoverEntity):
 
     def __init__(self, coordinator: ZeekrCoordinator, vin: str) -> None:
         """Initialize the cover entity."""
-        super().__init__(coordinator)
+        super().__init__(
+            coordinator,
+            context=vehicle_context(
+                vin,
+                *(
+                    ("additionalVehicleStatus", "climateStatus", f"{key}{win}")
+                    for win in ["Driver", "Passenger", "DriverRear", "PassengerRear"]
+                    for key in ("winStatus", "winPos")
+                ),
+            ),
+        )
         self.vin = vin
         self._attr_name = "All Windows"
         self._attr_unique_id = f"{vin}_all_windows"
@@ -239,13 +261,12 @@ class ZeekrWindows(CoordinatorEntity, CoverEntity):
             ]
         }
 
-        await self.coordinator.async_inc_invoke()
-        await self.hass.async_add_executor_job(
-            vehicle.do_remote_control, command, service_id, setting
+        await self.coordinator.async_send_command(
+            vehicle, command, service_id, setting
         )
         self._update_local_state_optimistically(is_open=True)
         self.async_write_ha_state()
-        await self.coordinator.async_request_refresh()
+        self._confirm_state(is_open=True)
 
     async def async_close_cover(self, **kwargs: Any) -> None:
         """Close all windows."""
@@ -264,13 +285,24 @@ class ZeekrWindows(CoordinatorEntity, CoverEntity):
             ]
         }
 
-        await self.coordinator.async_inc_invoke()
-        await self.hass.async_add_executor_job(
-            vehicle.do_remote_control, command, service_id, setting
+        await self.coordinator.async_send_command(
+            vehicle, command, service_id, setting
         )
         self._update_local_state_optimistically(is_open=False)
         self.async_write_ha_state()
-        await self.coordinator.async_request_refresh()
+        self._confirm_state(is_open=False)
+
+    def _confirm_state(self, is_open: bool) -> None:
+        """Poll the vehicle status until every window reports the new state."""
+        expected = ("1",) if is_open else ("2",)
+        self.coordinator.async_confirm(
+            self.vin,
+            ENDPOINT_STATUS,
+            {
+                ("additionalVehicleStatus", "climateStatus", f"winStatus{win}"): expected
+                for win in ["Driver", "Passenger", "DriverRear", "PassengerRear"]
+            },
+        )
 
     def _update_local_state_optimistically(self, is_open: bool) -> None:
         """Update the coordinator data to reflect the change immediately."""
@@ -310,7 +342,14 @@ class ZeekrWindow(CoordinatorEntity, CoverEntity):
 
     def __init__(self, coordinator: ZeekrCoordinator, vin: str, win_key: str, win_name: str) -> None:
         """Initialize the cover entity."""
-        super().__init__(coordinator)
+        super().__init__(
+            coordinator,
+            context=vehicle_context(
+                vin,
+                ("additionalVehicleStatus", "climateStatus", f"winStatus{win_key}"),
+                ("additionalVehicleStatus", "climateStatus", f"winPos{win_key}"),
+            ),
+        )
         self.vin = vin
         self.win_key = win_key
         self._attr_name = win_name
@@ -11,7 +11,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.restore_state import RestoreEntity
 
-from .const import DOMAIN
+from .const import DOMAIN, ENDPOINT_TRAVEL_PLAN
 from .coordinator import ZeekrCoordinator
 from .entity import ZeekrEntity
 
@@ -46,7 +46,7 @@ class ZeekrDepartureTime(ZeekrEntity, DateTimeEntity, RestoreEntity):
 
     def __init__(self, coordinator: ZeekrCoordinator, vin: str) -> None:
         """Initialize the datetime entity."""
-        super().__init__(coordinator, vin)
+        super().__init__(coordinator, vin, paths=(("travelPlan", "scheduledTime"),))
         self._attr_unique_id = f"{vin}_departure_time"
         self._fallback_value: datetime | None = None
 
@@ -90,8 +90,8 @@ class ZeekrDepartureTime(ZeekrEntity, DateTimeEntity, RestoreEntity):
         steering_wheel_heating = bw not in ("0", "", None)
         current_command = current_plan.get("command", "start")
 
-        await self.coordinator.async_inc_invoke()
-        await self.hass.async_add_executor_job(
+        self.coordinator.inc_invoke()
+        await self.coordinator.async_call(
             vehicle.set_travel_plan,
             current_command,
             "",  # start_time not used for departure
@@ -99,6 +99,7 @@ class ZeekrDepartureTime(ZeekrEntity, DateTimeEntity, RestoreEntity):
             ac_preconditioning,
             steering_wheel_heating,
         )
+        self.coordinator.invalidate_endpoint(self.vin, ENDPOINT_TRAVEL_PLAN)
 
         # Optimistic update
         self._fallback_value = value
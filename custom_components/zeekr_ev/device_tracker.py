@@ -10,7 +10,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
-from .coordinator import ZeekrCoordinator
+from .coordinator import ZeekrCoordinator, vehicle_context
 
 
 async def async_setup_entry(
@@ -35,7 +35,10 @@ class ZeekrDeviceTracker(CoordinatorEntity, TrackerEntity):
 
     def __init__(self, coordinator: ZeekrCoordinator, vin: str) -> None:
         """Initialize the tracker."""
-        super().__init__(coordinator)
+        super().__init__(
+            coordinator,
+            context=vehicle_context(vin, ("basicVehicleStatus", "position")),
+        )
         self.vin = vin
         self._attr_name = "Location"
         self._attr_unique_id = f"{vin}_location"
@@ -0,0 +1,136 @@
+"""Diagnostics support for Zeekr EV API Integration."""
+
+from __future__ import annotations
+
+import json
+import time
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import (
+    CONF_HMAC_ACCESS_KEY,
+    CONF_HMAC_SECRET_KEY,
+    CONF_PASSWORD,
+    CONF_PASSWORD_PUBLIC_KEY,
+    CONF_PROD_SECRET,
+    CONF_USERNAME,
+    CONF_VIN_IV,
+    CONF_VIN_KEY,
+    DOMAIN,
+)
+from .coordinator import ZeekrCoordinator
+
+TO_REDACT = {
+    CONF_USERNAME,
+    CONF_PASSWORD,
+    CONF_HMAC_ACCESS_KEY,
+    CONF_HMAC_SECRET_KEY,
+    CONF_PASSWORD_PUBLIC_KEY,
+    CONF_PROD_SECRET,
+    CONF_VIN_KEY,
+    CONF_VIN_IV,
+    "auth_token",
+    "bearer_token",
+    "access_token",
+    "vin",
+    "plateNo",
+    "latitude",
+    "longitude",
+}
+
+
+def _anonymize(value: Any, aliases: dict[str, str]) -> Any:
+    """Replace VINs, which are used as dict keys throughout, by aliases."""
+    if isinstance(value, dict):
+        return {
+            aliases.get(key, key) if isinstance(key, str) else key: _anonymize(item, aliases)
+            for key, item in value.items()
+        }
+    if isinstance(value, (list, tuple)):
+        return [_anonymize(item, aliases) for item in value]
+    return value
+
+
+def _performance(coordinator: ZeekrCoordinator) -> dict[str, Any]:
+    """Return timings, counters and cache state of the coordinator."""
+    now = time.monotonic()
+    pool = coordinator.worker_pool
+    stats = coordinator.request_stats
+    return {
+        "update_durations": list(coordinator.update_durations),
+        "vehicle_fetch_times": coordinator.vehicle_fetch_times,
+        "update_interval": str(coordinator.update_interval),
+        "vehicle_intervals": {
+            vin: str(interval) for vin, interval in coordinator.vehicle_intervals.items()
+        },
+        "polling_modes": coordinator.polling_modes,
+        "consecutive_failures": coordinator.consecutive_failures,
+        "data_size_bytes": len(json.dumps(coordinator.data or {}, default=str)),
+        "section_ages": {
+            vin: {endpoint: round(now - fetched) for endpoint, fetched in sections.items()}
+            for vin, sections in coordinator._last_fetched.items()
+        },
+        "stale_sections": {
+            vin: sorted(endpoints) for vin, endpoints in coordinator._stale.items() if endpoints
+        },
+        "endpoint_timeouts": coordinator.endpoint_timeouts,
+        "circuit_breakers": {
+            endpoint: {"state": breaker.state, "failures": breaker.failures}
+            for endpoint, breaker in coordinator.breakers.items()
+        },
+        "throttle": {
+            "rate": coordinator.throttle.rate,
+            "throttled": coordinator.throttle.throttled,
+        },
+        "unsupported_endpoints": {
+            vehicle.vin: coordinator.capabilities.unsupported(vehicle.vin)
+            for vehicle in coordinator.vehicles
+        },
+        "commands": {
+            "sent": coordinator.commands.sent,
+            "merged": coordinator.commands.merged,
+        },
+        "worker_pool": None
+        if pool is None
+        else {
+            "max_workers": pool.max_workers,
+            "queue_depth": pool.queue_depth,
+            "completed": pool.completed,
+            "last_wait": round(pool.last_wait, 3),
+            "average_wait": round(pool.average_wait, 3),
+            "max_wait": round(pool.max_wait, 3),
+        },
+        "request_stats": stats.as_dict(),
+        "request_rates": stats.rates(),
+        "calls": stats.calls_as_dict(),
+    }
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: ZeekrCoordinator = hass.data[DOMAIN][entry.entry_id]
+    aliases = {
+        vehicle.vin: f"vehicle_{index}"
+        for index, vehicle in enumerate(coordinator.vehicles, start=1)
+    }
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": async_redact_data(dict(entry.options), TO_REDACT),
+        },
+        "coordinator": _anonymize(
+            {
+                "last_update_success": coordinator.last_update_success,
+                "latest_poll_time": coordinator.latest_poll_time,
+                "essential_only": coordinator.essential_only,
+                "data": async_redact_data(coordinator.data or {}, TO_REDACT),
+            },
+            aliases,
+        ),
+        "performance": _anonymize(_performance(coordinator), aliases),
+    }
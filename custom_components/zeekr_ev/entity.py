@@ -17,9 +17,15 @@ class ZeekrEntity(CoordinatorEntity[ZeekrCoordinator]):
 
     _attr_has_entity_name = True
 
-    def __init__(self, coordinator: ZeekrCoordinator, vin: str) -> None:
-        """Initialize."""
-        super().__init__(coordinator)
+    def __init__(
+        self, coordinator: ZeekrCoordinator, vin: str, paths: tuple = ()
+    ) -> None:
+        """Initialize, waking on changes to paths.
+
+        Entities that read no vehicle data (buttons) pass no paths and are
+        only woken when availability changes.
+        """
+        super().__init__(coordinator, context=(vin, tuple(paths)))
 
         # Set device info
         self.vin = vin
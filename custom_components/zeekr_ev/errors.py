@@ -0,0 +1,58 @@
+"""Classification of Zeekr API errors for Zeekr EV API Integration."""
+
+from __future__ import annotations
+
+import asyncio
+import re
+
+ERROR_THROTTLED = "throttled"
+ERROR_AUTH_EXPIRED = "auth_expired"
+ERROR_TRANSIENT = "transient"
+ERROR_PERMANENT = "permanent"
+
+# The client turns HTTP errors into exceptions carrying the response body,
+# so status codes and backend messages are matched in the text.
+_THROTTLED_RE = re.compile(
+    r"\b429\b|too many requests|rate.?limit|throttl|too frequent",
+    re.IGNORECASE,
+)
+_AUTH_RE = re.compile(
+    r"\b401\b|token expired|unauthori[sz]ed|not logged in", re.IGNORECASE
+)
+_TRANSIENT_RE = re.compile(
+    r"'status_code': 5\d\d|\b50[234]\b|timed? ?out|temporarily|unavailable|"
+    r"connection|invalid json",
+    re.IGNORECASE,
+)
+
+
+def _status_code(err: BaseException) -> int | None:
+    """Return the HTTP status of a requests error, if it has one."""
+    response = getattr(err, "response", None)
+    status = getattr(response, "status_code", None)
+    return status if isinstance(status, int) else None
+
+
+def classify_error(err: BaseException) -> str:
+    """Sort an exception from a ZeekrClient or Vehicle call into a category.
+
+    throttled: the backend asked us to slow down.
+    auth_expired: the session needs a new login.
+    transient: worth retrying as is (timeouts, connection drops, 5xx).
+    permanent: anything else, e.g. an endpoint the vehicle does not support.
+    """
+    status = _status_code(err)
+    message = str(err)
+    if status == 429 or _THROTTLED_RE.search(message):
+        return ERROR_THROTTLED
+    if status == 401 or _AUTH_RE.search(message) or any(
+        cls.__name__ == "AuthException" for cls in type(err).__mro__
+    ):
+        return ERROR_AUTH_EXPIRED
+    if (
+        isinstance(err, (asyncio.TimeoutError, TimeoutError, ConnectionError, OSError))
+        or (status is not None and status >= 500)
+        or _TRANSIENT_RE.search(message)
+    ):
+        return ERROR_TRANSIENT
+    return ERROR_PERMANENT
@@ -0,0 +1,247 @@
+"""Declarative catalog of vehicle data fields for Zeekr EV API Integration."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from homeassistant.components.binary_sensor import BinarySensorDeviceClass
+from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
+from homeassistant.const import (
+    PERCENTAGE,
+    UnitOfElectricCurrent,
+    UnitOfElectricPotential,
+    UnitOfLength,
+    UnitOfPower,
+    UnitOfPressure,
+    UnitOfSpeed,
+    UnitOfTemperature,
+)
+
+from .const import DRIVE_SIDE_RHD
+
+EV_STATUS = ("additionalVehicleStatus", "electricVehicleStatus")
+MAINTENANCE_STATUS = ("additionalVehicleStatus", "maintenanceStatus")
+SAFETY_STATUS = ("additionalVehicleStatus", "drivingSafetyStatus")
+TIRES = ["Driver", "Passenger", "DriverRear", "PassengerRear"]
+
+
+@dataclass(frozen=True)
+class ZeekrField:
+    """A single value in the vehicle snapshot and how to present it."""
+
+    key: str
+    name: str
+    path: tuple[str, ...]
+    decoder: Callable[[Any], Any] | None = None
+    unit: str | None = None
+    device_class: str | None = None
+    state_class: SensorStateClass | None = SensorStateClass.MEASUREMENT
+    # Raw value used when the path is missing from the snapshot
+    default: Any = None
+
+
+def compile_accessor(field: ZeekrField, vin: str) -> Callable[[dict], Any]:
+    """Compile a field into a lookup on the coordinator's flattened data index."""
+    index_key = (vin, *field.path)
+    decoder = field.decoder
+    default = field.default
+
+    def accessor(index: dict) -> Any:
+        value = index.get(index_key, default)
+        if value is None:
+            return None
+        if decoder is None:
+            return value
+        try:
+            return decoder(value)
+        except (ValueError, TypeError):
+            return None
+
+    return accessor
+
+
+def get_tire_position_label(api_position: str, drive_side: str) -> str:
+    """
+    Map API tire position to display label based on vehicle drive side.
+
+    For RHD vehicles, only the rear tires are swapped (DriverRear <-> PassengerRear).
+    Front tires remain as-is because the driver is on the right side.
+
+    Args:
+        api_position: The position from the API (Driver, Passenger, DriverRear, PassengerRear)
+        drive_side: The vehicle drive side (lhd or rhd)
+
+    Returns:
+        The display label for the tire position
+    """
+    if drive_side == DRIVE_SIDE_RHD:
+        # For RHD vehicles, only swap rear tires
+        rhd_mapping = {
+            "DriverRear": "PassengerRear",
+            "PassengerRear": "DriverRear",
+        }
+        return rhd_mapping.get(api_position, api_position)
+    # For LHD (default), use the API position as-is
+    return api_position
+
+
+def _is_one(value: Any) -> bool:
+    return str(value) == "1"
+
+
+def _is_not_zero(value: Any) -> bool:
+    return str(value) != "0"
+
+
+SENSOR_FIELDS = [
+    ZeekrField(
+        "battery_level", "Battery Level", (*EV_STATUS, "chargeLevel"),
+        unit=PERCENTAGE, device_class=SensorDeviceClass.BATTERY,
+    ),
+    ZeekrField(
+        "range", "Range", (*EV_STATUS, "distanceToEmptyOnBatteryOnly"),
+        unit=UnitOfLength.KILOMETERS, device_class=SensorDeviceClass.DISTANCE,
+    ),
+    ZeekrField(
+        "odometer", "Odometer", (*MAINTENANCE_STATUS, "odometer"),
+        unit=UnitOfLength.KILOMETERS, device_class=SensorDeviceClass.DISTANCE,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+    ),
+    ZeekrField(
+        "interior_temp", "Interior Temperature",
+        ("additionalVehicleStatus", "climateStatus", "interiorTemp"),
+        unit=UnitOfTemperature.CELSIUS, device_class=SensorDeviceClass.TEMPERATURE,
+    ),
+    ZeekrField(
+        "trip_2_distance", "Trip 2 Distance",
+        ("additionalVehicleStatus", "runningStatus", "tripMeter2"), float,
+        unit=UnitOfLength.KILOMETERS, device_class=SensorDeviceClass.DISTANCE,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+    ),
+    ZeekrField(
+        "trip_2_avg_speed", "Trip 2 Average Speed",
+        ("additionalVehicleStatus", "runningStatus", "avgSpeed"),
+        unit=UnitOfSpeed.KILOMETERS_PER_HOUR, device_class=SensorDeviceClass.SPEED,
+    ),
+    ZeekrField(
+        "trip_2_avg_consumption", "Trip 2 Average Consumption",
+        (*EV_STATUS, "averPowerConsumption"), unit="kWh/100km",
+    ),
+    # BMS diagnostic sensors (raw API values from Zeekr Connected API)
+    ZeekrField(
+        "distance_to_empty_on_battery_20_soc", "distanceToEmptyOnBattery20Soc",
+        (*EV_STATUS, "distanceToEmptyOnBattery20Soc"),
+        unit=UnitOfLength.KILOMETERS, device_class=SensorDeviceClass.DISTANCE,
+    ),
+    ZeekrField(
+        "distance_to_empty_on_battery_100_soc", "distanceToEmptyOnBattery100Soc",
+        (*EV_STATUS, "distanceToEmptyOnBattery100Soc"),
+        unit=UnitOfLength.KILOMETERS, device_class=SensorDeviceClass.DISTANCE,
+    ),
+]
+
+# Only created for vehicles that report a chargingStatus section
+CHARGING_SENSOR_FIELDS = [
+    ZeekrField(
+        "charge_voltage", "Charge Voltage", ("chargingStatus", "chargeVoltage"),
+        unit=UnitOfElectricPotential.VOLT, device_class=SensorDeviceClass.VOLTAGE,
+    ),
+    ZeekrField(
+        "charge_current", "Charge Current", ("chargingStatus", "chargeCurrent"),
+        unit=UnitOfElectricCurrent.AMPERE, device_class=SensorDeviceClass.CURRENT,
+    ),
+    ZeekrField(
+        "charge_power", "Charge Power", ("chargingStatus", "chargePower"),
+        unit=UnitOfPower.KILO_WATT, device_class=SensorDeviceClass.POWER,
+    ),
+    ZeekrField(
+        "charge_speed", "Charge Speed", ("chargingStatus", "chargeSpeed"),
+        unit="km/h",
+    ),
+]
+
+BINARY_SENSOR_FIELDS = [
+    ZeekrField(
+        "charging_status", "Charging Status", (*EV_STATUS, "chargerState"),
+        lambda v: int(v) in [1, 2, 15],
+        device_class=BinarySensorDeviceClass.BATTERY_CHARGING, default="0",
+    ),
+    ZeekrField(
+        "plugged_in", "Plugged In", (*EV_STATUS, "statusOfChargerConnection"),
+        lambda v: bool(int(v)), device_class=BinarySensorDeviceClass.PLUG,
+    ),
+    # Door open sensors from drivingSafetyStatus
+    ZeekrField(
+        "door_open_driver", "Driver door open",
+        (*SAFETY_STATUS, "doorOpenStatusDriver"), _is_one,
+        device_class=BinarySensorDeviceClass.DOOR,
+    ),
+    ZeekrField(
+        "door_open_passenger", "Passenger door open",
+        (*SAFETY_STATUS, "doorOpenStatusPassenger"), _is_one,
+        device_class=BinarySensorDeviceClass.DOOR,
+    ),
+    ZeekrField(
+        "door_open_driver_rear", "Driver rear door open",
+        (*SAFETY_STATUS, "doorOpenStatusDriverRear"), _is_one,
+        device_class=BinarySensorDeviceClass.DOOR,
+    ),
+    ZeekrField(
+        "door_open_passenger_rear", "Passenger rear door open",
+        (*SAFETY_STATUS, "doorOpenStatusPassengerRear"), _is_one,
+        device_class=BinarySensorDeviceClass.DOOR,
+    ),
+    ZeekrField(
+        "trunk_open", "Trunk open", (*SAFETY_STATUS, "trunkOpenStatus"), _is_one,
+        device_class=BinarySensorDeviceClass.DOOR,
+    ),
+    ZeekrField(
+        "hood_open", "Hood open", (*SAFETY_STATUS, "engineHoodOpenStatus"), _is_one,
+        device_class=BinarySensorDeviceClass.DOOR,
+    ),
+]
+
+
+def tire_sensor_fields(drive_side: str) -> list[ZeekrField]:
+    """Return the tire pressure and temperature fields, labelled for drive side."""
+    fields = []
+    for tire in TIRES:
+        label = get_tire_position_label(tire, drive_side)
+        fields.append(
+            ZeekrField(
+                f"tire_pressure_{tire.lower()}", f"Tire Pressure {label}",
+                (*MAINTENANCE_STATUS, f"tyreStatus{tire}"),
+                unit=UnitOfPressure.KPA, device_class=SensorDeviceClass.PRESSURE,
+            )
+        )
+        fields.append(
+            ZeekrField(
+                f"tire_temperature_{tire.lower()}", f"Tire Temperature {label}",
+                (*MAINTENANCE_STATUS, f"tyreTemp{tire}"),
+                unit=UnitOfTemperature.CELSIUS, device_class=SensorDeviceClass.TEMPERATURE,
+            )
+        )
+    return fields
+
+
+def tire_binary_sensor_fields(drive_side: str) -> list[ZeekrField]:
+    """Return the tire warning fields, labelled for drive side."""
+    fields = []
+    for tire in TIRES:
+        label = get_tire_position_label(tire, drive_side)
+        fields.append(
+            ZeekrField(
+                f"tire_pre_warning_{tire.lower()}", f"Tire Pre-Warning {label}",
+                (*MAINTENANCE_STATUS, f"tyrePreWarning{tire}"), _is_not_zero,
+                device_class=BinarySensorDeviceClass.PROBLEM,
+            )
+        )
+        fields.append(
+            ZeekrField(
+                f"tire_temp_warning_{tire.lower()}", f"Tire Temp Warning {label}",
+                (*MAINTENANCE_STATUS, f"tyreTempWarning{tire}"), _is_not_zero,
+                device_class=BinarySensorDeviceClass.PROBLEM,
+            )
+        )
+    return fields
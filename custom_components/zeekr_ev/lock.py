@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import asyncio
 from typing import Any
 
 from homeassistant.components.lock import LockEntity
@@ -11,11 +10,8 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
-from .coordinator import ZeekrCoordinator
-
-# Delay before polling after a remote command (seconds)
-COMMAND_POLL_DELAY = 15
+from .const import DOMAIN, ENDPOINT_STATUS
+from .coordinator import ZeekrCoordinator, vehicle_context
 
 
 async def async_setup_entry(
@@ -62,7 +58,10 @@ class ZeekrLock(CoordinatorEntity, LockEntity):
         category: str,
     ) -> None:
         """Initialize the lock entity for a specific field."""
-        super().__init__(coordinator)
+        super().__init__(
+            coordinator,
+            context=vehicle_context(vin, ("additionalVehicleStatus", category, field)),
+        )
         self.vin = vin
         self.field = field
         self.category = category
@@ -155,19 +154,13 @@ class ZeekrLock(CoordinatorEntity, LockEntity):
             }
 
         if command and service_id and setting:
-            await self.coordinator.async_inc_invoke()
-            await self.hass.async_add_executor_job(
-                vehicle.do_remote_control, command, service_id, setting
+            await self.coordinator.async_send_command(
+                vehicle, command, service_id, setting
             )
 
             self._update_local_state_optimistically(locked=True)
             self.async_write_ha_state()
-
-            # Schedule a delayed refresh to get updated state after car processes command
-            async def delayed_refresh():
-                await asyncio.sleep(COMMAND_POLL_DELAY)
-                await self.coordinator.async_request_refresh()
-            self.hass.async_create_task(delayed_refresh())
+            self._confirm_state()
 
     async def async_unlock(self, **kwargs: Any) -> None:
         """Unlock the car."""
@@ -219,19 +212,26 @@ class ZeekrLock(CoordinatorEntity, LockEntity):
             }
 
         if command and service_id and setting:
-            await self.coordinator.async_inc_invoke()
-            await self.hass.async_add_executor_job(
-                vehicle.do_remote_control, command, service_id, setting
+            await self.coordinator.async_send_command(
+                vehicle, command, service_id, setting
             )
 
             self._update_local_state_optimistically(locked=False)
             self.async_write_ha_state()
-
-            # Schedule a delayed refresh to get updated state after car processes command
-            async def delayed_refresh():
-                await asyncio.sleep(COMMAND_POLL_DELAY)
-                await self.coordinator.async_request_refresh()
-            self.hass.async_create_task(delayed_refresh())
+            self._confirm_state()
+
+    def _confirm_state(self) -> None:
+        """Poll the vehicle status until it reports the optimistic value."""
+        path = ("additionalVehicleStatus", self.category, self.field)
+        value = (
+            self.coordinator.data.get(self.vin, {})
+            .get("additionalVehicleStatus", {})
+            .get(self.category, {})
+            .get(self.field)
+        )
+        if value is None:
+            return
+        self.coordinator.async_confirm(self.vin, ENDPOINT_STATUS, {path: (value,)})
 
     def _update_local_state_optimistically(self, locked: bool) -> None:
         """Update the coordinator data to reflect the change immediately."""
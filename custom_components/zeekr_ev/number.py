@@ -9,7 +9,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import DOMAIN, ENDPOINT_CHARGING_LIMIT
 from .coordinator import ZeekrCoordinator
 from .entity import ZeekrEntity
 
@@ -107,7 +107,7 @@ class ZeekrChargingLimitNumber(ZeekrEntity, RestoreNumber):
 
     def __init__(self, coordinator: ZeekrCoordinator, vin: str) -> None:
         """Initialize the charging limit number."""
-        super().__init__(coordinator, vin)
+        super().__init__(coordinator, vin, paths=(("chargingLimit", "soc"),))
         self._attr_name = "Charging Limit"
         self._attr_unique_id = f"{vin}_charging_limit"
         self._attr_native_value: float | None = None
@@ -164,9 +164,9 @@ class ZeekrChargingLimitNumber(ZeekrEntity, RestoreNumber):
             ]
         }
 
-        await self.coordinator.async_inc_invoke()
-        await self.hass.async_add_executor_job(
-            vehicle.do_remote_control, command, service_id, setting
+        await self.coordinator.async_send_command(
+            vehicle, command, service_id, setting
         )
+        self.coordinator.invalidate_endpoint(self.vin, ENDPOINT_CHARGING_LIMIT)
         self._attr_native_value = value
         self.async_write_ha_state()
@@ -0,0 +1,95 @@
+"""Vehicle-state-aware polling policies for Zeekr EV API Integration."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from datetime import timedelta
+
+POLLING_MODE_DRIVING = "driving"
+POLLING_MODE_CHARGING = "charging"
+POLLING_MODE_ACTIVE = "active"
+POLLING_MODE_PARKED = "parked"
+POLLING_MODE_DEEP_SLEEP = "deep_sleep"
+POLLING_MODES = [
+    POLLING_MODE_DRIVING,
+    POLLING_MODE_CHARGING,
+    POLLING_MODE_ACTIVE,
+    POLLING_MODE_PARKED,
+    POLLING_MODE_DEEP_SLEEP,
+]
+
+# chargerState values that mean the car is charging (see binary_sensor.py)
+CHARGING_STATES = {"1", "2", "15"}
+
+
+class ZeekrPollingPolicy(ABC):
+    """Base class for choosing how often a vehicle is polled.
+
+    Subclasses implement ``select`` and can be swapped in by assigning
+    ``coordinator.polling_policy``. Before each ``select`` the coordinator
+    sets ``request_rates`` to the account's rolling request and invoke
+    counts (e.g. ``requests_5m``), so a policy can back off while bursting.
+    """
+
+    def __init__(self, base_interval: timedelta) -> None:
+        """Initialize with the user-configured polling interval."""
+        self.base_interval = base_interval
+        self.request_rates: dict[str, int] = {}
+
+    @abstractmethod
+    def select(self, vehicle_data: dict) -> tuple[str, timedelta]:
+        """Return the polling mode and interval for a vehicle snapshot."""
+
+
+class ZeekrFixedPollingPolicy(ZeekrPollingPolicy):
+    """Poll every vehicle at the configured interval (the old behaviour)."""
+
+    def select(self, vehicle_data: dict) -> tuple[str, timedelta]:
+        """Return the configured interval regardless of vehicle state."""
+        return POLLING_MODE_ACTIVE, self.base_interval
+
+
+class ZeekrAdaptivePollingPolicy(ZeekrPollingPolicy):
+    """Poll driving and charging cars often, sleeping cars rarely."""
+
+    # Fastest interval used for each mode; never slower than the base interval
+    FAST_INTERVALS = {
+        POLLING_MODE_DRIVING: timedelta(minutes=1),
+        POLLING_MODE_CHARGING: timedelta(minutes=2),
+    }
+    # Slowest interval used for each mode; never faster than the base interval
+    SLOW_INTERVALS = {
+        POLLING_MODE_PARKED: timedelta(minutes=15),
+        POLLING_MODE_DEEP_SLEEP: timedelta(minutes=60),
+    }
+
+    def select(self, vehicle_data: dict) -> tuple[str, timedelta]:
+        """Pick a mode from usageMode, engineStatus and chargerState."""
+        mode = self.mode_for(vehicle_data)
+        if mode in self.FAST_INTERVALS:
+            return mode, min(self.base_interval, self.FAST_INTERVALS[mode])
+        if mode in self.SLOW_INTERVALS:
+            return mode, max(self.base_interval, self.SLOW_INTERVALS[mode])
+        return mode, self.base_interval
+
+    @staticmethod
+    def mode_for(vehicle_data: dict) -> str:
+        """Classify a vehicle snapshot into a polling mode."""
+        basic = vehicle_data.get("basicVehicleStatus", {})
+        usage_mode = str(basic.get("usageMode", "")).strip()
+        engine_status = str(basic.get("engineStatus", "")).strip().lower()
+        charger_state = str(
+            vehicle_data.get("additionalVehicleStatus", {})
+            .get("electricVehicleStatus", {})
+            .get("chargerState", "")
+        ).strip()
+
+        if engine_status == "engine-running":
+            return POLLING_MODE_DRIVING
+        if charger_state in CHARGING_STATES or engine_status == "charging":
+            return POLLING_MODE_CHARGING
+        if usage_mode == "0":
+            return POLLING_MODE_DEEP_SLEEP
+        if usage_mode == "1" and engine_status in ("", "engine-off"):
+            return POLLING_MODE_PARKED
+        return POLLING_MODE_ACTIVE
@@ -1,23 +1,85 @@
 # Add API request/invoke counting and reset logic for ZeekrCoordinator
 # This will be imported and used in the main coordinator and entity files
 
-import asyncio
+from bisect import bisect_left
 from datetime import datetime
-from typing import Any, Callable
+import time
+from typing import Any
 
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.event import async_call_later
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.storage import Store
 
-STORAGE_KEY = "zeekr_ev_stats"
+from .const import DOMAIN
+
 STORAGE_VERSION = 1
-SAVE_DELAY = 5  # seconds
+# Stats used to be stored under one key shared by every entry
+LEGACY_STORAGE_KEY = "zeekr_ev_stats"
+# Set in hass.data once an entry has claimed the legacy stats
+LEGACY_CLAIMED = f"{DOMAIN}_legacy_stats_claimed"
+# Batch the writes from a poll's worth of increments (seconds). Pending
+# writes are also flushed when Home Assistant stops.
+SAVE_DELAY = 60
+
+# Upper bounds of the call latency histogram buckets (milliseconds); the
+# last bucket catches everything slower
+LATENCY_BUCKETS = (50, 100, 250, 500, 1000, 2500, 5000, 10000, 20000, 60000)
+
+# Rolling request/invoke counts are kept in one bucket per minute
+RATE_BUCKETS = 24 * 60
+RATE_WINDOWS = {"5m": 5, "1h": 60, "24h": 24 * 60}
+
+
+class LatencyHistogram:
+    """Call count, error count and fixed-bucket latency histogram."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.errors = 0
+        self.total_ms = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+
+    def record(self, duration_ms: float, error: bool = False) -> None:
+        self.count += 1
+        self.errors += error
+        self.total_ms += duration_ms
+        self.buckets[bisect_left(LATENCY_BUCKETS, duration_ms)] += 1
+
+    def percentile(self, q: float) -> int | None:
+        """Return the upper bound of the bucket holding the q-th quantile.
+
+        Calls slower than the last bound report that bound.
+        """
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for index, bucket in enumerate(self.buckets):
+            seen += bucket
+            if seen >= rank:
+                break
+        return LATENCY_BUCKETS[min(index, len(LATENCY_BUCKETS) - 1)]
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "mean_ms": round(self.total_ms / self.count, 1) if self.count else None,
+            "p50_ms": self.percentile(0.5),
+            "p95_ms": self.percentile(0.95),
+            "p99_ms": self.percentile(0.99),
+        }
 
 
 class ZeekrRequestStats:
-    def __init__(self, hass: HomeAssistant):
+    """Request and invoke counters for one config entry.
+
+    Increments are plain synchronous calls; the daily counters are reset by
+    the coordinator's midnight callback and checked once on load.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str):
         self._hass = hass
-        self._store: Store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._store: Store = Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.stats")
         self.api_requests_today = 0
         self.api_invokes_today = 0
         self.api_requests_total = 0
@@ -25,8 +87,13 @@ class ZeekrRequestStats:
         self._last_reset = datetime.now().date()
         self._loaded = False
         self._dirty = False
-        self._save_lock = asyncio.Lock()
-        self._cancel_save: Callable[[], Any] | None = None
+        # Since startup, by API method name and by (method name, VIN)
+        self.calls: dict[str, LatencyHistogram] = {}
+        self.vehicle_calls: dict[tuple[str, str], LatencyHistogram] = {}
+        # Ring buffer of per-minute counts; each slot remembers its minute
+        self._rate_minutes = [-1] * RATE_BUCKETS
+        self._rate_requests = [0] * RATE_BUCKETS
+        self._rate_invokes = [0] * RATE_BUCKETS
 
     async def async_load(self):
         """Load stats from storage."""
@@ -34,6 +101,8 @@ class ZeekrRequestStats:
             return
 
         data = await self._store.async_load()
+        if not data:
+            data = await self._async_migrate_legacy()
         if data:
             self.api_requests_today = data.get("api_requests_today", 0)
             self.api_invokes_today = data.get("api_invokes_today", 0)
@@ -47,39 +116,127 @@ class ZeekrRequestStats:
                 self._last_reset = datetime.now().date()
 
         self._loaded = True
-        # Check reset after loading in case we loaded stale data from yesterday
-        await self._async_check_reset()
+        # Reset in case we loaded stale data from yesterday
+        if datetime.now().date() != self._last_reset:
+            self.reset_today()
+
+    async def _async_migrate_legacy(self) -> dict[str, Any] | None:
+        """Take over the shared stats of older versions, once.
+
+        The first entry to load without stats of its own seeds its store
+        with them, and the legacy store is removed.
+        """
+        if self._hass.data.get(LEGACY_CLAIMED):
+            return None
+        self._hass.data[LEGACY_CLAIMED] = True
+        legacy: Store = Store(self._hass, STORAGE_VERSION, LEGACY_STORAGE_KEY)
+        data = await legacy.async_load()
+        if not data:
+            return None
+        await self._store.async_save(data)
+        await legacy.async_remove()
+        return data
 
-    async def async_reset_today(self):
+    @callback
+    def reset_today(self):
         self.api_requests_today = 0
         self.api_invokes_today = 0
         self._last_reset = datetime.now().date()
-        self._dirty = True
-        await self.async_save()
+        self._schedule_save()
 
-    async def async_inc_request(self):
-        await self._async_check_reset()
+    @callback
+    def inc_request(self):
         self.api_requests_today += 1
         self.api_requests_total += 1
-        self._async_schedule_save()
+        self._rate_requests[self._rate_slot()] += 1
+        self._schedule_save()
 
-    async def async_inc_invoke(self):
-        await self._async_check_reset()
+    @callback
+    def inc_invoke(self):
         self.api_invokes_today += 1
         self.api_invokes_total += 1
-        self._async_schedule_save()
+        self._rate_invokes[self._rate_slot()] += 1
+        self._schedule_save()
+
+    def _rate_slot(self) -> int:
+        """Return the ring buffer slot for this minute, clearing it if reused."""
+        minute = int(time.monotonic() // 60)
+        slot = minute % RATE_BUCKETS
+        if self._rate_minutes[slot] != minute:
+            self._rate_minutes[slot] = minute
+            self._rate_requests[slot] = 0
+            self._rate_invokes[slot] = 0
+        return slot
+
+    def _rate_count(self, counts: list[int], minutes: int) -> int:
+        """Sum the counts of the last minutes (the current one included)."""
+        oldest = int(time.monotonic() // 60) - minutes
+        return sum(
+            count
+            for minute, count in zip(self._rate_minutes, counts)
+            if minute > oldest
+        )
 
-    async def _async_check_reset(self):
-        today = datetime.now().date()
-        if today != self._last_reset:
-            await self.async_reset_today()
+    def requests_in(self, minutes: int) -> int:
+        """Return the number of requests in the last minutes."""
+        return self._rate_count(self._rate_requests, minutes)
 
-    def _async_schedule_save(self) -> None:
-        """Schedule a save."""
+    def invokes_in(self, minutes: int) -> int:
+        """Return the number of invokes in the last minutes."""
+        return self._rate_count(self._rate_invokes, minutes)
+
+    def rates(self) -> dict[str, int]:
+        """Return request and invoke counts for each rolling window."""
+        rates = {}
+        for name, minutes in RATE_WINDOWS.items():
+            rates[f"requests_{name}"] = self.requests_in(minutes)
+            rates[f"invokes_{name}"] = self.invokes_in(minutes)
+        return rates
+
+    @callback
+    def record_call(
+        self, name: str, vin: str | None, duration: float, error: bool = False
+    ) -> None:
+        """Record the latency (seconds) and outcome of one API call."""
+        duration_ms = duration * 1000
+        if (histogram := self.calls.get(name)) is None:
+            histogram = self.calls[name] = LatencyHistogram()
+        histogram.record(duration_ms, error)
+        if vin is not None:
+            key = (name, vin)
+            if (histogram := self.vehicle_calls.get(key)) is None:
+                histogram = self.vehicle_calls[key] = LatencyHistogram()
+            histogram.record(duration_ms, error)
+
+    def call_stats(self, name: str) -> dict[str, Any] | None:
+        """Return the counters of one API method, with a per-VIN breakdown."""
+        if (histogram := self.calls.get(name)) is None:
+            return None
+        return {
+            **histogram.as_dict(),
+            "vehicles": {
+                vin: vehicle_histogram.as_dict()
+                for (call, vin), vehicle_histogram in self.vehicle_calls.items()
+                if call == name
+            },
+        }
+
+    def calls_as_dict(self) -> dict[str, Any]:
+        """Return the counters of every API method called so far."""
+        return {name: self.call_stats(name) for name in sorted(self.calls)}
+
+    @callback
+    def _schedule_save(self) -> None:
+        """Schedule one batched write for everything counted until then."""
+        if self._dirty:
+            return
         self._dirty = True
-        if self._cancel_save:
-            self._cancel_save()
-        self._cancel_save = async_call_later(self._hass, SAVE_DELAY, self.async_save)
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        self._dirty = False
+        return self.as_dict()
 
     def as_dict(self):
         return {
@@ -91,18 +248,10 @@ class ZeekrRequestStats:
         }
 
     async def async_save(self, *args: Any) -> None:
-        """Save the current stats to storage."""
-        async with self._save_lock:
-            if not self._dirty:
-                return
-
-            if self._cancel_save:
-                self._cancel_save()
-                self._cancel_save = None
-
-            data = self.as_dict()
-            await self._store.async_save(data)
-            self._dirty = False
+        """Write pending stats to storage now."""
+        if not self._dirty:
+            return
+        await self._store.async_save(self._data_to_save())
 
     async def async_shutdown(self) -> None:
         """Save pending data on shutdown."""
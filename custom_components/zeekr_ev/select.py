@@ -10,8 +10,8 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
-from .coordinator import ZeekrCoordinator
+from .const import DOMAIN, ENDPOINT_STATUS
+from .coordinator import ZeekrCoordinator, vehicle_context
 
 OPTION_OFF = "Off"
 OPTION_LEVEL_1 = "Level 1"
@@ -140,7 +140,13 @@ class ZeekrSeatSelect(CoordinatorEntity, SelectEntity):
         status_keys: list[str],
     ) -> None:
         """Initialize the select entity."""
-        super().__init__(coordinator)
+        super().__init__(
+            coordinator,
+            context=vehicle_context(
+                vin,
+                *(("additionalVehicleStatus", "climateStatus", key) for key in status_keys),
+            ),
+        )
         self.vin = vin
         self.service_code = service_code
         self.mode = mode
@@ -227,17 +233,28 @@ class ZeekrSeatSelect(CoordinatorEntity, SelectEntity):
 
         setting["serviceParameters"] = params
 
-        await self.coordinator.async_inc_invoke()
-        await self.hass.async_add_executor_job(
-            vehicle.do_remote_control, command, service_id, setting
+        await self.coordinator.async_send_command(
+            vehicle, command, service_id, setting
         )
 
         # Optimistic update
         self._update_local_state_optimistically(level)
         self.async_write_ha_state()
 
-        # Trigger refresh (might revert if API is slow, but that's expected eventually)
-        await self.coordinator.async_request_refresh()
+        self._confirm_state(level)
+
+    def _confirm_state(self, level: int) -> None:
+        """Poll the vehicle status until the seat reports the new level."""
+        climate_status = ("additionalVehicleStatus", "climateStatus")
+        if self.mode == "heat" and self.status_keys:
+            expected = {(*climate_status, self.status_keys[0]): (str(level),)}
+        elif self.mode == "vent" and len(self.status_keys) >= 2:
+            expected = {(*climate_status, self.status_keys[0]): ("1",) if level else ("2",)}
+            if level:
+                expected[(*climate_status, self.status_keys[1])] = (str(level),)
+        else:
+            return
+        self.coordinator.async_confirm(self.vin, ENDPOINT_STATUS, expected)
 
     def _update_local_state_optimistically(self, level: int):
         """Update the coordinator data to reflect the change immediately."""
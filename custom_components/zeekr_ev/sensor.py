@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from datetime import timedelta
 import importlib
 import logging
 
@@ -11,51 +12,51 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import (
-    PERCENTAGE,
-    UnitOfElectricCurrent,
-    UnitOfElectricPotential,
-    UnitOfLength,
-    UnitOfPower,
-    UnitOfPressure,
-    UnitOfSpeed,
-    UnitOfTemperature,
-)
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EntityCategory, UnitOfTime
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, CONF_DRIVE_SIDE, DRIVE_SIDE_LHD, DRIVE_SIDE_RHD
-from .coordinator import ZeekrCoordinator
+from .circuit_breaker import CIRCUIT_STATES
+from .const import ATTR_STALE_SINCE, DOMAIN, CONF_DRIVE_SIDE, DRIVE_SIDE_LHD
+from .coordinator import ZeekrCoordinator, vehicle_context
+from .fields import (
+    CHARGING_SENSOR_FIELDS,
+    SENSOR_FIELDS,
+    ZeekrField,
+    compile_accessor,
+    tire_sensor_fields,
+)
+from .polling import POLLING_MODES
 from .utils import get_api_version
 
 _LOGGER = logging.getLogger(__name__)
 
-
-def get_tire_position_label(api_position: str, drive_side: str) -> str:
-    """
-    Map API tire position to display label based on vehicle drive side.
-
-    For RHD vehicles, only the rear tires are swapped (DriverRear <-> PassengerRear).
-    Front tires remain as-is because the driver is on the right side.
-
-    Args:
-        api_position: The position from the API (Driver, Passenger, DriverRear, PassengerRear)
-        drive_side: The vehicle drive side (lhd or rhd)
-
-    Returns:
-        The display label for the tire position
-    """
-    if drive_side == DRIVE_SIDE_RHD:
-        # For RHD vehicles, only swap rear tires
-        rhd_mapping = {
-            "DriverRear": "PassengerRear",
-            "PassengerRear": "DriverRear",
-        }
-        return rhd_mapping.get(api_position, api_position)
-    # For LHD (default), use the API position as-is
-    return api_position
+# Rolling windows with request and invoke count sensors
+RATE_SENSOR_WINDOWS = (
+    ("5m", 5, "5 Minutes"),
+    ("1h", 60, "Hour"),
+    ("24h", 24 * 60, "24 Hours"),
+)
+# Rate sensors are recomputed this often so old minutes roll out of the
+# window even when polls are far apart
+RATE_SENSOR_REFRESH = timedelta(minutes=1)
+
+# API methods with a latency sensor
+LATENCY_CALLS = (
+    "get_status",
+    "get_remote_control_state",
+    "get_charging_status",
+    "get_charging_limit",
+    "get_charge_plan",
+    "get_travel_plan",
+    "do_remote_control",
+    "set_charge_plan",
+    "set_travel_plan",
+    "login",
+)
 
 
 # Import the encryption function dynamically (try pip first, then local)
@@ -124,230 +125,77 @@ async def async_setup_entry(
             lambda stats: stats.api_invokes_total,
         )
     )
-
-    # coordinator.data might be None or empty on first setup
-    if not coordinator.data:
-        async_add_entities(entities)
-        return
-
-    for vin, data in coordinator.data.items():
-        # Battery Level
-        entities.append(
-            ZeekrSensor(
-                coordinator,
-                vin,
-                "battery_level",
-                "Battery Level",
-                lambda d: d.get("additionalVehicleStatus", {})
-                .get("electricVehicleStatus", {})
-                .get("chargeLevel"),
-                PERCENTAGE,
-                SensorDeviceClass.BATTERY,
-            )
-        )
-        # Range (Battery Only)
-        entities.append(
-            ZeekrSensor(
-                coordinator,
-                vin,
-                "range",
-                "Range",
-                lambda d: d.get("additionalVehicleStatus", {})
-                .get("electricVehicleStatus", {})
-                .get("distanceToEmptyOnBatteryOnly"),
-                UnitOfLength.KILOMETERS,
-                SensorDeviceClass.DISTANCE,
-            )
-        )
-        # Odometer
+    # Rolling request/invoke counts, to spot bursts
+    for window, minutes, label in RATE_SENSOR_WINDOWS:
         entities.append(
-            ZeekrSensor(
+            ZeekrAPIRateSensor(
                 coordinator,
-                vin,
-                "odometer",
-                "Odometer",
-                lambda d: d.get("additionalVehicleStatus", {})
-                .get("maintenanceStatus", {})
-                .get("odometer"),
-                UnitOfLength.KILOMETERS,
-                SensorDeviceClass.DISTANCE,
-                SensorStateClass.TOTAL_INCREASING,
+                entry.entry_id,
+                f"api_requests_{window}",
+                f"API Requests Last {label}",
+                lambda stats, minutes=minutes: stats.requests_in(minutes),
             )
         )
-        # Interior Temperature
         entities.append(
-            ZeekrSensor(
+            ZeekrAPIRateSensor(
                 coordinator,
-                vin,
-                "interior_temp",
-                "Interior Temperature",
-                lambda d: d.get("additionalVehicleStatus", {})
-                .get("climateStatus", {})
-                .get("interiorTemp"),
-                UnitOfTemperature.CELSIUS,
-                SensorDeviceClass.TEMPERATURE,
+                entry.entry_id,
+                f"api_invokes_{window}",
+                f"API Invokes Last {label}",
+                lambda stats, minutes=minutes: stats.invokes_in(minutes),
             )
         )
 
-        # Trip 2 Sensors
-        # Trip 2 Distance
-        entities.append(
-            ZeekrSensor(
-                coordinator,
-                vin,
-                "trip_2_distance",
-                "Trip 2 Distance",
-                lambda d: (
-                    float(d.get("additionalVehicleStatus", {})
-                          .get("runningStatus", {})
-                          .get("tripMeter2"))
-                    if d.get("additionalVehicleStatus", {})
-                    .get("runningStatus", {})
-                    .get("tripMeter2") is not None
-                    else None
-                ),
-                UnitOfLength.KILOMETERS,
-                SensorDeviceClass.DISTANCE,
-                SensorStateClass.TOTAL_INCREASING,
-            )
+    # Worker pool diagnostics (global, not per vehicle)
+    entities.append(
+        ZeekrAPIDiagnosticSensor(
+            coordinator,
+            entry.entry_id,
+            "api_worker_queue_depth",
+            "API Worker Queue Depth",
+            lambda c: c.worker_pool.queue_depth if c.worker_pool else None,
+            icon="mdi:tray-full",
         )
-        # Trip 2 Average Speed
-        entities.append(
-            ZeekrSensor(
-                coordinator,
-                vin,
-                "trip_2_avg_speed",
-                "Trip 2 Average Speed",
-                lambda d: d.get("additionalVehicleStatus", {})
-                .get("runningStatus", {})
-                .get("avgSpeed"),
-                UnitOfSpeed.KILOMETERS_PER_HOUR,
-                SensorDeviceClass.SPEED,
-            )
+    )
+    entities.append(
+        ZeekrAPIDiagnosticSensor(
+            coordinator,
+            entry.entry_id,
+            "api_worker_wait_time",
+            "API Worker Wait Time",
+            lambda c: round(c.worker_pool.average_wait, 3) if c.worker_pool else None,
+            UnitOfTime.SECONDS,
+            icon="mdi:timer-sand",
         )
-        # Trip 2 Average Consumption
-        entities.append(
-            ZeekrSensor(
-                coordinator,
-                vin,
-                "trip_2_avg_consumption",
-                "Trip 2 Average Consumption",
-                lambda d: d.get("additionalVehicleStatus", {})
-                .get("electricVehicleStatus", {})
-                .get("averPowerConsumption"),
-                "kWh/100km",
-                None,
-            )
+    )
+    entities.append(
+        ZeekrAPIDiagnosticSensor(
+            coordinator,
+            entry.entry_id,
+            "api_budget_remaining",
+            "API Budget Remaining",
+            lambda c: c.budget.remaining(c.request_stats.api_requests_today),
+            icon="mdi:gauge",
         )
+    )
 
-        # Tire Pressures
-        drive_side = entry.data.get(CONF_DRIVE_SIDE, DRIVE_SIDE_LHD)
-        for tire in ["Driver", "Passenger", "DriverRear", "PassengerRear"]:
-            display_label = get_tire_position_label(tire, drive_side)
-            entities.append(
-                ZeekrSensor(
-                    coordinator,
-                    vin,
-                    f"tire_pressure_{tire.lower()}",
-                    f"Tire Pressure {display_label}",
-                    lambda d, t=tire: d.get("additionalVehicleStatus", {})
-                    .get("maintenanceStatus", {})
-                    .get(f"tyreStatus{t}"),
-                    UnitOfPressure.KPA,
-                    SensorDeviceClass.PRESSURE,
-                )
-            )
-            entities.append(
-                ZeekrSensor(
-                    coordinator,
-                    vin,
-                    f"tire_temperature_{tire.lower()}",
-                    f"Tire Temperature {display_label}",
-                    lambda d, t=tire: d.get("additionalVehicleStatus", {})
-                    .get("maintenanceStatus", {})
-                    .get(f"tyreTemp{t}"),
-                    UnitOfTemperature.CELSIUS,
-                    SensorDeviceClass.TEMPERATURE,
-                )
-            )
+    entities.append(ZeekrCircuitBreakerSensor(coordinator, entry.entry_id))
+    entities.extend(
+        ZeekrAPILatencySensor(coordinator, entry.entry_id, call) for call in LATENCY_CALLS
+    )
 
-        # BMS diagnostic sensors (raw API values from Zeekr Connected API)
-        entities.append(
-            ZeekrSensor(
-                coordinator,
-                vin,
-                "distance_to_empty_on_battery_20_soc",
-                "distanceToEmptyOnBattery20Soc",
-                lambda d: d.get("additionalVehicleStatus", {})
-                .get("electricVehicleStatus", {})
-                .get("distanceToEmptyOnBattery20Soc"),
-                UnitOfLength.KILOMETERS,
-                SensorDeviceClass.DISTANCE,
-            )
-        )
-        entities.append(
-            ZeekrSensor(
-                coordinator,
-                vin,
-                "distance_to_empty_on_battery_100_soc",
-                "distanceToEmptyOnBattery100Soc",
-                lambda d: d.get("additionalVehicleStatus", {})
-                .get("electricVehicleStatus", {})
-                .get("distanceToEmptyOnBattery100Soc"),
-                UnitOfLength.KILOMETERS,
-                SensorDeviceClass.DISTANCE,
-            )
-        )
+    # coordinator.data might be None or empty on first setup
+    if not coordinator.data:
+        async_add_entities(entities)
+        return
+
+    drive_side = entry.data.get(CONF_DRIVE_SIDE, DRIVE_SIDE_LHD)
+    for vin, data in coordinator.data.items():
+        fields = SENSOR_FIELDS + tire_sensor_fields(drive_side)
         # Charging Status Sensors (only when charging)
         if data.get("chargingStatus"):
-            # Charge Voltage
-            entities.append(
-                ZeekrSensor(
-                    coordinator,
-                    vin,
-                    "charge_voltage",
-                    "Charge Voltage",
-                    lambda d: d.get("chargingStatus", {}).get("chargeVoltage"),
-                    UnitOfElectricPotential.VOLT,
-                    SensorDeviceClass.VOLTAGE,
-                )
-            )
-            # Charge Current
-            entities.append(
-                ZeekrSensor(
-                    coordinator,
-                    vin,
-                    "charge_current",
-                    "Charge Current",
-                    lambda d: d.get("chargingStatus", {}).get("chargeCurrent"),
-                    UnitOfElectricCurrent.AMPERE,
-                    SensorDeviceClass.CURRENT,
-                )
-            )
-            # Charge Power
-            entities.append(
-                ZeekrSensor(
-                    coordinator,
-                    vin,
-                    "charge_power",
-                    "Charge Power",
-                    lambda d: d.get("chargingStatus", {}).get("chargePower"),
-                    UnitOfPower.KILO_WATT,
-                    SensorDeviceClass.POWER,
-                )
-            )
-            # Charge Speed
-            entities.append(
-                ZeekrSensor(
-                    coordinator,
-                    vin,
-                    "charge_speed",
-                    "Charge Speed",
-                    lambda d: d.get("chargingStatus", {}).get("chargeSpeed"),
-                    "km/h",
-                    None,
-                )
-            )
+            fields = fields + CHARGING_SENSOR_FIELDS
+        entities.extend(ZeekrSensor.from_field(coordinator, vin, field) for field in fields)
 
         # Formatted Charging Time Remaining Sensor
         entities.append(ZeekrChargingTimeFormattedSensor(coordinator, vin))
@@ -356,6 +204,10 @@ async def async_setup_entry(
         entities.append(ZeekrVehicleStatusSensor(coordinator, vin))
         entities.append(ZeekrEngineStatusSensor(coordinator, vin))
 
+        # Polling diagnostics
+        entities.append(ZeekrPollingModeSensor(coordinator, vin))
+        entities.append(ZeekrPollingIntervalSensor(coordinator, vin))
+
     async_add_entities(entities)
 
 
@@ -374,26 +226,61 @@ class ZeekrSensor(CoordinatorEntity, SensorEntity):
         unit: str | None = None,
         device_class: SensorDeviceClass | None = None,
         state_class: SensorStateClass | None = SensorStateClass.MEASUREMENT,
+        paths: tuple = (),
+        accessor=None,
     ) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator)
+        """Initialize the sensor, waking on changes to paths (default: the whole vehicle).
+
+        Sensors built from a field catalog entry pass a compiled accessor that
+        reads the coordinator's flattened data index instead of value_fn.
+        """
+        super().__init__(coordinator, context=vehicle_context(vin, *paths))
         self.vin = vin
         self.key = key
+        self._paths = paths
         self._attr_name = name
         self._attr_unique_id = f"{vin}_{key}"
         self._value_fn = value_fn
+        self._accessor = accessor
         self._attr_native_unit_of_measurement = unit
         self._attr_device_class = device_class
         self._attr_state_class = state_class
 
+    @classmethod
+    def from_field(
+        cls, coordinator: ZeekrCoordinator, vin: str, field: ZeekrField
+    ) -> ZeekrSensor:
+        """Create a sensor for a field catalog entry."""
+        return cls(
+            coordinator,
+            vin,
+            field.key,
+            field.name,
+            None,
+            field.unit,
+            field.device_class,
+            field.state_class,
+            paths=(field.path,),
+            accessor=compile_accessor(field, vin),
+        )
+
     @property
     def native_value(self):
         """Return the state of the sensor."""
+        if self._accessor is not None:
+            return self._accessor(self.coordinator.data_index)
         data = self.coordinator.data.get(self.vin, {})
         if not data:
             return None
         return self._value_fn(data)
 
+    @property
+    def extra_state_attributes(self):
+        """Return when the value was last fetched, if it is served from cache."""
+        if stale_since := self.coordinator.data_stale_since(self.vin, self._paths):
+            return {ATTR_STALE_SINCE: stale_since}
+        return None
+
     @property
     def device_info(self):
         """Return device info."""
@@ -510,6 +397,120 @@ class ZeekrAPIStatSensor(CoordinatorEntity, SensorEntity):
         }
 
 
+class ZeekrAPIRateSensor(ZeekrAPIStatSensor):
+    """Request or invoke count over a rolling window."""
+
+    async def async_added_to_hass(self) -> None:
+        """Also recompute every minute, not only when the coordinator publishes."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_track_time_interval(self.hass, self._async_roll, RATE_SENSOR_REFRESH)
+        )
+
+    @callback
+    def _async_roll(self, now) -> None:
+        self.async_write_ha_state()
+
+
+class ZeekrAPIDiagnosticSensor(CoordinatorEntity, SensorEntity):
+    """Diagnostic sensor on the Zeekr API device computed from the coordinator."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    def __init__(
+        self,
+        coordinator: ZeekrCoordinator,
+        entry_id: str,
+        key: str,
+        name: str,
+        value_fn,
+        unit: str | None = None,
+        icon: str = "mdi:chart-line",
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._entry_id = entry_id
+        self._key = key
+        self._attr_name = name
+        self._attr_unique_id = f"{entry_id}_{key}"
+        self._value_fn = value_fn
+        self._attr_native_unit_of_measurement = unit
+        self._attr_icon = icon
+
+    @property
+    def native_value(self):
+        """Return the state of the sensor."""
+        return self._value_fn(self.coordinator)
+
+    @property
+    def device_info(self):
+        """Return device info."""
+        return {
+            "identifiers": {(DOMAIN, self._entry_id)},
+            "name": "Zeekr API",
+            "manufacturer": "Zeekr",
+            "model": "API Integration",
+            "sw_version": get_api_version(self.coordinator.client),
+        }
+
+
+class ZeekrCircuitBreakerSensor(ZeekrAPIDiagnosticSensor):
+    """Diagnostic sensor for the endpoint circuit breakers of the account."""
+
+    _attr_device_class = SensorDeviceClass.ENUM
+    _attr_options = CIRCUIT_STATES
+
+    def __init__(self, coordinator: ZeekrCoordinator, entry_id: str) -> None:
+        """Initialize the sensor."""
+        super().__init__(
+            coordinator,
+            entry_id,
+            "api_circuit_breaker",
+            "API Circuit Breaker",
+            self._worst_state,
+            icon="mdi:electric-switch",
+        )
+
+    @staticmethod
+    def _worst_state(coordinator: ZeekrCoordinator) -> str:
+        """Return the state of the most degraded endpoint."""
+        states = [breaker.state for breaker in coordinator.breakers.values()]
+        return max(states, key=CIRCUIT_STATES.index, default=CIRCUIT_STATES[0])
+
+    @property
+    def extra_state_attributes(self):
+        """Return each endpoint's state and seconds until its next trial."""
+        return {
+            endpoint: {"state": breaker.state, "retry_in": round(breaker.retry_in())}
+            for endpoint, breaker in self.coordinator.breakers.items()
+        }
+
+
+class ZeekrAPILatencySensor(ZeekrAPIDiagnosticSensor):
+    """Diagnostic sensor for the p95 latency of one API method."""
+
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_entity_registry_enabled_default = False
+
+    def __init__(self, coordinator: ZeekrCoordinator, entry_id: str, call: str) -> None:
+        """Initialize the sensor."""
+        super().__init__(
+            coordinator,
+            entry_id,
+            f"api_latency_{call}",
+            f"API Latency {call}",
+            lambda c: (c.request_stats.call_stats(call) or {}).get("p95_ms"),
+            UnitOfTime.MILLISECONDS,
+            icon="mdi:timer-outline",
+        )
+        self._call = call
+
+    @property
+    def extra_state_attributes(self):
+        """Return counts, errors and percentiles, overall and per VIN."""
+        return self.coordinator.request_stats.call_stats(self._call)
+
+
 class ZeekrChargingTimeFormattedSensor(CoordinatorEntity, SensorEntity):
     """Sensor for formatted display of charging time remaining (e.g., 2h 53m)."""
 
@@ -517,7 +518,10 @@ class ZeekrChargingTimeFormattedSensor(CoordinatorEntity, SensorEntity):
 
     def __init__(self, coordinator: ZeekrCoordinator, vin: str) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
+        super().__init__(
+            coordinator,
+            context=vehicle_context(vin, ("additionalVehicleStatus", "electricVehicleStatus", "timeToFullyCharged")),
+        )
         self.vin = vin
         self._attr_name = "Charging Time Remaining"
         self._attr_unique_id = f"{vin}_charging_time_formatted"
@@ -578,7 +582,10 @@ class ZeekrVehicleStatusSensor(CoordinatorEntity, SensorEntity):
 
     def __init__(self, coordinator: ZeekrCoordinator, vin: str) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
+        super().__init__(
+            coordinator,
+            context=vehicle_context(vin, ("basicVehicleStatus", "usageMode")),
+        )
         self.vin = vin
         self._attr_name = "Vehicle Status"
         self._attr_unique_id = f"{vin}_vehicle_status"
@@ -619,7 +626,10 @@ class ZeekrEngineStatusSensor(CoordinatorEntity, SensorEntity):
 
     def __init__(self, coordinator: ZeekrCoordinator, vin: str) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
+        super().__init__(
+            coordinator,
+            context=vehicle_context(vin, ("basicVehicleStatus", "engineStatus")),
+        )
         self.vin = vin
         self._attr_name = "Engine Status"
         self._attr_unique_id = f"{vin}_engine_status"
@@ -644,3 +654,66 @@ class ZeekrEngineStatusSensor(CoordinatorEntity, SensorEntity):
             "name": f"Zeekr {self.vin}",
             "manufacturer": "Zeekr",
         }
+
+
+class ZeekrPollingModeSensor(CoordinatorEntity, SensorEntity):
+    """Diagnostic sensor for the polling mode chosen for a vehicle."""
+
+    _attr_has_entity_name = True
+    _attr_device_class = SensorDeviceClass.ENUM
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_options = POLLING_MODES
+
+    def __init__(self, coordinator: ZeekrCoordinator, vin: str) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self.vin = vin
+        self._attr_name = "Polling Mode"
+        self._attr_unique_id = f"{vin}_polling_mode"
+        self._attr_icon = "mdi:timer-cog-outline"
+
+    @property
+    def native_value(self):
+        """Return the current polling mode."""
+        return self.coordinator.polling_modes.get(self.vin)
+
+    @property
+    def device_info(self):
+        return {
+            "identifiers": {(DOMAIN, self.vin)},
+            "name": f"Zeekr {self.vin}",
+            "manufacturer": "Zeekr",
+        }
+
+
+class ZeekrPollingIntervalSensor(CoordinatorEntity, SensorEntity):
+    """Diagnostic sensor for how often a vehicle is currently polled."""
+
+    _attr_has_entity_name = True
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_native_unit_of_measurement = UnitOfTime.MINUTES
+
+    def __init__(self, coordinator: ZeekrCoordinator, vin: str) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self.vin = vin
+        self._attr_name = "Polling Interval"
+        self._attr_unique_id = f"{vin}_polling_interval"
+        self._attr_icon = "mdi:timer-outline"
+
+    @property
+    def native_value(self):
+        """Return the current polling interval in minutes."""
+        interval = self.coordinator.vehicle_intervals.get(self.vin)
+        if interval is None:
+            return None
+        return round(interval.total_seconds() / 60, 1)
+
+    @property
+    def device_info(self):
+        return {
+            "identifiers": {(DOMAIN, self.vin)},
+            "name": f"Zeekr {self.vin}",
+            "manufacturer": "Zeekr",
+        }
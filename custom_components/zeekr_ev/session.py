@@ -0,0 +1,79 @@
+"""Persisted, encrypted auth session for Zeekr EV API Integration."""
+
+from __future__ import annotations
+
+import base64
+from datetime import datetime, timedelta
+import hashlib
+import json
+import logging
+from typing import Any
+
+from cryptography.fernet import Fernet, InvalidToken
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+SESSION_VERSION = 1
+# Sessions older than this are discarded and the client logs in again
+SESSION_MAX_AGE = timedelta(days=30)
+# Never written to disk; the config entry already holds them
+SESSION_EXCLUDED_KEYS = ("password",)
+
+
+class ZeekrSessionStore:
+    """Keep the client's auth tokens on disk between restarts.
+
+    The session is encrypted with a key derived from the entry and the
+    account password, so changing the password invalidates it.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str, password: str) -> None:
+        """Initialize the store for one config entry."""
+        self._store: Store = Store(
+            hass, SESSION_VERSION, f"{DOMAIN}.{entry_id}.session"
+        )
+        digest = hashlib.sha256(f"{entry_id}:{password}".encode()).digest()
+        self._fernet = Fernet(base64.urlsafe_b64encode(digest))
+
+    async def async_load(self) -> dict[str, Any] | None:
+        """Return the saved session, or None if missing, stale or unreadable."""
+        try:
+            stored = await self._store.async_load()
+        except Exception as ex:  # noqa: BLE001
+            _LOGGER.warning("Could not load auth session: %s", ex)
+            return None
+        if not isinstance(stored, dict) or not stored.get("session"):
+            return None
+
+        try:
+            saved_at = datetime.fromisoformat(stored["saved_at"])
+        except (KeyError, TypeError, ValueError):
+            return None
+        if datetime.now() - saved_at > SESSION_MAX_AGE:
+            _LOGGER.debug("Saved auth session expired")
+            return None
+
+        try:
+            session = json.loads(self._fernet.decrypt(stored["session"].encode()))
+        except (InvalidToken, ValueError, TypeError):
+            _LOGGER.debug("Saved auth session could not be decrypted")
+            return None
+        return session if isinstance(session, dict) else None
+
+    def async_save(self, session: dict[str, Any]) -> None:
+        """Encrypt and save the session after a short delay."""
+        session = {
+            key: value
+            for key, value in session.items()
+            if key not in SESSION_EXCLUDED_KEYS
+        }
+        payload = {
+            "session": self._fernet.encrypt(json.dumps(session).encode()).decode(),
+            "saved_at": datetime.now().isoformat(),
+        }
+        self._store.async_delay_save(lambda: payload, 1)
@@ -0,0 +1,55 @@
+"""Persisted vehicle snapshot for Zeekr EV API Integration."""
+
+from __future__ import annotations
+
+from datetime import datetime
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+SNAPSHOT_VERSION = 1
+# Coalesce saves from back-to-back polls (seconds)
+SNAPSHOT_SAVE_DELAY = 30
+
+
+class ZeekrSnapshot:
+    """Keep the last good coordinator data and vehicle list on disk.
+
+    Lets entities start with last-known values while the integration logs
+    in and refreshes in the background.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the store for one config entry."""
+        self._store: Store = Store(
+            hass, SNAPSHOT_VERSION, f"{DOMAIN}.{entry_id}.snapshot"
+        )
+
+    async def async_load(self) -> dict[str, Any] | None:
+        """Return the saved snapshot, or None if there is no usable one."""
+        try:
+            stored = await self._store.async_load()
+        except Exception as ex:  # noqa: BLE001
+            _LOGGER.warning("Could not load vehicle snapshot: %s", ex)
+            return None
+        if not isinstance(stored, dict) or not stored.get("data"):
+            return None
+        return stored
+
+    def async_schedule_save(self, data: dict, vehicles: list) -> None:
+        """Save the snapshot after a short delay."""
+        payload = {
+            "data": data,
+            "vehicles": [
+                {"vin": vehicle.vin, "data": getattr(vehicle, "data", {})}
+                for vehicle in vehicles
+            ],
+            "saved_at": datetime.now().isoformat(),
+        }
+        self._store.async_delay_save(lambda: payload, SNAPSHOT_SAVE_DELAY)
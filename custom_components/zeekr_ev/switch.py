@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import asyncio
 import logging
 from typing import Any
 
@@ -12,8 +11,15 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
-from .coordinator import ZeekrCoordinator
+from .confirm import AnyExcept
+from .const import (
+    DOMAIN,
+    ENDPOINT_CHARGE_PLAN,
+    ENDPOINT_REMOTE_CONTROL_STATE,
+    ENDPOINT_STATUS,
+    ENDPOINT_TRAVEL_PLAN,
+)
+from .coordinator import ZeekrCoordinator, vehicle_context
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -72,11 +78,15 @@ class ZeekrSwitch(CoordinatorEntity[ZeekrCoordinator], SwitchEntity):
         status_group: str = "climateStatus",
     ) -> None:
         """Initialize the switch entity."""
-        super().__init__(coordinator)
-        self.vin = vin
-        self.field = field
         self.status_key = status_key or field
         self.status_group = status_group
+        if field == "charging":
+            path = ("additionalVehicleStatus", "electricVehicleStatus", "chargerState")
+        else:
+            path = ("additionalVehicleStatus", status_group, self.status_key)
+        super().__init__(coordinator, context=vehicle_context(vin, path))
+        self.vin = vin
+        self.field = field
         self._attr_name = label
         self._attr_unique_id = f"{vin}_{field}"
         if field == "charging":
@@ -191,52 +201,13 @@ class ZeekrSwitch(CoordinatorEntity[ZeekrCoordinator], SwitchEntity):
             return
 
         if setting:
-            await self.coordinator.async_inc_invoke()
-            await self.hass.async_add_executor_job(
-                vehicle.do_remote_control, command, service_id, setting
+            await self.coordinator.async_send_command(
+                vehicle, command, service_id, setting
             )
 
-            if self.field == "charging":
-                # Wait for backend confirmation for charging
-                timeout = 30  # seconds
-                poll_interval = 2
-                waited = 0
-                charging_confirmed = False
-                while waited < timeout:
-                    try:
-                        # Poll all endpoints used by iOS app for confirmation
-                        status = await self.hass.async_add_executor_job(vehicle.get_charging_status)
-                        await asyncio.sleep(poll_interval)
-                        waited += poll_interval
-                        charger_state = (
-                            status.get("chargerState")
-                            if isinstance(status, dict) else None
-                        )
-                        # iOS trace: chargerState==2 is charging, 25 is stopped
-                        if charger_state is not None and str(charger_state) in ("1", "2"):
-                            charging_confirmed = True
-                            break
-                    except Exception as e:
-                        _LOGGER.info("Error while polling for charging status confirmation: %s", e)
-                        pass
-                if charging_confirmed:
-                    self._update_local_state_optimistically(is_on=True)
-                else:
-                    self._update_local_state_optimistically(is_on=False)
-                self.async_write_ha_state()
-            elif self.field == "sentry_mode":
-                self._update_local_state_optimistically(is_on=True)
-                self.async_write_ha_state()
-
-                async def delayed_refresh():
-                    await asyncio.sleep(10)
-                    await self.coordinator.async_request_refresh()
-
-                self.hass.async_create_task(delayed_refresh())
-            else:
-                self._update_local_state_optimistically(is_on=True)
-                self.async_write_ha_state()
-                await self.coordinator.async_request_refresh()
+            self._update_local_state_optimistically(is_on=True)
+            self.async_write_ha_state()
+            self._confirm_state(is_on=True)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the switch off."""
@@ -296,20 +267,37 @@ class ZeekrSwitch(CoordinatorEntity[ZeekrCoordinator], SwitchEntity):
             return
 
         if setting:
-            await self.coordinator.async_inc_invoke()
-            await self.hass.async_add_executor_job(
-                vehicle.do_remote_control, command, service_id, setting
+            await self.coordinator.async_send_command(
+                vehicle, command, service_id, setting
             )
             self._update_local_state_optimistically(is_on=False)
             self.async_write_ha_state()
-            if self.field == "sentry_mode":
-                async def delayed_refresh():
-                    await asyncio.sleep(10)
-                    await self.coordinator.async_request_refresh()
+            self._confirm_state(is_on=False)
 
-                self.hass.async_create_task(delayed_refresh())
-            else:
-                await self.coordinator.async_request_refresh()
+    def _confirm_state(self, is_on: bool) -> None:
+        """Poll the endpoint behind this switch until it reports the new state.
+
+        Runs in the background, so the service call returns straight away; a
+        newer command for the same switch cancels the pending confirmation.
+        """
+        if self.field == "charging":
+            # iOS trace: chargerState 1/2 is charging, 25/26 is stopped
+            path = ("additionalVehicleStatus", "electricVehicleStatus", "chargerState")
+            expected = ("1", "2") if is_on else AnyExcept(("1", "2"))
+            self.coordinator.async_confirm(self.vin, ENDPOINT_STATUS, {path: expected})
+            return
+        if self.status_group == "remoteControlState":
+            endpoint = ENDPOINT_REMOTE_CONTROL_STATE
+        else:
+            endpoint = ENDPOINT_STATUS
+        # Off is whatever is_on does not read as on
+        if self.field == "sentry_mode":
+            on = ("1", "true")
+        else:
+            on = ("1",)
+        expected = on if is_on else AnyExcept(on)
+        path = ("additionalVehicleStatus", self.status_group, self.status_key)
+        self.coordinator.async_confirm(self.vin, endpoint, {path: expected})
 
     def _update_local_state_optimistically(self, is_on: bool) -> None:
         """Update the coordinator data to reflect the change immediately."""
@@ -358,7 +346,7 @@ class ZeekrChargingScheduleSwitch(CoordinatorEntity[ZeekrCoordinator], SwitchEnt
 
     def __init__(self, coordinator: ZeekrCoordinator, vin: str) -> None:
         """Initialize the charging schedule switch."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=vehicle_context(vin, ("chargePlan",)))
         self.vin = vin
         self._attr_name = "Charge Plan"
         self._attr_unique_id = f"{vin}_charging_schedule"
@@ -398,8 +386,8 @@ class ZeekrChargingScheduleSwitch(CoordinatorEntity[ZeekrCoordinator], SwitchEnt
         bc_cycle = current_plan.get("bcCycleActive", False)
         bc_temp = current_plan.get("bcTempActive", False)
 
-        await self.coordinator.async_inc_invoke()
-        await self.hass.async_add_executor_job(
+        self.coordinator.inc_invoke()
+        await self.coordinator.async_call(
             vehicle.set_charge_plan,
             start_time,
             end_time,
@@ -407,6 +395,7 @@ class ZeekrChargingScheduleSwitch(CoordinatorEntity[ZeekrCoordinator], SwitchEnt
             bc_cycle,
             bc_temp,
         )
+        self.coordinator.invalidate_endpoint(self.vin, ENDPOINT_CHARGE_PLAN)
 
         # Optimistic update
         plan_data = self.coordinator.data.setdefault(self.vin, {}).setdefault("chargePlan", {})
@@ -431,7 +420,7 @@ class ZeekrTravelPlanSwitch(CoordinatorEntity[ZeekrCoordinator], SwitchEntity):
 
     def __init__(self, coordinator: ZeekrCoordinator, vin: str) -> None:
         """Initialize the travel plan switch."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=vehicle_context(vin, ("travelPlan",)))
         self.vin = vin
         self._attr_name = "Travel Plan"
         self._attr_unique_id = f"{vin}_travel_plan"
@@ -472,8 +461,8 @@ class ZeekrTravelPlanSwitch(CoordinatorEntity[ZeekrCoordinator], SwitchEntity):
         bw = current_plan.get("bw", "0")
         steering_wheel_heating = bw not in ("0", "", None)
 
-        await self.coordinator.async_inc_invoke()
-        await self.hass.async_add_executor_job(
+        self.coordinator.inc_invoke()
+        await self.coordinator.async_call(
             vehicle.set_travel_plan,
             command,
             "",  # start_time
@@ -481,6 +470,7 @@ class ZeekrTravelPlanSwitch(CoordinatorEntity[ZeekrCoordinator], SwitchEntity):
             ac_preconditioning,
             steering_wheel_heating,
         )
+        self.coordinator.invalidate_endpoint(self.vin, ENDPOINT_TRAVEL_PLAN)
 
         # Optimistic update
         plan_data = self.coordinator.data.setdefault(self.vin, {}).setdefault("travelPlan", {})
@@ -505,7 +495,7 @@ class ZeekrDepartureACSwitch(CoordinatorEntity[ZeekrCoordinator], SwitchEntity):
 
     def __init__(self, coordinator: ZeekrCoordinator, vin: str) -> None:
         """Initialize the departure AC switch."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=vehicle_context(vin, ("travelPlan",)))
         self.vin = vin
         self._attr_name = "Departure AC"
         self._attr_unique_id = f"{vin}_departure_ac"
@@ -545,8 +535,8 @@ class ZeekrDepartureACSwitch(CoordinatorEntity[ZeekrCoordinator], SwitchEntity):
         bw = current_plan.get("bw", "0")
         steering_wheel_heating = bw not in ("0", "", None)
 
-        await self.coordinator.async_inc_invoke()
-        await self.hass.async_add_executor_job(
+        self.coordinator.inc_invoke()
+        await self.coordinator.async_call(
             vehicle.set_travel_plan,
             command,
             "",  # start_time
@@ -554,6 +544,7 @@ class ZeekrDepartureACSwitch(CoordinatorEntity[ZeekrCoordinator], SwitchEntity):
             ac_on,
             steering_wheel_heating,
         )
+        self.coordinator.invalidate_endpoint(self.vin, ENDPOINT_TRAVEL_PLAN)
 
         # Optimistic update
         plan_data = self.coordinator.data.setdefault(self.vin, {}).setdefault("travelPlan", {})
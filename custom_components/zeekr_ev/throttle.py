@@ -0,0 +1,87 @@
+"""Adaptive request throttle for Zeekr EV API Integration."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+
+_LOGGER = logging.getLogger(__name__)
+
+# Rate (requests per second) the throttle starts from on the first throttled
+# response, and above which it lets requests through unpaced again
+THROTTLE_INITIAL_RATE = 1.0
+THROTTLE_MIN_RATE = 1 / 60
+# Additive increase: THROTTLE_RATE_STEP more requests per second for every
+# THROTTLE_RECOVERY_PERIOD seconds without a throttled response
+THROTTLE_RATE_STEP = 0.05
+THROTTLE_RECOVERY_PERIOD = 60
+# Throttled responses this close together count as one (seconds)
+THROTTLE_DECREASE_HOLD = 5
+
+
+class ZeekrThrottle:
+    """Token bucket shared by every request of one account.
+
+    Requests are not paced until the backend throttles us. Each throttled
+    response then halves the rate, and every quiet minute adds a little
+    back until the bucket is lifted altogether. Priority requests (user
+    commands) queue only behind each other and push the background queue
+    back by one slot each.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an unlimited throttle."""
+        self.rate: float | None = None
+        self.throttled = 0
+        self._next_slot = 0.0
+        self._next_priority_slot = 0.0
+        self._last_change = 0.0
+
+    def _relax(self, now: float) -> None:
+        """Raise the rate for the quiet periods since it last changed."""
+        if self.rate is None:
+            return
+        periods = int((now - self._last_change) // THROTTLE_RECOVERY_PERIOD)
+        if periods <= 0:
+            return
+        self.rate += periods * THROTTLE_RATE_STEP
+        self._last_change += periods * THROTTLE_RECOVERY_PERIOD
+        if self.rate >= THROTTLE_INITIAL_RATE:
+            _LOGGER.info("No throttling for a while, no longer pacing requests")
+            self.rate = None
+
+    def reserve(self, priority: bool = False) -> float:
+        """Take the next slot and return how long to wait for it (seconds)."""
+        now = time.monotonic()
+        self._relax(now)
+        if self.rate is None:
+            return 0.0
+        interval = 1 / self.rate
+        if priority:
+            slot = max(now, self._next_priority_slot)
+            self._next_priority_slot = slot + interval
+            # Background requests not yet queued give up a slot instead
+            self._next_slot = max(self._next_slot, now) + interval
+        else:
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + interval
+        return slot - now
+
+    async def async_acquire(self, priority: bool = False) -> None:
+        """Wait until the next request may be sent."""
+        if (delay := self.reserve(priority)) > 0:
+            await asyncio.sleep(delay)
+
+    def record_throttled(self) -> None:
+        """Halve the rate after a throttled response."""
+        now = time.monotonic()
+        self.throttled += 1
+        self._relax(now)
+        if self.rate is not None and now - self._last_change < THROTTLE_DECREASE_HOLD:
+            return
+        self.rate = max(THROTTLE_MIN_RATE, (self.rate or THROTTLE_INITIAL_RATE) / 2)
+        self._last_change = now
+        _LOGGER.warning(
+            "Zeekr API is throttling requests, pacing to %.3f per second", self.rate
+        )
@@ -11,7 +11,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.restore_state import RestoreEntity
 
-from .const import DOMAIN
+from .const import DOMAIN, ENDPOINT_CHARGE_PLAN
 from .coordinator import ZeekrCoordinator
 from .entity import ZeekrEntity
 
@@ -61,7 +61,7 @@ class ZeekrChargeScheduleTime(ZeekrEntity, TimeEntity, RestoreEntity):
         plan_field: str,
     ) -> None:
         """Initialize the time entity."""
-        super().__init__(coordinator, vin)
+        super().__init__(coordinator, vin, paths=(("chargePlan", plan_field),))
         self._plan_field = plan_field
         self._attr_name = name
         self._attr_unique_id = f"{vin}_{key}"
@@ -117,8 +117,8 @@ class ZeekrChargeScheduleTime(ZeekrEntity, TimeEntity, RestoreEntity):
             start_time = current_start
             end_time = new_time_str
 
-        await self.coordinator.async_inc_invoke()
-        await self.hass.async_add_executor_job(
+        self.coordinator.inc_invoke()
+        await self.coordinator.async_call(
             vehicle.set_charge_plan,
             start_time,
             end_time,
@@ -126,6 +126,7 @@ class ZeekrChargeScheduleTime(ZeekrEntity, TimeEntity, RestoreEntity):
             bc_cycle,
             bc_temp,
         )
+        self.coordinator.invalidate_endpoint(self.vin, ENDPOINT_CHARGE_PLAN)
 
         # Optimistic update
         self._fallback_value = value
@@ -0,0 +1,82 @@
+"""Bounded worker pool for blocking Zeekr API calls."""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import logging
+import threading
+import time
+from typing import Any, Callable
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ZeekrWorkerPool:
+    """Run blocking client calls on a per-account thread pool.
+
+    Keeps the integration from flooding Home Assistant's shared executor
+    and records how long jobs wait for a free worker.
+    """
+
+    def __init__(self, max_workers: int, name: str = "zeekr_ev") -> None:
+        """Initialize the pool."""
+        self.max_workers = max(1, int(max_workers))
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix=name
+        )
+        self._lock = threading.Lock()
+        self.queued = 0
+        self.active = 0
+        self.completed = 0
+        self.last_wait = 0.0
+        self.max_wait = 0.0
+        self._total_wait = 0.0
+
+    @property
+    def queue_depth(self) -> int:
+        """Return the number of jobs waiting for a worker."""
+        return self.queued
+
+    @property
+    def average_wait(self) -> float:
+        """Return the mean time (seconds) jobs waited for a worker."""
+        if not self.completed:
+            return 0.0
+        return self._total_wait / self.completed
+
+    async def async_run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run func(*args) on the pool and return its result."""
+        submitted = time.monotonic()
+        with self._lock:
+            self.queued += 1
+
+        def _job():
+            wait = time.monotonic() - submitted
+            with self._lock:
+                self.queued -= 1
+                self.active += 1
+                self.last_wait = wait
+                self.max_wait = max(self.max_wait, wait)
+                self._total_wait += wait
+            try:
+                return func(*args)
+            finally:
+                with self._lock:
+                    self.active -= 1
+                    self.completed += 1
+
+        loop = asyncio.get_running_loop()
+        try:
+            future = loop.run_in_executor(self._executor, _job)
+        except RuntimeError:
+            # Submitted after shutdown; the job will never run
+            with self._lock:
+                self.queued -= 1
+            raise
+        return await future
+
+    def shutdown(self) -> None:
+        """Stop the workers, dropping jobs that have not started."""
+        _LOGGER.debug("Shutting down Zeekr worker pool (%d queued)", self.queued)
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,127 @@
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from custom_components.zeekr_ev.async_client import ZeekrAsyncClient
+
+zeekr_client = pytest.importorskip("zeekr_ev_api.client")
+
+
+class FakeResponse:
+    def __init__(self, payload):
+        self.status = 200
+        self._payload = payload
+
+    async def json(self, content_type=None):
+        return self._payload
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+
+class FakeSession:
+    def __init__(self, *payloads):
+        self.payloads = list(payloads)
+        self.calls = []
+
+    def request(self, method, url, headers=None, data=None, timeout=None):
+        self.calls.append({"method": method, "url": url, "headers": headers, "data": data})
+        return FakeResponse(self.payloads.pop(0))
+
+
+def _client():
+    client = zeekr_client.ZeekrClient(
+        username="user", password="pass", country_code="AU",
+        prod_secret="secret", vin_key="0123456789abcdef", vin_iv="0123456789abcdef",
+    )
+    client.load_session({"bearer_token": "bearer", "region_login_server": "https://example.com/"})
+    return client
+
+
+def _async_client(hass, client, session):
+    with patch("custom_components.zeekr_ev.async_client.async_get_clientsession", return_value=session):
+        return ZeekrAsyncClient.from_client(hass, client)
+
+
+@pytest.mark.asyncio
+async def test_get_status_is_signed(hass):
+    session = FakeSession({"success": True, "data": {"basicVehicleStatus": {}}})
+    async_client = _async_client(hass, _client(), session)
+
+    result = await async_client.vehicle("VIN1").get_status()
+
+    assert result == {"basicVehicleStatus": {}}
+    call = session.calls[0]
+    assert call["method"] == "GET"
+    assert call["url"].startswith("https://example.com/ms-vehicle-status/")
+    assert call["headers"]["X-SIGNATURE"]
+    assert call["headers"]["X-VIN"]
+    assert call["headers"]["authorization"] == "bearer"
+
+
+@pytest.mark.asyncio
+async def test_status_and_plan_failures_raise(hass):
+    session = FakeSession({"success": False}, {"success": False}, {"success": True, "data": {}})
+    async_client = _async_client(hass, _client(), session)
+
+    with pytest.raises(zeekr_client.ZeekrException):
+        await async_client.vehicle("VIN1").get_status()
+    # Unlike the sync client, so an unsupported plan counts as a failure
+    with pytest.raises(zeekr_client.ZeekrException):
+        await async_client.vehicle("VIN1").get_travel_plan()
+    assert await async_client.vehicle("VIN1").get_charge_plan() == {}
+
+
+@pytest.mark.asyncio
+async def test_remote_control_posts_body(hass):
+    session = FakeSession({"success": True})
+    async_client = _async_client(hass, _client(), session)
+
+    assert await async_client.vehicle("VIN1").do_remote_control("start", "RCS", {"a": 1}) is True
+    call = session.calls[0]
+    assert call["method"] == "POST"
+    assert "charge/control" in call["url"]
+    assert json.loads(call["data"]) == {"command": "start", "serviceId": "RCS", "setting": {"a": 1}}
+
+
+@pytest.mark.asyncio
+async def test_token_expired_refreshes_and_retries(hass):
+    session = FakeSession({"msg": "Token expired"}, {"success": True, "data": {"soc": "800"}})
+    client = _client()
+    client.login = MagicMock()
+    async_client = _async_client(hass, client, session)
+
+    assert await async_client.vehicle("VIN1").get_charging_limit() == {"soc": "800"}
+    client.login.assert_called_once_with(relogin=True)
+    assert len(session.calls) == 2
+
+
+def test_from_client_without_library_support(hass):
+    assert ZeekrAsyncClient.from_client(hass, MagicMock()) is None
+
+
+@pytest.mark.asyncio
+async def test_token_refresh_runs_on_worker_pool(hass):
+    session = FakeSession({"msg": "Token expired"}, {"success": True, "data": {}})
+    client = _client()
+    pool = MagicMock()
+    pool.async_run = AsyncMock()
+    with patch("custom_components.zeekr_ev.async_client.async_get_clientsession", return_value=session):
+        async_client = ZeekrAsyncClient.from_client(hass, client, pool)
+
+    await async_client.vehicle("VIN1").get_charging_limit()
+
+    pool.async_run.assert_awaited_once()
+    assert pool.async_run.call_args[0][1:] == (client, "bearer")
+
+
+def test_from_client_without_private_helpers(hass):
+    client = _client()
+    with patch.object(zeekr_client.network, "_refresh_token", None):
+        assert ZeekrAsyncClient.from_client(hass, client) is None
+    with patch.object(zeekr_client.ZeekrClient, "_get_encrypted_vin", None):
+        assert ZeekrAsyncClient.from_client(hass, client) is None
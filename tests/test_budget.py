@@ -0,0 +1,32 @@
+from datetime import datetime, timedelta
+
+from custom_components.zeekr_ev.budget import ZeekrRequestBudget
+
+
+def test_disabled_budget_has_no_limits():
+    budget = ZeekrRequestBudget(0)
+    assert budget.enabled is False
+    assert budget.remaining(5000) is None
+    assert budget.can_poll(5000) is True
+    assert budget.essential_only(5000) is False
+    assert budget.min_interval(5000, 3) is None
+
+
+def test_command_reserve_and_essential_only():
+    budget = ZeekrRequestBudget(1000)
+    assert budget.command_reserve == 100
+    assert budget.remaining(950) == 50
+    assert budget.essential_only(500) is False
+    assert budget.essential_only(700) is True
+    # Polls stop at the reserve, leaving requests for commands
+    assert budget.can_poll(899) is True
+    assert budget.can_poll(900) is False
+
+
+def test_min_interval_spreads_budget_until_midnight():
+    budget = ZeekrRequestBudget(1000)
+    noon = datetime(2024, 1, 1, 12, 0, 0)
+    # 900 pollable requests at 3 per poll over 12 hours = every 144 seconds
+    assert budget.min_interval(0, 3, noon) == timedelta(seconds=144)
+    # Nothing left for polls: wait until the daily reset
+    assert budget.min_interval(900, 3, noon) == timedelta(hours=12)
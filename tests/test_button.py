@@ -20,8 +20,16 @@ class MockCoordinator:
     def __init__(self, vehicles):
         self.vehicles = vehicles
         self.data = {v.vin: {} for v in vehicles}
-        self.async_inc_invoke = AsyncMock()
+        self.inc_invoke = MagicMock()
         self.async_request_refresh = AsyncMock()
+        self.async_refresh_vehicle = AsyncMock(return_value={})
+
+    async def async_call(self, func, *args):
+        return func(*args)
+
+    async def async_send_command(self, vehicle, command, service_id, setting):
+        self.inc_invoke()
+        return vehicle.do_remote_control(command, service_id, setting)
 
     def get_vehicle_by_vin(self, vin):
         for v in self.vehicles:
@@ -58,7 +66,7 @@ async def test_flash_blinkers_button():
 
     await button.async_press()
 
-    coordinator.async_inc_invoke.assert_called_once()
+    coordinator.inc_invoke.assert_called_once()
     vehicle.do_remote_control.assert_called_with(
         "start",
         "RHL",
@@ -84,7 +92,7 @@ async def test_honk_flash_button():
 
     await button.async_press()
 
-    coordinator.async_inc_invoke.assert_called_once()
+    coordinator.inc_invoke.assert_called_once()
     vehicle.do_remote_control.assert_called_with(
         "start",
         "RHL",
@@ -110,7 +118,7 @@ async def test_parking_comfort_disable_button():
 
     await button.async_press()
 
-    coordinator.async_inc_invoke.assert_called_once()
+    coordinator.inc_invoke.assert_called_once()
     vehicle.do_remote_control.assert_called_with(
         "stop",
         "PCM",
@@ -141,7 +149,8 @@ async def test_force_update_button():
     await button.async_press()
 
     # Should trigger a refresh
-    coordinator.async_request_refresh.assert_called_once()
+    coordinator.async_refresh_vehicle.assert_called_once_with("VIN1")
+    coordinator.async_request_refresh.assert_not_called()
     # State should now be set to the poll time
     assert button.state is not None
 
@@ -0,0 +1,42 @@
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from custom_components.zeekr_ev.capabilities import ZeekrCapabilities
+
+
+@pytest.mark.asyncio
+async def test_endpoint_skipped_after_repeated_failures(hass):
+    caps = ZeekrCapabilities(hass, "entry1")
+    caps._store.async_delay_save = MagicMock()
+
+    caps.record("VIN1", "travel_plan", False, "1.0")
+    caps.record("VIN1", "travel_plan", True, "1.0")
+    for _ in range(3):
+        assert caps.supported("VIN1", "travel_plan", "1.0")
+        caps.record("VIN1", "travel_plan", False, "1.0")
+
+    assert not caps.supported("VIN1", "travel_plan", "1.0")
+    assert caps.supported("VIN1", "charge_plan", "1.0")
+    caps._store.async_delay_save.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_endpoint_reprobed_after_os_update_or_a_day(hass):
+    caps = ZeekrCapabilities(hass, "entry1")
+    caps._store.async_delay_save = MagicMock()
+    yesterday = (datetime.now() - timedelta(days=1, minutes=1)).isoformat()
+    caps._store.async_load = AsyncMock(
+        return_value={"VIN1": {"os_version": "1.0", "unsupported": {"travel_plan": yesterday}}}
+    )
+    await caps.async_load()
+
+    # A day later it is tried again, and one more failure skips it again
+    assert caps.supported("VIN1", "travel_plan", "1.0")
+    caps.record("VIN1", "travel_plan", False, "1.0")
+    assert not caps.supported("VIN1", "travel_plan", "1.0")
+
+    # A new OS version probes everything
+    assert caps.supported("VIN1", "travel_plan", "2.0")
+    assert caps.unsupported("VIN1") == {}
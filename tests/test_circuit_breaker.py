@@ -0,0 +1,50 @@
+from unittest.mock import patch
+
+from custom_components.zeekr_ev.circuit_breaker import ZeekrCircuitBreaker
+
+MONOTONIC = "custom_components.zeekr_ev.circuit_breaker.time.monotonic"
+
+
+def test_breaker_opens_after_threshold_and_half_opens_after_cooldown():
+    breaker = ZeekrCircuitBreaker("status", threshold=3, base_cooldown=60)
+    with patch(MONOTONIC, return_value=1000):
+        breaker.record_failure()
+        breaker.record_failure()
+        assert breaker.state == "closed"
+        breaker.record_failure()
+        assert breaker.state == "open"
+        assert not breaker.allow()
+
+    with patch(MONOTONIC, return_value=1060):
+        assert breaker.state == "half_open"
+        # Only one trial call at a time
+        assert breaker.allow()
+        assert not breaker.allow()
+        breaker.record_success()
+        assert breaker.state == "closed"
+        assert breaker.allow()
+
+
+def test_ignored_failure_releases_the_trial():
+    breaker = ZeekrCircuitBreaker("status", threshold=1, base_cooldown=60)
+    with patch(MONOTONIC, return_value=0):
+        breaker.record_failure()
+    with patch(MONOTONIC, return_value=60):
+        assert breaker.allow()
+        breaker.record_ignored()
+        assert breaker.state == "half_open"
+        assert breaker.allow()
+
+
+def test_failed_trial_doubles_cooldown_up_to_max():
+    breaker = ZeekrCircuitBreaker("status", threshold=1, base_cooldown=60, max_cooldown=100)
+    with patch(MONOTONIC, return_value=0):
+        breaker.record_failure()
+    with patch(MONOTONIC, return_value=60):
+        assert breaker.allow()
+        breaker.record_failure()
+        assert breaker.retry_in() == 100
+    with patch(MONOTONIC, return_value=160):
+        assert breaker.allow()
+        breaker.record_failure()
+        assert breaker.retry_in() == 100
@@ -1,7 +1,8 @@
-from unittest.mock import MagicMock, AsyncMock
+from unittest.mock import MagicMock
 import pytest
 from homeassistant.components.climate import HVACMode
 from custom_components.zeekr_ev.climate import ZeekrClimate, async_setup_entry
+from custom_components.zeekr_ev.confirm import AnyExcept
 from custom_components.zeekr_ev.const import DOMAIN
 
 
@@ -17,9 +18,17 @@ class MockCoordinator:
     def __init__(self, data):
         self.data = data
         self.vehicles = {}
-        self.async_inc_invoke = AsyncMock()
+        self.inc_invoke = MagicMock()
+        self.async_confirm = MagicMock()
         self.ac_duration = 15
 
+    async def async_call(self, func, *args):
+        return func(*args)
+
+    async def async_send_command(self, vehicle, command, service_id, setting):
+        self.inc_invoke()
+        return vehicle.do_remote_control(command, service_id, setting)
+
     def get_vehicle_by_vin(self, vin):
         return self.vehicles.get(vin)
 
@@ -79,9 +88,9 @@ async def test_climate_optimistic_update():
     assert climate_status["preClimateActive"] == "1"
     climate.async_write_ha_state.assert_called()
 
-    # Verify Delayed Refresh Task Created
-    assert climate.hass.async_create_task.called
-    climate.hass.async_create_task.call_args[0][0].close()
+    # Verify confirmation scheduled against the climate status
+    path = ("additionalVehicleStatus", "climateStatus", "preClimateActive")
+    coordinator.async_confirm.assert_called_with(vin, "status", {path: ("1", "true")})
 
     # Test Turn Off
     await climate.async_set_hvac_mode(HVACMode.OFF)
@@ -105,9 +114,9 @@ async def test_climate_optimistic_update():
     assert climate_status["preClimateActive"] == "0"
     climate.async_write_ha_state.assert_called()
 
-    # Verify Delayed Refresh Task Created again
-    assert climate.hass.async_create_task.call_count == 2
-    climate.hass.async_create_task.call_args[0][0].close()
+    # Verify confirmation scheduled for the new state
+    coordinator.async_confirm.assert_called_with(vin, "status", {path: ("1", "true")})
+    assert isinstance(coordinator.async_confirm.call_args.args[2][path], AnyExcept)
 
 
 @pytest.mark.asyncio
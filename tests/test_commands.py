@@ -0,0 +1,94 @@
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from custom_components.zeekr_ev.commands import ZeekrCommandQueue
+
+
+class MockCoordinator:
+    def __init__(self):
+        self.inc_invoke = MagicMock()
+        self.hass = MagicMock()
+        self.entry = MagicMock()
+        self.entry.async_create_background_task.side_effect = (
+            lambda hass, coro, name: asyncio.get_running_loop().create_task(coro)
+        )
+
+    async def async_call(self, func, *args):
+        return func(*args)
+
+
+def _setting(*pairs):
+    return {"serviceParameters": [{"key": k, "value": v} for k, v in pairs]}
+
+
+@pytest.mark.asyncio
+async def test_climate_commands_are_merged():
+    coordinator = MockCoordinator()
+    queue = ZeekrCommandQueue(coordinator, window=0.01)
+    vehicle = MagicMock(vin="VIN1")
+    vehicle.do_remote_control.return_value = True
+
+    results = await asyncio.gather(
+        queue.async_send(vehicle, "start", "ZAF", _setting(("AC", "true"), ("AC.temp", "21"))),
+        queue.async_send(vehicle, "start", "ZAF", _setting(("SH.11", "true"))),
+        queue.async_send(vehicle, "start", "ZAF", _setting(("AC.temp", "22"))),
+    )
+
+    assert results == [True, True, True]
+    vehicle.do_remote_control.assert_called_once_with(
+        "start", "ZAF", _setting(("AC", "true"), ("SH.11", "true"), ("AC.temp", "22"))
+    )
+    coordinator.inc_invoke.assert_called_once()
+    assert queue.merged == 2
+
+
+@pytest.mark.asyncio
+async def test_other_commands_are_sent_individually_and_errors_propagate():
+    coordinator = MockCoordinator()
+    queue = ZeekrCommandQueue(coordinator, window=0.01)
+    vehicle = MagicMock(vin="VIN1")
+    vehicle.do_remote_control.side_effect = [True, True, Exception("rejected")]
+
+    assert await queue.async_send(vehicle, "start", "RDL", _setting(("door", "all"))) is True
+    assert await queue.async_send(vehicle, "stop", "ZAF", _setting(("AC", "false"))) is True
+    assert vehicle.do_remote_control.call_count == 2
+
+    with pytest.raises(Exception, match="rejected"):
+        await queue.async_send(vehicle, "start", "ZAF", _setting(("SW", "true")))
+
+
+@pytest.mark.asyncio
+async def test_replacing_a_base_key_drops_its_sub_parameters():
+    coordinator = MockCoordinator()
+    queue = ZeekrCommandQueue(coordinator, window=0.01)
+    vehicle = MagicMock(vin="VIN1")
+    vehicle.do_remote_control.return_value = True
+
+    await asyncio.gather(
+        queue.async_send(vehicle, "start", "ZAF", _setting(("AC", "true"), ("AC.temp", "21"), ("AC.duration", "15"))),
+        queue.async_send(vehicle, "start", "ZAF", _setting(("SH.11", "true"), ("SH.11.level", "3"))),
+        queue.async_send(vehicle, "start", "ZAF", _setting(("AC", "false"), ("SH.11", "false"))),
+    )
+
+    vehicle.do_remote_control.assert_called_once_with(
+        "start", "ZAF", _setting(("AC", "false"), ("SH.11", "false"))
+    )
+
+
+@pytest.mark.asyncio
+async def test_cancel_drops_pending_batches():
+    coordinator = MockCoordinator()
+    queue = ZeekrCommandQueue(coordinator, window=10)
+    vehicle = MagicMock(vin="VIN1")
+
+    send = asyncio.ensure_future(queue.async_send(vehicle, "start", "ZAF", _setting(("AC", "true"))))
+    await asyncio.sleep(0)
+    queue.async_cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await send
+    vehicle.do_remote_control.assert_not_called()
+    assert queue._batches == {}
+    assert queue._flushes == {}
@@ -0,0 +1,44 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from custom_components.zeekr_ev.confirm import AnyExcept, async_confirm_state, get_path, state_matches
+
+PATH = ("additionalVehicleStatus", "climateStatus", "preClimateActive")
+
+
+def _data(value):
+    return {"additionalVehicleStatus": {"climateStatus": {"preClimateActive": value}}}
+
+
+def test_state_matches_compares_as_lowercase_strings():
+    assert get_path(_data("1"), PATH) == "1"
+    assert get_path({}, PATH) is None
+    assert state_matches(_data(True), {PATH: ("1", "true")})
+    assert not state_matches(_data("0"), {PATH: ("1", "true")})
+
+
+def test_any_except_matches_every_other_reported_value():
+    off = AnyExcept(("1", "true"))
+    assert state_matches(_data("0"), {PATH: off})
+    assert state_matches(_data("2"), {PATH: off})
+    assert not state_matches(_data("True"), {PATH: off})
+    assert not state_matches({}, {PATH: off})
+
+
+@pytest.mark.asyncio
+async def test_confirm_stops_once_state_matches():
+    refresh = AsyncMock(side_effect=[None, _data("0"), _data("1"), _data("1")])
+
+    assert await async_confirm_state(refresh, {PATH: ("1",)}, steps=(0,), timeout=1) is True
+    assert refresh.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_confirm_reports_timeout_and_fetch_failure():
+    assert await async_confirm_state(
+        AsyncMock(return_value=_data("0")), {PATH: ("1",)}, steps=(0.01,), timeout=0.05
+    ) is False
+    assert await async_confirm_state(
+        AsyncMock(return_value=None), {PATH: ("1",)}, steps=(0.01,), timeout=0.05
+    ) is None
@@ -1,8 +1,17 @@
 from unittest.mock import MagicMock, AsyncMock, patch
 import pytest
 import asyncio
-from custom_components.zeekr_ev.coordinator import ZeekrCoordinator
-from custom_components.zeekr_ev.const import DOMAIN
+import sys
+import time
+from datetime import timedelta
+from custom_components.zeekr_ev.coordinator import (
+    ZeekrCoordinator,
+    changed_paths,
+    flatten_snapshot,
+    vehicle_context,
+)
+from custom_components.zeekr_ev.const import DOMAIN, ENDPOINTS
+from homeassistant.helpers.update_coordinator import UpdateFailed
 
 
 class MockVehicle:
@@ -45,8 +54,10 @@ def mock_data_update_coordinator_init(self, hass, logger, name, update_interval=
     self.logger = logger
     self.name = name
     self.update_interval = update_interval
-    self._listeners = []
+    self._listeners = {}
     self._micro_controller = MagicMock()
+    self.data = None
+    self.last_update_success = True
 
 
 @pytest.mark.asyncio
@@ -76,8 +87,8 @@ async def test_coordinator_update_all_calls_made():
     # Mock stats
     coordinator.request_stats = MagicMock()
     coordinator.request_stats.async_load = AsyncMock()
-    coordinator.request_stats.async_inc_request = AsyncMock()
-    coordinator.request_stats.async_inc_invoke = AsyncMock()
+    coordinator.request_stats.inc_request = MagicMock()
+    coordinator.request_stats.inc_invoke = MagicMock()
 
     try:
         # Run update
@@ -138,8 +149,8 @@ async def test_coordinator_update_multiple_vehicles():
     # Mock stats
     coordinator.request_stats = MagicMock()
     coordinator.request_stats.async_load = AsyncMock()
-    coordinator.request_stats.async_inc_request = AsyncMock()
-    coordinator.request_stats.async_inc_invoke = AsyncMock()
+    coordinator.request_stats.inc_request = MagicMock()
+    coordinator.request_stats.inc_invoke = MagicMock()
 
     try:
         # Run update
@@ -166,7 +177,7 @@ async def test_coordinator_update_multiple_vehicles():
 
 
 @pytest.mark.asyncio
-async def test_coordinator_update_status_failure_skips_others():
+async def test_coordinator_update_status_failure_drops_vehicle():
     vin = "VIN1"
     vehicle = MockVehicle(vin)
     # Mock status failure
@@ -181,7 +192,7 @@ async def test_coordinator_update_status_failure_skips_others():
     # Mock stats
     coordinator.request_stats = MagicMock()
     coordinator.request_stats.async_load = AsyncMock()
-    coordinator.request_stats.async_inc_request = AsyncMock()
+    coordinator.request_stats.inc_request = MagicMock()
 
     try:
         # Run update
@@ -190,12 +201,9 @@ async def test_coordinator_update_status_failure_skips_others():
         # Status called
         vehicle.get_status.assert_called_once()
 
-        # Others should NOT be called
-        vehicle.get_remote_control_state.assert_not_called()
-        vehicle.get_charging_status.assert_not_called()
-        vehicle.get_charging_limit.assert_not_called()
-        vehicle.get_charge_plan.assert_not_called()
-        vehicle.get_travel_plan.assert_not_called()
+        # The others run alongside status and are cached for the next poll
+        vehicle.get_remote_control_state.assert_called_once()
+        vehicle.get_travel_plan.assert_called_once()
 
         # No data for this VIN
         assert vin not in data
@@ -224,7 +232,7 @@ async def test_coordinator_update_charging_limit_failure():
     # Mock stats
     coordinator.request_stats = MagicMock()
     coordinator.request_stats.async_load = AsyncMock()
-    coordinator.request_stats.async_inc_request = AsyncMock()
+    coordinator.request_stats.inc_request = MagicMock()
 
     try:
         # Run update
@@ -239,3 +247,919 @@ async def test_coordinator_update_charging_limit_failure():
     finally:
         if coordinator._unsub_reset:
             coordinator._unsub_reset()
+
+
+@pytest.mark.asyncio
+async def test_coordinator_skips_endpoints_not_due():
+    vin = "VIN1"
+    vehicle = MockVehicle(vin)
+    vehicle.get_status.return_value = {}
+    vehicle.get_remote_control_state.return_value = {"remote": "ok"}
+    vehicle.get_charging_status.return_value = {"status": "ok"}
+    vehicle.get_charging_limit.return_value = {"soc": "800"}
+    vehicle.get_charge_plan.return_value = {"startTime": "00:00"}
+    vehicle.get_travel_plan.return_value = {"scheduledTime": "1700000000000"}
+
+    client = MockClient([vehicle])
+    hass = DummyHass()
+
+    with patch("homeassistant.helpers.update_coordinator.DataUpdateCoordinator.__init__", side_effect=mock_data_update_coordinator_init, autospec=True):
+        coordinator = ZeekrCoordinator(hass, client, DummyConfig())
+
+    coordinator.request_stats = MagicMock()
+    coordinator.request_stats.inc_request = MagicMock()
+
+    try:
+        await coordinator._async_update_data()
+        vehicle.get_status.return_value = {}
+        data = await coordinator._async_update_data()
+
+        # Fast-changing endpoints are fetched on every poll
+        assert vehicle.get_status.call_count == 2
+        assert vehicle.get_remote_control_state.call_count == 2
+        assert vehicle.get_charging_status.call_count == 2
+
+        # Slow-changing endpoints are served from the section cache
+        vehicle.get_charging_limit.assert_called_once()
+        vehicle.get_charge_plan.assert_called_once()
+        vehicle.get_travel_plan.assert_called_once()
+        assert data[vin]["chargingLimit"]["soc"] == "800"
+        assert data[vin]["chargePlan"]["startTime"] == "00:00"
+        assert data[vin]["travelPlan"]["scheduledTime"] == "1700000000000"
+
+        # Invalidating an endpoint makes it due on the next poll
+        coordinator.invalidate_endpoint(vin, "charge_plan")
+        vehicle.get_status.return_value = {}
+        await coordinator._async_update_data()
+        assert vehicle.get_charge_plan.call_count == 2
+        vehicle.get_travel_plan.assert_called_once()
+    finally:
+        if coordinator._unsub_reset:
+            coordinator._unsub_reset()
+
+
+@pytest.mark.asyncio
+async def test_empty_sections_are_cached_and_copied():
+    vin = "VIN1"
+    vehicle = MockVehicle(vin)
+    vehicle.get_status.side_effect = lambda: {}
+    vehicle.get_remote_control_state.return_value = {}
+    vehicle.get_charging_status.return_value = {}
+    vehicle.get_charging_limit.return_value = {"soc": "800"}
+    vehicle.get_charge_plan.return_value = {}
+    vehicle.get_travel_plan.return_value = {}
+    hass = DummyHass()
+
+    with patch("homeassistant.helpers.update_coordinator.DataUpdateCoordinator.__init__", new=mock_data_update_coordinator_init):
+        coordinator = ZeekrCoordinator(hass, MockClient([vehicle]), DummyConfig())
+    coordinator.request_stats.inc_request = MagicMock()
+
+    data = await coordinator._async_update_data()
+    # An optimistic write into the published data leaves the cache alone
+    data[vin]["chargingLimit"]["soc"] = "900"
+    data = await coordinator._async_update_data()
+
+    # No plan set is still an answer: it waits for its interval
+    vehicle.get_charge_plan.assert_called_once()
+    vehicle.get_travel_plan.assert_called_once()
+    assert "chargePlan" not in data[vin]
+    assert data[vin]["chargingLimit"] == {"soc": "800"}
+
+
+@pytest.mark.asyncio
+async def test_coordinator_polls_vehicles_by_mode():
+    parked = MockVehicle("VIN1")
+    parked.get_status.return_value = {"basicVehicleStatus": {"usageMode": "1", "engineStatus": "engine-off"}}
+    driving = MockVehicle("VIN2")
+    driving.get_status.return_value = {"basicVehicleStatus": {"usageMode": "4", "engineStatus": "engine-running"}}
+    for vehicle in (parked, driving):
+        for method in ("get_remote_control_state", "get_charging_status", "get_charging_limit", "get_charge_plan", "get_travel_plan"):
+            getattr(vehicle, method).return_value = {}
+
+    client = MockClient([parked, driving])
+    hass = DummyHass()
+
+    with patch("homeassistant.helpers.update_coordinator.DataUpdateCoordinator.__init__", side_effect=mock_data_update_coordinator_init, autospec=True):
+        coordinator = ZeekrCoordinator(hass, client, DummyConfig())
+
+    coordinator.request_stats = MagicMock()
+    coordinator.request_stats.inc_request = MagicMock()
+
+    try:
+        coordinator.data = await coordinator._async_update_data()
+        assert coordinator.polling_modes == {"VIN1": "parked", "VIN2": "driving"}
+        assert coordinator.vehicle_intervals["VIN1"] == timedelta(minutes=60)
+        assert coordinator.vehicle_intervals["VIN2"] == timedelta(minutes=1)
+        assert coordinator.update_interval == timedelta(minutes=1)
+
+        # Only the driving car is due on the next tick
+        coordinator._next_poll["VIN2"] = 0
+        coordinator.data = await coordinator._async_update_data()
+        assert parked.get_status.call_count == 1
+        assert driving.get_status.call_count == 2
+        assert "VIN1" in coordinator.data
+
+        # A manual refresh polls every vehicle
+        coordinator._poll_all = True
+        await coordinator._async_update_data()
+        assert parked.get_status.call_count == 2
+        assert driving.get_status.call_count == 3
+    finally:
+        if coordinator._unsub_reset:
+            coordinator._unsub_reset()
+
+
+@pytest.mark.asyncio
+async def test_async_call_prefers_native_transport():
+    class Vehicle:
+        vin = "VIN1"
+
+        def get_status(self):
+            return {"sync": True}
+
+        def get_journey_log(self):
+            return {"journey": True}
+
+    class NativeVehicle:
+        async def get_status(self):
+            return {"native": True}
+
+    hass = DummyHass()
+    async_client = MagicMock()
+    async_client.vehicle.return_value = NativeVehicle()
+
+    with patch("homeassistant.helpers.update_coordinator.DataUpdateCoordinator.__init__", side_effect=mock_data_update_coordinator_init, autospec=True):
+        coordinator = ZeekrCoordinator(hass, MockClient([]), DummyConfig(), async_client=async_client)
+
+    try:
+        vehicle = Vehicle()
+        assert await coordinator.async_call(vehicle.get_status) == {"native": True}
+        hass.async_add_executor_job.assert_not_called()
+
+        # Methods without a native version fall back to the executor
+        assert await coordinator.async_call(vehicle.get_journey_log) == {"journey": True}
+        hass.async_add_executor_job.assert_called_once()
+    finally:
+        if coordinator._unsub_reset:
+            coordinator._unsub_reset()
+
+
+@pytest.mark.asyncio
+async def test_coordinator_respects_request_budget():
+    vehicle = MockVehicle("VIN1")
+    vehicle.get_status.return_value = {}
+    for method in ("get_remote_control_state", "get_charging_status", "get_charging_limit", "get_charge_plan", "get_travel_plan"):
+        getattr(vehicle, method).return_value = {}
+
+    config = DummyConfig()
+    config.data["daily_request_budget"] = 100
+    with patch("homeassistant.helpers.update_coordinator.DataUpdateCoordinator.__init__", side_effect=mock_data_update_coordinator_init, autospec=True):
+        coordinator = ZeekrCoordinator(DummyHass(), MockClient([vehicle]), config)
+
+    coordinator.request_stats = MagicMock()
+    coordinator.request_stats.inc_request = MagicMock()
+
+    try:
+        # Low budget: only the status endpoint is polled
+        coordinator.request_stats.api_requests_today = 80
+        coordinator.vehicles = [vehicle]
+        coordinator.data = await coordinator._async_update_data()
+        assert coordinator.essential_only is True
+        vehicle.get_status.assert_called_once()
+        vehicle.get_remote_control_state.assert_not_called()
+
+        # Budget spent: the poll is skipped and the last snapshot kept
+        coordinator.request_stats.api_requests_today = 95
+        coordinator._poll_all = True
+        assert await coordinator._async_update_data() is coordinator.data
+        vehicle.get_status.assert_called_once()
+    finally:
+        if coordinator._unsub_reset:
+            coordinator._unsub_reset()
+
+
+def test_flatten_and_diff_snapshots():
+    old = flatten_snapshot({"VIN1": {"a": {"b": 1, "c": 2}, "d": []}})
+    assert old == {("VIN1", "a", "b"): 1, ("VIN1", "a", "c"): 2, ("VIN1", "d"): []}
+    new = flatten_snapshot({"VIN1": {"a": {"b": 1}, "d": [], "e": 3}})
+    assert changed_paths(old, new) == {("VIN1", "a", "c"), ("VIN1", "e")}
+
+
+def test_listeners_woken_only_for_changed_paths():
+    hass = DummyHass()
+    with patch("homeassistant.helpers.update_coordinator.DataUpdateCoordinator.__init__", side_effect=mock_data_update_coordinator_init, autospec=True):
+        coordinator = ZeekrCoordinator(hass, MockClient([]), DummyConfig())
+
+    calls = []
+    contexts = {
+        "soc": vehicle_context("VIN1", ("status", "soc")),
+        "range": vehicle_context("VIN1", ("status", "range")),
+        "vehicle": vehicle_context("VIN1"),
+        "other": vehicle_context("VIN2"),
+        "global": None,
+    }
+    for name, context in contexts.items():
+        coordinator._listeners[name] = (lambda name=name: calls.append(name), context)
+
+    try:
+        coordinator.data = {"VIN1": {"status": {"soc": 50, "range": 300}}, "VIN2": {"x": 1}}
+        coordinator.async_update_listeners()
+        assert sorted(calls) == ["global", "other", "range", "soc", "vehicle"]
+
+        calls.clear()
+        coordinator.data = {"VIN1": {"status": {"soc": 51, "range": 300}}, "VIN2": {"x": 1}}
+        coordinator.async_update_listeners()
+        assert sorted(calls) == ["global", "soc", "vehicle"]
+
+        # An optimistic write reverted by the next poll still wakes the entity
+        calls.clear()
+        coordinator.data["VIN1"]["status"]["range"] = 999
+
+        def base_set_updated_data(self, data):
+            self.data = data
+            self.async_update_listeners()
+
+        with patch("homeassistant.helpers.update_coordinator.DataUpdateCoordinator.async_set_updated_data", base_set_updated_data):
+            coordinator.async_set_updated_data({"VIN1": {"status": {"soc": 51, "range": 300}}, "VIN2": {"x": 1}})
+        assert sorted(calls) == ["global", "range", "vehicle"]
+
+        # A change in availability updates everything
+        calls.clear()
+        coordinator.last_update_success = False
+        coordinator.async_update_listeners()
+        assert sorted(calls) == ["global", "other", "range", "soc", "vehicle"]
+    finally:
+        if coordinator._unsub_reset:
+            coordinator._unsub_reset()
+
+
+@pytest.mark.asyncio
+async def test_refresh_vehicle_leaves_poll_schedule_alone():
+    hass = DummyHass()
+    vehicle = MockVehicle("VIN1")
+    vehicle.get_status.return_value = {"basicVehicleStatus": {"speed": "5"}}
+    with patch("homeassistant.helpers.update_coordinator.DataUpdateCoordinator.__init__", new=mock_data_update_coordinator_init):
+        coordinator = ZeekrCoordinator(hass, MockClient([vehicle]), DummyConfig())
+    coordinator.vehicles = [vehicle]
+    coordinator.request_stats.inc_request = MagicMock()
+    coordinator.data = {"VIN1": {}, "VIN2": {"x": 1}}
+    coordinator.data_index = flatten_snapshot(coordinator.data)
+    speed = MagicMock()
+    other = MagicMock()
+    coordinator._listeners["speed"] = (speed, vehicle_context("VIN1", ("basicVehicleStatus", "speed")))
+    coordinator._listeners["other"] = (other, vehicle_context("VIN2"))
+    coordinator._schedule_refresh = MagicMock()
+
+    with patch("homeassistant.helpers.update_coordinator.DataUpdateCoordinator.async_set_updated_data") as set_updated_data:
+        await coordinator.async_refresh_vehicle("VIN1", ["status"])
+
+    set_updated_data.assert_not_called()
+    coordinator._schedule_refresh.assert_not_called()
+    assert coordinator.data["VIN1"]["basicVehicleStatus"] == {"speed": "5"}
+    speed.assert_called_once()
+    other.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_restore_snapshot_and_login_on_first_poll():
+    class RestoredVehicle:
+        def __init__(self, client, vin, data):
+            self.client = client
+            self.vin = vin
+            self.data = data
+
+    hass = DummyHass()
+    client = MockClient([])
+    client.logged_in = False
+    client.login = MagicMock(side_effect=lambda relogin=False: setattr(client, "logged_in", True))
+    with patch("homeassistant.helpers.update_coordinator.DataUpdateCoordinator.__init__", new=mock_data_update_coordinator_init):
+        coordinator = ZeekrCoordinator(hass, client, DummyConfig())
+    coordinator.request_stats.inc_request = MagicMock()
+    coordinator.snapshot.async_load = AsyncMock(return_value={
+        "data": {"VIN1": {"basicVehicleStatus": {"speed": "0"}}},
+        "vehicles": [{"vin": "VIN1", "data": {"vin": "VIN1"}}],
+        "saved_at": "2024-01-01T00:00:00",
+    })
+
+    with patch.object(sys.modules[__name__], "Vehicle", RestoredVehicle, create=True):
+        assert await coordinator.async_restore_snapshot() is True
+
+    assert coordinator.get_vehicle_by_vin("VIN1").client is client
+    assert coordinator.data_index[("VIN1", "basicVehicleStatus", "speed")] == "0"
+    assert coordinator.latest_poll_time == "2024-01-01T00:00:00"
+
+    # Without a saved snapshot setup falls back to the blocking first refresh
+    coordinator.snapshot.async_load = AsyncMock(return_value=None)
+    assert await coordinator.async_restore_snapshot() is False
+
+    coordinator._async_update_vehicle = AsyncMock(return_value=None)
+    await coordinator._async_update_data()
+    client.login.assert_called_once()
+    # The first poll after a restore reads the vehicle list again
+    client.get_vehicle_list.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_vehicle_list_is_reconciled_after_restore_and_daily():
+    hass = DummyHass()
+    hass.async_create_task = MagicMock(side_effect=lambda coro: coro.close())
+    hass.config_entries = MagicMock()
+    vehicle1 = MockVehicle("VIN1")
+    vehicle2 = MockVehicle("VIN2")
+    vehicle3 = MockVehicle("VIN3")
+    for vehicle in (vehicle1, vehicle2, vehicle3):
+        vehicle.get_status.side_effect = lambda: {"basicVehicleStatus": {"speed": "0"}}
+    client = MockClient([vehicle1, vehicle3])
+    with patch("homeassistant.helpers.update_coordinator.DataUpdateCoordinator.__init__", new=mock_data_update_coordinator_init):
+        coordinator = ZeekrCoordinator(hass, client, DummyConfig())
+    coordinator.request_stats.inc_request = MagicMock()
+    # As restored from a snapshot taken before VIN2 was removed and VIN3 added
+    coordinator.vehicles = [vehicle1, vehicle2]
+    coordinator.data = {"VIN1": {}, "VIN2": {}}
+    coordinator._sections["VIN2"] = {"charging_limit": {"soc": "800"}}
+
+    data = await coordinator._async_update_data()
+
+    assert set(data) == {"VIN1", "VIN3"}
+    assert [vehicle.vin for vehicle in coordinator.vehicles] == ["VIN1", "VIN3"]
+    assert "VIN2" not in coordinator._sections
+    vehicle2.get_status.assert_not_called()
+    hass.config_entries.async_reload.assert_called_once_with("test_entry")
+
+    # Not read again until a day has passed
+    coordinator._poll_all = True
+    await coordinator._async_update_data()
+    client.get_vehicle_list.assert_called_once()
+    coordinator._vehicles_fetched -= 24 * 60 * 60
+    coordinator._poll_all = True
+    await coordinator._async_update_data()
+    assert client.get_vehicle_list.call_count == 2
+    hass.config_entries.async_reload.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_rejected_saved_session_logs_in_and_retries():
+    hass = DummyHass()
+    vehicle = MockVehicle("VIN1")
+    client = MockClient([vehicle])
+    client.get_vehicle_list.side_effect = [Exception("Unauthorized"), [vehicle]]
+    client.login = MagicMock()
+    with patch("homeassistant.helpers.update_coordinator.DataUpdateCoordinator.__init__", new=mock_data_update_coordinator_init):
+        coordinator = ZeekrCoordinator(hass, client, DummyConfig())
+    coordinator.request_stats.inc_request = MagicMock()
+    coordinator._async_update_vehicle = AsyncMock(return_value=("VIN1", {"ok": True}))
+    coordinator._session_unverified = True
+
+    data = await coordinator._async_update_data()
+
+    assert data == {"VIN1": {"ok": True}}
+    client.login.assert_called_once()
+    assert coordinator._session_unverified is False
+
+
+@pytest.mark.asyncio
+async def test_rejected_restored_tokens_force_a_login():
+    from zeekr_ev_api.client import ZeekrClient
+
+    hass = DummyHass()
+    vehicle = MockVehicle("VIN1")
+    client = ZeekrClient(username="user", password="pass", country_code="AU")
+    # Restored tokens: the client considers itself logged in
+    client.load_session({"bearer_token": "bearer", "region_login_server": "https://example.com/"})
+    client.logged_in = True
+    client.get_vehicle_list = MagicMock(side_effect=[Exception("Unauthorized"), [vehicle]])
+    steps = [
+        "_get_urls", "_check_user", "_do_login_request", "_get_user_info",
+        "_get_protocol", "_check_inbox", "_get_tsp_code", "_update_language", "_bearer_login",
+    ]
+    for step in steps:
+        setattr(client, step, MagicMock())
+    client._get_tsp_code.return_value = ("tsp", None)
+    with patch("homeassistant.helpers.update_coordinator.DataUpdateCoordinator.__init__", new=mock_data_update_coordinator_init):
+        coordinator = ZeekrCoordinator(hass, client, DummyConfig())
+    coordinator.request_stats.inc_request = MagicMock()
+    coordinator.async_save_session = MagicMock()
+    coordinator._async_update_vehicle = AsyncMock(return_value=("VIN1", {"ok": True}))
+    coordinator._session_unverified = True
+
+    data = await coordinator._async_update_data()
+
+    assert data == {"VIN1": {"ok": True}}
+    client._do_login_request.assert_called_once()
+    client._bearer_login.assert_called_once_with("tsp")
+
+
+@pytest.mark.asyncio
+async def test_refresh_vehicle_publishes_single_section():
+    hass = DummyHass()
+    vehicle = MockVehicle("VIN1")
+    vehicle.get_remote_control_state.return_value = {"vstdModeState": "1"}
+    with patch("homeassistant.helpers.update_coordinator.DataUpdateCoordinator.__init__", new=mock_data_update_coordinator_init):
+        coordinator = ZeekrCoordinator(hass, MockClient([vehicle]), DummyConfig())
+    coordinator.vehicles = [vehicle]
+    coordinator.request_stats.inc_request = MagicMock()
+    coordinator.data = {"VIN1": {"additionalVehicleStatus": {"remoteControlState": {"vstdModeState": "0"}}}}
+    coordinator.async_publish = MagicMock()
+
+    result = await coordinator.async_refresh_vehicle("VIN1", ["remote_control_state"])
+
+    assert result["additionalVehicleStatus"]["remoteControlState"] == {"vstdModeState": "1"}
+    vehicle.get_status.assert_not_called()
+    coordinator.async_publish.assert_called_once_with({"VIN1": result})
+    # The published snapshot is not mutated in place
+    assert coordinator.data["VIN1"]["additionalVehicleStatus"]["remoteControlState"]["vstdModeState"] == "0"
+
+
+@pytest.mark.asyncio
+async def test_confirm_publishes_only_the_matching_state():
+    from functools import partial
+    from custom_components.zeekr_ev.confirm import async_confirm_state
+
+    hass = DummyHass()
+    vehicle = MockVehicle("VIN1")
+    vehicle.get_remote_control_state.side_effect = [
+        {"vstdModeState": "0"}, {"vstdModeState": "0"}, {"vstdModeState": "1"},
+    ]
+    with patch("homeassistant.helpers.update_coordinator.DataUpdateCoordinator.__init__", new=mock_data_update_coordinator_init):
+        coordinator = ZeekrCoordinator(hass, MockClient([vehicle]), DummyConfig())
+    coordinator.vehicles = [vehicle]
+    coordinator.request_stats.inc_request = MagicMock()
+    # Optimistic state written by the entity
+    coordinator.data = {"VIN1": {"additionalVehicleStatus": {"remoteControlState": {"vstdModeState": "1"}}}}
+    coordinator.async_publish = MagicMock()
+    path = ("additionalVehicleStatus", "remoteControlState", "vstdModeState")
+
+    with patch(
+        "custom_components.zeekr_ev.coordinator.async_confirm_state",
+        partial(async_confirm_state, steps=(0,), timeout=1),
+    ):
+        await coordinator._async_confirm("key", "VIN1", "remote_control_state", {path: ("1",)})
+
+    assert vehicle.get_remote_control_state.call_count == 3
+    # The stale "0" reads never reached the entities
+    coordinator.async_publish.assert_called_once()
+    published = coordinator.async_publish.call_args.args[0]
+    assert published["VIN1"]["additionalVehicleStatus"]["remoteControlState"] == {"vstdModeState": "1"}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_endpoint_refreshes_share_one_request():
+    hass = DummyHass()
+    vehicle = MockVehicle("VIN1")
+    vehicle.get_status.return_value = {"basicVehicleStatus": {"speed": "0"}}
+    with patch("homeassistant.helpers.update_coordinator.DataUpdateCoordinator.__init__", new=mock_data_update_coordinator_init):
+        coordinator = ZeekrCoordinator(hass, MockClient([vehicle]), DummyConfig())
+    coordinator.vehicles = [vehicle]
+    coordinator.request_stats.inc_request = MagicMock()
+    coordinator.data = {"VIN1": {}}
+    coordinator.async_publish = MagicMock()
+
+    first, second = await asyncio.gather(
+        coordinator.async_refresh_vehicle("VIN1", ["status"]),
+        coordinator.async_refresh_vehicle("VIN1", ["status"]),
+    )
+
+    assert first is second
+    vehicle.get_status.assert_called_once()
+    coordinator.request_stats.inc_request.assert_called_once()
+    assert coordinator._endpoint_fetches == {}
+
+
+@pytest.mark.asyncio
+async def test_refresh_vehicle_fetches_only_that_vehicle():
+    hass = DummyHass()
+    vehicle1 = MockVehicle("VIN1")
+    vehicle2 = MockVehicle("VIN2")
+    vehicle1.get_status.return_value = {"basicVehicleStatus": {"speed": "5"}}
+    vehicle1.get_charging_limit.return_value = {"soc": "800"}
+    with patch("homeassistant.helpers.update_coordinator.DataUpdateCoordinator.__init__", new=mock_data_update_coordinator_init):
+        coordinator = ZeekrCoordinator(hass, MockClient([vehicle1, vehicle2]), DummyConfig())
+    coordinator.vehicles = [vehicle1, vehicle2]
+    coordinator.request_stats.inc_request = MagicMock()
+    coordinator.data = {"VIN1": {}, "VIN2": {"basicVehicleStatus": {"speed": "0"}}}
+    coordinator.async_publish = MagicMock()
+
+    result = await coordinator.async_refresh_vehicle("VIN1")
+
+    assert result["basicVehicleStatus"] == {"speed": "5"}
+    assert result["chargingLimit"] == {"soc": "800"}
+    assert coordinator.request_stats.inc_request.call_count == 6
+    vehicle2.get_status.assert_not_called()
+    published = coordinator.async_publish.call_args[0][0]
+    assert published["VIN2"] == {"basicVehicleStatus": {"speed": "0"}}
+
+
+@pytest.mark.asyncio
+async def test_failed_fetches_serve_last_good_copy_until_too_old():
+    hass = DummyHass()
+    vehicle = MockVehicle("VIN1")
+    fresh_status = lambda: {"basicVehicleStatus": {"speed": "0"}}  # noqa: E731
+    vehicle.get_status.side_effect = fresh_status
+    vehicle.get_remote_control_state.return_value = {"vstdModeState": "1"}
+    vehicle.get_charging_status.return_value = {}
+    vehicle.get_charging_limit.return_value = {}
+    vehicle.get_charge_plan.return_value = {}
+    vehicle.get_travel_plan.return_value = {}
+    with patch("homeassistant.helpers.update_coordinator.DataUpdateCoordinator.__init__", new=mock_data_update_coordinator_init):
+        coordinator = ZeekrCoordinator(hass, MockClient([vehicle]), DummyConfig())
+    coordinator.request_stats.inc_request = MagicMock()
+
+    coordinator.data = await coordinator._async_update_data()
+    assert coordinator.data_stale_since("VIN1") is None
+
+    # API blip: status and remote control state both fail
+    vehicle.get_status.side_effect = Exception("timeout")
+    vehicle.get_remote_control_state.side_effect = Exception("timeout")
+    coordinator._poll_all = True
+    data = await coordinator._async_update_data()
+    assert data["VIN1"]["additionalVehicleStatus"]["remoteControlState"] == {"vstdModeState": "1"}
+    assert coordinator.data_stale_since("VIN1") is not None
+
+    # The section is dropped once it is older than the allowed staleness
+    vehicle.get_status.side_effect = fresh_status
+    coordinator.max_staleness = timedelta(0)
+    coordinator._poll_all = True
+    data = await coordinator._async_update_data()
+    assert "remoteControlState" not in data["VIN1"].get("additionalVehicleStatus", {})
+    assert coordinator.data_stale_since("VIN1", (("additionalVehicleStatus", "remoteControlState", "vstdModeState"),)) is None
+
+
+@pytest.mark.asyncio
+async def test_listeners_woken_when_sections_go_stale_or_fresh():
+    hass = DummyHass()
+    vehicle = MockVehicle("VIN1")
+    vehicle.get_status.side_effect = lambda: {"basicVehicleStatus": {"speed": "0"}}
+    vehicle.get_remote_control_state.return_value = {"vstdModeState": "1"}
+    vehicle.get_charging_status.return_value = {}
+    vehicle.get_charging_limit.return_value = {"soc": "800"}
+    vehicle.get_charge_plan.return_value = {}
+    vehicle.get_travel_plan.return_value = {}
+    with patch("homeassistant.helpers.update_coordinator.DataUpdateCoordinator.__init__", new=mock_data_update_coordinator_init):
+        coordinator = ZeekrCoordinator(hass, MockClient([vehicle]), DummyConfig())
+    coordinator.request_stats.inc_request = MagicMock()
+    remote_path = ("additionalVehicleStatus", "remoteControlState", "vstdModeState")
+    woken = {}
+
+    def listen(name, path):
+        def update():
+            woken[name] = coordinator.data_stale_since("VIN1", (path,))
+        coordinator._listeners[name] = (update, vehicle_context("VIN1", path))
+
+    listen("remote", remote_path)
+    listen("limit", ("chargingLimit", "soc"))
+
+    async def poll():
+        woken.clear()
+        coordinator._poll_all = True
+        coordinator.data = await coordinator._async_update_data()
+        coordinator.async_update_listeners()
+
+    await poll()
+    # API blip: the same values are served from cache
+    vehicle.get_remote_control_state.side_effect = Exception("timeout")
+    await poll()
+    assert set(woken) == {"remote"}
+    assert woken["remote"] is not None
+
+    # Still stale: nothing changed, nobody is woken
+    await poll()
+    assert woken == {}
+
+    # Fresh data with the same values clears the attribute
+    vehicle.get_remote_control_state.side_effect = None
+    await poll()
+    assert woken == {"remote": None}
+
+
+def test_endpoint_for_path():
+    from custom_components.zeekr_ev.coordinator import endpoint_for_path
+
+    assert endpoint_for_path(("chargingLimit", "soc")) == "charging_limit"
+    assert endpoint_for_path(("additionalVehicleStatus", "remoteControlState", "vstdModeState")) == "remote_control_state"
+    assert endpoint_for_path(("basicVehicleStatus", "speed")) == "status"
+
+
+@pytest.mark.asyncio
+async def test_slow_endpoint_misses_deadline_and_merges_late():
+    hass = DummyHass()
+    vehicle = MockVehicle("VIN1")
+    vehicle.get_status.side_effect = lambda: {"basicVehicleStatus": {"speed": "0"}}
+    for method in ("get_remote_control_state", "get_charging_status", "get_charging_limit", "get_charge_plan"):
+        getattr(vehicle, method).return_value = {}
+    release = asyncio.Event()
+    with patch("homeassistant.helpers.update_coordinator.DataUpdateCoordinator.__init__", new=mock_data_update_coordinator_init):
+        coordinator = ZeekrCoordinator(hass, MockClient([vehicle]), DummyConfig())
+    coordinator.request_stats.inc_request = MagicMock()
+    coordinator.async_publish = MagicMock()
+
+    async def async_call(func, *args):
+        if func is vehicle.get_travel_plan:
+            await release.wait()
+            return {"scheduledTime": "08:00"}
+        return func(*args)
+
+    coordinator.async_call = async_call
+    timeouts = {"status": 1, "travel_plan": 0.01}
+    with patch.dict("custom_components.zeekr_ev.coordinator.ENDPOINT_TIMEOUTS", timeouts):
+        data = await coordinator._async_update_data()
+
+    # The update is assembled without the slow section
+    assert "travelPlan" not in data["VIN1"]
+    assert coordinator.endpoint_timeouts == {"travel_plan": 1}
+    coordinator.data = data
+
+    release.set()
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    published = coordinator.async_publish.call_args[0][0]
+    assert published["VIN1"]["travelPlan"] == {"scheduledTime": "08:00"}
+    assert coordinator._late_fetches == {}
+
+
+@pytest.mark.asyncio
+async def test_late_result_during_outage_is_cached_not_published():
+    hass = DummyHass()
+    vehicle = MockVehicle("VIN1")
+    with patch("homeassistant.helpers.update_coordinator.DataUpdateCoordinator.__init__", new=mock_data_update_coordinator_init):
+        coordinator = ZeekrCoordinator(hass, MockClient([vehicle]), DummyConfig())
+    coordinator.data = {"VIN1": {}}
+    coordinator.consecutive_failures = 2
+    coordinator.async_publish = MagicMock()
+    coordinator._schedule_refresh = MagicMock()
+    late = asyncio.get_running_loop().create_future()
+    late.set_result({"soc": "800"})
+
+    coordinator._async_merge_late_result(("VIN1", "charging_limit"), late)
+
+    coordinator.async_publish.assert_not_called()
+    coordinator._schedule_refresh.assert_not_called()
+    assert coordinator._sections["VIN1"]["charging_limit"] == {"soc": "800"}
+
+
+@pytest.mark.asyncio
+async def test_status_and_auxiliary_endpoints_run_together():
+    hass = DummyHass()
+    vehicle = MockVehicle("VIN1")
+    for method in ("get_charging_status", "get_charging_limit", "get_charge_plan", "get_travel_plan"):
+        getattr(vehicle, method).return_value = {}
+    aux_started = asyncio.Event()
+    with patch("homeassistant.helpers.update_coordinator.DataUpdateCoordinator.__init__", new=mock_data_update_coordinator_init):
+        coordinator = ZeekrCoordinator(hass, MockClient([vehicle]), DummyConfig())
+    coordinator.request_stats.inc_request = MagicMock()
+
+    async def async_call(func, *args):
+        if func is vehicle.get_status:
+            # Only completes if the auxiliary fetch started without waiting for it
+            await aux_started.wait()
+            return {"basicVehicleStatus": {"speed": "0"}}
+        if func is vehicle.get_remote_control_state:
+            aux_started.set()
+            return {"vstdModeState": "1"}
+        return func(*args)
+
+    coordinator.async_call = async_call
+    with patch.dict("custom_components.zeekr_ev.coordinator.ENDPOINT_TIMEOUTS", {"status": 0.5}):
+        vin, data = await coordinator._async_update_vehicle(vehicle)
+
+    assert data["additionalVehicleStatus"]["remoteControlState"] == {"vstdModeState": "1"}
+    assert data["basicVehicleStatus"] == {"speed": "0"}
+
+
+@pytest.mark.asyncio
+async def test_fetch_plan_skips_endpoints_nobody_displays():
+    hass = DummyHass()
+    vehicle = MockVehicle("VIN1")
+    vehicle.get_status.return_value = {"basicVehicleStatus": {"speed": "0"}}
+    vehicle.get_charging_limit.return_value = {"soc": "800"}
+    with patch("homeassistant.helpers.update_coordinator.DataUpdateCoordinator.__init__", new=mock_data_update_coordinator_init):
+        coordinator = ZeekrCoordinator(hass, MockClient([vehicle]), DummyConfig())
+    coordinator.vehicles = [vehicle]
+    coordinator.request_stats.inc_request = MagicMock()
+
+    # Nothing listening yet: everything is fetched
+    assert coordinator.fetch_plan() is None
+
+    coordinator._listeners["speed"] = (MagicMock(), vehicle_context("VIN1", ("basicVehicleStatus", "speed")))
+    coordinator._listeners["limit"] = (MagicMock(), vehicle_context("VIN1", ("chargingLimit", "soc")))
+    coordinator._listeners["polling"] = (MagicMock(), None)
+    assert coordinator.fetch_plan() == {"VIN1": {"status", "charging_limit", "charging_status"}}
+
+    data = await coordinator._async_update_data()
+
+    assert data["VIN1"]["chargingLimit"] == {"soc": "800"}
+    vehicle.get_charging_limit.assert_called_once()
+    # Kept so charging sensors can appear once the car reports charging
+    vehicle.get_charging_status.assert_called_once()
+    vehicle.get_remote_control_state.assert_not_called()
+    vehicle.get_charge_plan.assert_not_called()
+    vehicle.get_travel_plan.assert_not_called()
+
+    # An entity reading the whole vehicle needs every section
+    coordinator._listeners["climate"] = (MagicMock(), vehicle_context("VIN1"))
+    assert coordinator.fetch_plan() == {"VIN1": set(ENDPOINTS)}
+
+
+@pytest.mark.asyncio
+async def test_fetch_plan_follows_disabled_platform_entities():
+    from importlib import import_module
+    from custom_components.zeekr_ev.coordinator import endpoint_for_path
+
+    hass = DummyHass()
+    vehicle = MockVehicle("VIN1")
+    with patch("homeassistant.helpers.update_coordinator.DataUpdateCoordinator.__init__", new=mock_data_update_coordinator_init):
+        coordinator = ZeekrCoordinator(hass, MockClient([vehicle]), DummyConfig())
+    coordinator.vehicles = [vehicle]
+    coordinator.data = {"VIN1": {}}
+    hass.data[DOMAIN][coordinator.entry.entry_id] = coordinator
+
+    entities = []
+    platforms = [
+        "binary_sensor", "button", "climate", "cover", "datetime", "device_tracker",
+        "lock", "number", "select", "sensor", "switch", "time",
+    ]
+    with patch("custom_components.zeekr_ev.sensor.zeekr_app_sig_module", MagicMock()):
+        for platform in platforms:
+            module = import_module(f"custom_components.zeekr_ev.{platform}")
+            await module.async_setup_entry(hass, coordinator.entry, entities.extend)
+    for entity in entities:
+        coordinator._listeners[id(entity)] = (MagicMock(), entity.coordinator_context)
+    assert coordinator.fetch_plan() == {"VIN1": set(ENDPOINTS)}
+
+    # Disable every entity reading the remote control state or the plans
+    disabled = {"remote_control_state", "travel_plan", "charge_plan"}
+    for entity in entities:
+        context = entity.coordinator_context
+        if context and any(endpoint_for_path(path) in disabled for path in context[1]):
+            del coordinator._listeners[id(entity)]
+
+    assert coordinator.fetch_plan() == {"VIN1": set(ENDPOINTS) - disabled}
+
+
+@pytest.mark.asyncio
+async def test_unsupported_endpoint_is_skipped():
+    hass = DummyHass()
+    vehicle = MockVehicle("VIN1")
+    vehicle.get_status.side_effect = lambda: {"basicVehicleStatus": {"speed": "0"}}
+    vehicle.get_travel_plan.side_effect = Exception("not supported")
+    with patch("homeassistant.helpers.update_coordinator.DataUpdateCoordinator.__init__", new=mock_data_update_coordinator_init):
+        coordinator = ZeekrCoordinator(hass, MockClient([vehicle]), DummyConfig())
+    coordinator.request_stats.inc_request = MagicMock()
+    coordinator.capabilities._store.async_delay_save = MagicMock()
+
+    for _ in range(4):
+        coordinator._poll_all = True
+        coordinator._last_fetched.clear()
+        await coordinator._async_update_data()
+
+    assert vehicle.get_travel_plan.call_count == 3
+    assert vehicle.get_charge_plan.call_count == 4
+    assert "travel_plan" in coordinator.capabilities.unsupported("VIN1")
+
+
+@pytest.mark.asyncio
+async def test_open_status_circuit_fails_update_and_skips_calls():
+    hass = DummyHass()
+    vehicle = MockVehicle("VIN1")
+    vehicle.get_status.side_effect = Exception("503")
+    with patch("homeassistant.helpers.update_coordinator.DataUpdateCoordinator.__init__", new=mock_data_update_coordinator_init):
+        coordinator = ZeekrCoordinator(hass, MockClient([vehicle]), DummyConfig())
+    coordinator.request_stats.inc_request = MagicMock()
+    coordinator.vehicles = [vehicle]
+
+    for _ in range(2):
+        coordinator._poll_all = True
+        assert await coordinator._async_update_data() == {}
+    coordinator._poll_all = True
+    with pytest.raises(UpdateFailed, match="Status endpoint unavailable"):
+        await coordinator._async_update_data()
+
+    # While open, status is not called at all
+    coordinator._poll_all = True
+    with pytest.raises(UpdateFailed):
+        await coordinator._async_update_data()
+    assert vehicle.get_status.call_count == 3
+    assert coordinator.breakers["status"].state == "open"
+    assert coordinator.breakers["remote_control_state"].state == "closed"
+
+
+@pytest.mark.asyncio
+async def test_permanent_errors_do_not_open_the_circuit():
+    hass = DummyHass()
+    vehicle = MockVehicle("VIN1")
+    vehicle.get_travel_plan.side_effect = Exception("Function not supported by this vehicle")
+    with patch("homeassistant.helpers.update_coordinator.DataUpdateCoordinator.__init__", new=mock_data_update_coordinator_init):
+        coordinator = ZeekrCoordinator(hass, MockClient([vehicle]), DummyConfig())
+    coordinator.request_stats.inc_request = MagicMock()
+
+    for _ in range(5):
+        with pytest.raises(Exception, match="not supported"):
+            await coordinator._async_call_endpoint(vehicle, "travel_plan")
+
+    assert vehicle.get_travel_plan.call_count == 5
+    assert coordinator.breakers["travel_plan"].state == "closed"
+
+
+@pytest.mark.asyncio
+async def test_outage_backs_off_and_recovers():
+    hass = DummyHass()
+    vehicle = MockVehicle("VIN1")
+    with patch("homeassistant.helpers.update_coordinator.DataUpdateCoordinator.__init__", new=mock_data_update_coordinator_init):
+        coordinator = ZeekrCoordinator(hass, MockClient([vehicle]), DummyConfig())
+    coordinator.request_stats.inc_request = MagicMock()
+    coordinator.client.get_vehicle_list.side_effect = Exception("502")
+    coordinator.base_interval = base = timedelta(minutes=5)
+
+    intervals = []
+    with patch("custom_components.zeekr_ev.coordinator.random.uniform", return_value=1):
+        for _ in range(9):
+            with pytest.raises(UpdateFailed):
+                await coordinator._async_update_data()
+            intervals.append(coordinator.update_interval)
+    assert intervals[:4] == [base, base * 2, base * 4, base * 8]
+    assert intervals[-1] == timedelta(hours=1)
+
+    # Manual refreshes and targeted fetches wait for the scheduled retry
+    with patch("homeassistant.helpers.update_coordinator.DataUpdateCoordinator.async_request_refresh") as request:
+        await coordinator.async_request_refresh()
+    request.assert_not_called()
+    assert await coordinator.async_refresh_vehicle("VIN1") is None
+
+    coordinator.client.get_vehicle_list.side_effect = None
+    vehicle.get_status.return_value = {"basicVehicleStatus": {"speed": "0"}}
+    await coordinator._async_update_data()
+    assert coordinator.consecutive_failures == 0
+    assert coordinator.update_interval == coordinator.vehicle_intervals["VIN1"]
+
+
+@pytest.mark.asyncio
+async def test_api_errors_tighten_throttle_or_trigger_login():
+    hass = DummyHass()
+    vehicle = MockVehicle("VIN1")
+    client = MockClient([vehicle])
+    client.login = MagicMock()
+    with patch("homeassistant.helpers.update_coordinator.DataUpdateCoordinator.__init__", new=mock_data_update_coordinator_init):
+        coordinator = ZeekrCoordinator(hass, client, DummyConfig())
+    coordinator.request_stats.inc_request = MagicMock()
+    coordinator.vehicles = [vehicle]
+
+    vehicle.get_status.side_effect = Exception("{'code': '429', 'msg': 'Too Many Requests'}")
+    coordinator._poll_all = True
+    await coordinator._async_update_data()
+    assert coordinator.throttle.rate is not None
+    client.login.assert_not_called()
+
+    # An expired session logs in again and polls once more
+    coordinator.throttle.rate = None
+    vehicle.get_status.side_effect = [Exception("Token expired (retry failed)"), {"basicVehicleStatus": {"speed": "0"}}]
+    coordinator._poll_all = True
+    data = await coordinator._async_update_data()
+    client.login.assert_called_once()
+    assert data["VIN1"]["basicVehicleStatus"] == {"speed": "0"}
+
+
+@pytest.mark.asyncio
+async def test_commands_take_priority_and_are_not_counted_as_poll_requests():
+    hass = DummyHass()
+    vehicle = MockVehicle("VIN1")
+    vehicle.get_status.side_effect = lambda: {"basicVehicleStatus": {"speed": "0"}}
+    vehicle.do_remote_control = MagicMock(return_value=True)
+    vehicle.do_remote_control.__name__ = "do_remote_control"
+    config = DummyConfig()
+    config.data["daily_request_budget"] = 1000
+    with patch("homeassistant.helpers.update_coordinator.DataUpdateCoordinator.__init__", new=mock_data_update_coordinator_init):
+        coordinator = ZeekrCoordinator(hass, MockClient([vehicle]), config)
+    coordinator.request_stats.inc_request = MagicMock()
+    coordinator.vehicles = [vehicle]
+    coordinator.data = {"VIN1": {}}
+    coordinator._vehicles_fetched = time.monotonic()
+    coordinator.throttle.async_acquire = AsyncMock()
+
+    await coordinator.async_call(vehicle.do_remote_control, "start", "ZAF", {})
+    coordinator.throttle.async_acquire.assert_awaited_once_with(priority=True)
+
+    # A confirmation refresh running alongside the poll
+    poll = coordinator._async_update_data()
+    await asyncio.gather(poll, coordinator.async_refresh_vehicle("VIN1", ["status"]))
+    assert coordinator._requests_per_poll == 6
+    assert coordinator._poll_requests == 6
+
+
+@pytest.mark.asyncio
+async def test_api_calls_record_latency_per_method_and_vin():
+    class Vehicle:
+        vin = "VIN1"
+
+        def get_status(self):
+            raise Exception("Failed to get vehicle status")
+
+    hass = DummyHass()
+    with patch("homeassistant.helpers.update_coordinator.DataUpdateCoordinator.__init__", new=mock_data_update_coordinator_init):
+        coordinator = ZeekrCoordinator(hass, MockClient([]), DummyConfig())
+
+    with pytest.raises(Exception):
+        await coordinator.async_call(Vehicle().get_status)
+
+    stats = coordinator.request_stats.call_stats("get_status")
+    assert stats["count"] == 1
+    assert stats["errors"] == 1
+    assert stats["vehicles"]["VIN1"]["errors"] == 1
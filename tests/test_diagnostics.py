@@ -0,0 +1,63 @@
+from datetime import timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from custom_components.zeekr_ev.const import DOMAIN
+from custom_components.zeekr_ev.coordinator import ZeekrCoordinator
+from custom_components.zeekr_ev.diagnostics import async_get_config_entry_diagnostics
+
+
+class MockVehicle:
+    def __init__(self, vin):
+        self.vin = vin
+
+
+class DummyConfigEntry:
+    def __init__(self):
+        self.data = {"username": "me@example.com", "password": "secret", "polling_interval": 5}
+        self.options = {}
+        self.entry_id = "test_entry"
+
+
+def mock_data_update_coordinator_init(self, hass, logger, name, update_interval=None, **kwargs):
+    self.hass = hass
+    self.update_interval = update_interval
+    self._listeners = {}
+    self.data = None
+    self.last_update_success = True
+
+
+@pytest.mark.asyncio
+async def test_diagnostics_redacts_and_reports_performance(hass):
+    entry = DummyConfigEntry()
+    client = MagicMock(bearer_token="bearer")
+    with patch("homeassistant.helpers.update_coordinator.DataUpdateCoordinator.__init__", new=mock_data_update_coordinator_init):
+        coordinator = ZeekrCoordinator(hass, client, entry)
+    coordinator.vehicles = [MockVehicle("VIN123")]
+    coordinator.data = {
+        "VIN123": {
+            "basicVehicleStatus": {"position": {"latitude": "-33.8", "longitude": "151.2"}, "speed": "0"},
+        }
+    }
+    coordinator.update_durations.extend([1.5, 2.0])
+    coordinator.vehicle_fetch_times["VIN123"] = 1.4
+    coordinator.vehicle_intervals["VIN123"] = timedelta(minutes=5)
+    coordinator.request_stats.record_call("get_status", "VIN123", 0.3)
+    hass.data[DOMAIN] = {entry.entry_id: coordinator}
+
+    diag = await async_get_config_entry_diagnostics(hass, entry)
+
+    assert diag["entry"]["data"]["password"] == "**REDACTED**"
+    assert diag["entry"]["data"]["username"] == "**REDACTED**"
+    position = diag["coordinator"]["data"]["vehicle_1"]["basicVehicleStatus"]["position"]
+    assert position == {"latitude": "**REDACTED**", "longitude": "**REDACTED**"}
+    assert "VIN123" not in str(diag)
+
+    perf = diag["performance"]
+    assert perf["update_durations"] == [1.5, 2.0]
+    assert perf["vehicle_fetch_times"] == {"vehicle_1": 1.4}
+    assert perf["vehicle_intervals"] == {"vehicle_1": "0:05:00"}
+    assert perf["data_size_bytes"] > 0
+    assert perf["calls"]["get_status"]["vehicles"]["vehicle_1"]["count"] == 1
+    assert perf["circuit_breakers"]["status"]["state"] == "closed"
@@ -0,0 +1,25 @@
+import asyncio
+
+import requests
+
+from custom_components.zeekr_ev.errors import classify_error
+
+
+class AuthException(Exception):
+    pass
+
+
+def test_classify_error():
+    assert classify_error(Exception("Failed to get vehicle status: {'code': '429', 'msg': 'Too Many Requests'}")) == "throttled"
+    response = requests.Response()
+    response.status_code = 429
+    assert classify_error(requests.HTTPError(response=response)) == "throttled"
+
+    assert classify_error(AuthException("Bearer login failed")) == "auth_expired"
+    assert classify_error(Exception("Token expired (retry failed)")) == "auth_expired"
+
+    assert classify_error(asyncio.TimeoutError()) == "transient"
+    assert classify_error(requests.ConnectionError("reset")) == "transient"
+    assert classify_error(Exception("{'success': False, 'status_code': 503}")) == "transient"
+
+    assert classify_error(Exception("Failed to get travel plan: {'code': '1402', 'msg': 'not supported'}")) == "permanent"
@@ -0,0 +1,65 @@
+from custom_components.zeekr_ev.binary_sensor import ZeekrBinarySensor
+from custom_components.zeekr_ev.coordinator import flatten_snapshot
+from custom_components.zeekr_ev.fields import (
+    BINARY_SENSOR_FIELDS,
+    SENSOR_FIELDS,
+    compile_accessor,
+    get_tire_position_label,
+    tire_sensor_fields,
+)
+from custom_components.zeekr_ev.sensor import ZeekrSensor
+
+
+class DummyCoordinator:
+    def __init__(self, data):
+        self.data = data
+        self.data_index = flatten_snapshot(data)
+
+
+def _field(fields, key):
+    return next(field for field in fields if field.key == key)
+
+
+def test_accessor_decodes_values():
+    index = flatten_snapshot({"VIN1": {"additionalVehicleStatus": {"runningStatus": {"tripMeter2": "12.5"}}}})
+    trip = _field(SENSOR_FIELDS, "trip_2_distance")
+    assert compile_accessor(trip, "VIN1")(index) == 12.5
+    assert compile_accessor(trip, "VIN2")(index) is None
+
+    bad = flatten_snapshot({"VIN1": {"additionalVehicleStatus": {"runningStatus": {"tripMeter2": "n/a"}}}})
+    assert compile_accessor(trip, "VIN1")(bad) is None
+
+
+def test_accessor_uses_default_when_missing():
+    charging = _field(BINARY_SENSOR_FIELDS, "charging_status")
+    assert compile_accessor(charging, "VIN1")({}) is False
+    index = flatten_snapshot({"VIN1": {"additionalVehicleStatus": {"electricVehicleStatus": {"chargerState": "2"}}}})
+    assert compile_accessor(charging, "VIN1")(index) is True
+
+
+def test_entities_from_fields():
+    data = {
+        "VIN1": {
+            "additionalVehicleStatus": {
+                "electricVehicleStatus": {"chargeLevel": "80"},
+                "drivingSafetyStatus": {"trunkOpenStatus": "1"},
+            }
+        }
+    }
+    coordinator = DummyCoordinator(data)
+
+    sensor = ZeekrSensor.from_field(coordinator, "VIN1", _field(SENSOR_FIELDS, "battery_level"))
+    assert sensor.unique_id == "VIN1_battery_level"
+    assert sensor.native_value == "80"
+    assert sensor.coordinator_context == ("VIN1", (("additionalVehicleStatus", "electricVehicleStatus", "chargeLevel"),))
+
+    trunk = ZeekrBinarySensor.from_field(coordinator, "VIN1", _field(BINARY_SENSOR_FIELDS, "trunk_open"))
+    assert trunk.is_on is True
+
+
+def test_tire_fields_follow_drive_side():
+    assert get_tire_position_label("DriverRear", "rhd") == "PassengerRear"
+    names = [field.name for field in tire_sensor_fields("rhd")]
+    assert "Tire Pressure PassengerRear" in names
+    keys = [field.key for field in tire_sensor_fields("rhd")]
+    assert "tire_pressure_driverrear" in keys
@@ -1,4 +1,4 @@
-from unittest.mock import MagicMock, AsyncMock
+from unittest.mock import MagicMock
 import pytest
 from custom_components.zeekr_ev.lock import ZeekrLock, async_setup_entry
 from custom_components.zeekr_ev.const import DOMAIN
@@ -16,14 +16,19 @@ class MockCoordinator:
     def __init__(self, data):
         self.data = data
         self.vehicles = {}
-        self.async_inc_invoke = AsyncMock()
+        self.inc_invoke = MagicMock()
+        self.async_confirm = MagicMock()
+
+    async def async_call(self, func, *args):
+        return func(*args)
+
+    async def async_send_command(self, vehicle, command, service_id, setting):
+        self.inc_invoke()
+        return vehicle.do_remote_control(command, service_id, setting)
 
     def get_vehicle_by_vin(self, vin):
         return self.vehicles.get(vin)
 
-    def inc_invoke(self):
-        pass
-
     async def async_request_refresh(self):
         pass
 
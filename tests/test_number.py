@@ -13,10 +13,18 @@ class MockCoordinator:
     def __init__(self, vehicles):
         self.vehicles = vehicles
         self.data = {v.vin: {} for v in vehicles}
-        self.async_inc_invoke = AsyncMock()
+        self.inc_invoke = MagicMock()
         self.async_request_refresh = AsyncMock()
+        self.invalidate_endpoint = MagicMock()
         self.seat_duration = 15
 
+    async def async_call(self, func, *args):
+        return func(*args)
+
+    async def async_send_command(self, vehicle, command, service_id, setting):
+        self.inc_invoke()
+        return vehicle.do_remote_control(command, service_id, setting)
+
     def get_vehicle_by_vin(self, vin):
         for v in self.vehicles:
             if v.vin == vin:
@@ -54,7 +62,7 @@ async def test_charging_limit_number():
     # Test setting value 80%
     await number_entity.async_set_native_value(80.0)
 
-    coordinator.async_inc_invoke.assert_called_once()
+    coordinator.inc_invoke.assert_called_once()
     vehicle.do_remote_control.assert_called_with(
         "start",
         "RCS",
@@ -0,0 +1,61 @@
+from datetime import timedelta
+
+import pytest
+
+from custom_components.zeekr_ev.polling import (
+    POLLING_MODE_ACTIVE,
+    POLLING_MODE_CHARGING,
+    POLLING_MODE_DEEP_SLEEP,
+    POLLING_MODE_DRIVING,
+    POLLING_MODE_PARKED,
+    ZeekrAdaptivePollingPolicy,
+    ZeekrFixedPollingPolicy,
+    ZeekrPollingPolicy,
+)
+
+
+def _status(usage_mode=None, engine_status=None, charger_state=None):
+    data = {"basicVehicleStatus": {}}
+    if usage_mode is not None:
+        data["basicVehicleStatus"]["usageMode"] = usage_mode
+    if engine_status is not None:
+        data["basicVehicleStatus"]["engineStatus"] = engine_status
+    if charger_state is not None:
+        data["additionalVehicleStatus"] = {"electricVehicleStatus": {"chargerState": charger_state}}
+    return data
+
+
+def test_mode_for_vehicle_states():
+    mode_for = ZeekrAdaptivePollingPolicy.mode_for
+    assert mode_for(_status("4", "engine-running")) == POLLING_MODE_DRIVING
+    assert mode_for(_status("1", "engine-off", "2")) == POLLING_MODE_CHARGING
+    assert mode_for(_status("1", "charging")) == POLLING_MODE_CHARGING
+    assert mode_for(_status("0", "engine-off")) == POLLING_MODE_DEEP_SLEEP
+    assert mode_for(_status("1", "engine-off")) == POLLING_MODE_PARKED
+    assert mode_for(_status("2", "engine-off")) == POLLING_MODE_ACTIVE
+    assert mode_for({}) == POLLING_MODE_ACTIVE
+
+
+def test_adaptive_intervals_respect_base_interval():
+    policy = ZeekrAdaptivePollingPolicy(timedelta(minutes=5))
+    assert policy.select(_status("4", "engine-running")) == (POLLING_MODE_DRIVING, timedelta(minutes=1))
+    assert policy.select(_status("1", "engine-off")) == (POLLING_MODE_PARKED, timedelta(minutes=15))
+    assert policy.select(_status("0")) == (POLLING_MODE_DEEP_SLEEP, timedelta(minutes=60))
+    assert policy.select(_status("2")) == (POLLING_MODE_ACTIVE, timedelta(minutes=5))
+
+    # A slow base interval is never sped up for sleeping cars
+    slow = ZeekrAdaptivePollingPolicy(timedelta(minutes=30))
+    assert slow.select(_status("1", "engine-off"))[1] == timedelta(minutes=30)
+
+
+def test_fixed_policy_uses_base_interval():
+    policy = ZeekrFixedPollingPolicy(timedelta(minutes=5))
+    assert policy.select(_status("4", "engine-running")) == (POLLING_MODE_ACTIVE, timedelta(minutes=5))
+
+
+def test_policy_without_select_fails_when_created():
+    class BrokenPolicy(ZeekrPollingPolicy):
+        pass
+
+    with pytest.raises(TypeError):
+        BrokenPolicy(timedelta(minutes=5))
@@ -17,7 +17,7 @@ def mock_store(hass):
 
 @pytest.mark.asyncio
 async def test_request_stats_init(hass, mock_store):
-    stats = ZeekrRequestStats(hass)
+    stats = ZeekrRequestStats(hass, "entry1")
     assert stats.api_requests_today == 0
     assert stats.api_invokes_today == 0
     assert stats._loaded is False
@@ -33,7 +33,7 @@ async def test_request_stats_load_existing(hass, mock_store):
         'last_reset': str(datetime.now().date())
     }
 
-    stats = ZeekrRequestStats(hass)
+    stats = ZeekrRequestStats(hass, "entry1")
     await stats.async_load()
 
     assert stats.api_requests_today == 10
@@ -51,7 +51,7 @@ async def test_request_stats_load_reset_needed(hass, mock_store):
         'last_reset': str(yesterday)
     }
 
-    stats = ZeekrRequestStats(hass)
+    stats = ZeekrRequestStats(hass, "entry1")
     await stats.async_load()
 
     # Should have reset
@@ -59,8 +59,8 @@ async def test_request_stats_load_reset_needed(hass, mock_store):
     assert stats.api_invokes_today == 0
     assert stats.api_requests_total == 0
 
-    # Check save called for reset
-    assert mock_store.async_save.called
+    # Check save scheduled for reset
+    assert mock_store.async_delay_save.called
 
 
 @pytest.mark.asyncio
@@ -69,19 +69,22 @@ async def test_inc_request(hass, mock_store):
     # Setup default return value for load to avoid MagicMock pollution
     mock_store.async_load.return_value = {}
 
-    stats = ZeekrRequestStats(hass)
+    stats = ZeekrRequestStats(hass, "entry1")
     await stats.async_load()
 
-    # Increment and check state
-    await stats.async_inc_request()
-    assert stats.api_requests_today == 1
-    assert stats.api_requests_total == 1
+    # Increment and check state; one batched write covers both
+    stats.inc_request()
+    stats.inc_request()
+    assert stats.api_requests_today == 2
+    assert stats.api_requests_total == 2
     assert stats._dirty is True
+    mock_store.async_delay_save.assert_called_once()
     mock_store.async_save.assert_not_called()
 
     # Now, trigger shutdown and verify save
     await stats.async_shutdown()
     mock_store.async_save.assert_called_once()
+    assert stats._dirty is False
 
 
 @pytest.mark.asyncio
@@ -90,11 +93,11 @@ async def test_inc_invoke(hass, mock_store):
     # Setup default return value for load
     mock_store.async_load.return_value = {}
 
-    stats = ZeekrRequestStats(hass)
+    stats = ZeekrRequestStats(hass, "entry1")
     await stats.async_load()
 
     # Increment and check state
-    await stats.async_inc_invoke()
+    stats.inc_invoke()
     assert stats.api_invokes_today == 1
     assert stats.api_invokes_total == 1
     assert stats._dirty is True
@@ -103,3 +106,88 @@ async def test_inc_invoke(hass, mock_store):
     # Now, trigger shutdown and verify save
     await stats.async_shutdown()
     mock_store.async_save.assert_called_once()
+    assert stats._dirty is False
+
+
+@pytest.mark.asyncio
+async def test_stats_stored_per_entry(hass):
+    with patch("custom_components.zeekr_ev.request_stats.Store") as mock_store_cls:
+        first = ZeekrRequestStats(hass, "entry1")
+        second = ZeekrRequestStats(hass, "entry2")
+    keys = [call.args[2] for call in mock_store_cls.call_args_list]
+    assert keys == ["zeekr_ev.entry1.stats", "zeekr_ev.entry2.stats"]
+
+    first.inc_request()
+    assert second.api_requests_today == 0
+
+
+@pytest.mark.asyncio
+async def test_legacy_stats_seed_the_first_entry_only(hass):
+    legacy = {
+        "api_requests_today": 3,
+        "api_invokes_today": 1,
+        "api_requests_total": 100,
+        "api_invokes_total": 20,
+        "last_reset": str(datetime.now().date()),
+    }
+    stores = {}
+
+    def make_store(hass, version, key):
+        store = stores.setdefault(key, MagicMock())
+        store.async_load = AsyncMock(return_value=legacy if key == "zeekr_ev_stats" else None)
+        store.async_save = AsyncMock()
+        store.async_remove = AsyncMock()
+        return store
+
+    with patch("custom_components.zeekr_ev.request_stats.Store", side_effect=make_store):
+        first = ZeekrRequestStats(hass, "entry1")
+        second = ZeekrRequestStats(hass, "entry2")
+        await first.async_load()
+        await second.async_load()
+
+    assert first.api_requests_total == 100
+    assert second.api_requests_total == 0
+    stores["zeekr_ev.entry1.stats"].async_save.assert_awaited_once_with(legacy)
+    stores["zeekr_ev_stats"].async_load.assert_awaited_once()
+    stores["zeekr_ev_stats"].async_remove.assert_awaited_once()
+
+
+def test_call_latency_histogram(hass, mock_store):
+    stats = ZeekrRequestStats(hass, "entry1")
+    for duration in (0.04, 0.08, 0.2, 0.3, 0.4, 0.45, 0.6, 0.7, 2.0, 90.0):
+        stats.record_call("get_status", "VIN1", duration)
+    stats.record_call("get_status", "VIN2", 0.03, error=True)
+
+    status = stats.call_stats("get_status")
+    assert status["count"] == 11
+    assert status["errors"] == 1
+    assert status["p50_ms"] == 500
+    assert status["p95_ms"] == 60000
+    assert status["vehicles"]["VIN2"] == {
+        "count": 1, "errors": 1, "mean_ms": 30.0, "p50_ms": 50, "p95_ms": 50, "p99_ms": 50,
+    }
+    assert stats.call_stats("login") is None
+    assert list(stats.calls_as_dict()) == ["get_status"]
+
+
+def test_rolling_request_rates(hass, mock_store):
+    stats = ZeekrRequestStats(hass, "entry1")
+    monotonic = "custom_components.zeekr_ev.request_stats.time.monotonic"
+    with patch(monotonic, return_value=0):
+        stats.inc_request()
+        stats.inc_invoke()
+    with patch(monotonic, return_value=50 * 60):
+        stats.inc_request()
+        stats.inc_request()
+        assert stats.rates() == {
+            "requests_5m": 2, "invokes_5m": 0,
+            "requests_1h": 3, "invokes_1h": 1,
+            "requests_24h": 3, "invokes_24h": 1,
+        }
+
+    # A day later the reused slot starts from zero
+    with patch(monotonic, return_value=24 * 3600):
+        stats.inc_request()
+        assert stats.requests_in(5) == 1
+        assert stats.requests_in(24 * 60) == 3
+        assert stats.invokes_in(24 * 60) == 0
@@ -1,3 +1,4 @@
+import pytest
 from custom_components.zeekr_ev.sensor import (
     ZeekrSensor,
     ZeekrAPIStatusSensor,
@@ -364,3 +365,108 @@ def test_api_status_sensor_disconnected():
     coordinator = MockCoordinator()
     sensor = ZeekrAPIStatusSensor(coordinator, "entry_1")
     assert sensor.native_value == "Disconnected"
+
+
+def test_polling_sensors():
+    """Test the polling diagnostic sensors read the coordinator's schedule."""
+    from datetime import timedelta
+    from custom_components.zeekr_ev.sensor import ZeekrPollingIntervalSensor, ZeekrPollingModeSensor
+
+    class MockCoordinator:
+        def __init__(self):
+            self.data = {}
+            self.polling_modes = {"VIN1": "parked"}
+            self.vehicle_intervals = {"VIN1": timedelta(minutes=15)}
+
+    coordinator = MockCoordinator()
+    assert ZeekrPollingModeSensor(coordinator, "VIN1").native_value == "parked"
+    assert ZeekrPollingIntervalSensor(coordinator, "VIN1").native_value == 15
+    assert ZeekrPollingIntervalSensor(coordinator, "VIN2").native_value is None
+
+
+def test_circuit_breaker_sensor():
+    """Test the circuit breaker sensor reports the most degraded endpoint."""
+    from custom_components.zeekr_ev.circuit_breaker import ZeekrCircuitBreaker
+    from custom_components.zeekr_ev.sensor import ZeekrCircuitBreakerSensor
+
+    class MockCoordinator:
+        def __init__(self):
+            self.data = {}
+            self.breakers = {"status": ZeekrCircuitBreaker("status"), "travel_plan": ZeekrCircuitBreaker("travel_plan", threshold=1)}
+
+    coordinator = MockCoordinator()
+    sensor = ZeekrCircuitBreakerSensor(coordinator, "entry1")
+    assert sensor.native_value == "closed"
+
+    coordinator.breakers["travel_plan"].record_failure()
+    assert sensor.native_value == "open"
+    assert sensor.extra_state_attributes["travel_plan"] == {"state": "open", "retry_in": 60}
+    assert sensor.extra_state_attributes["status"]["state"] == "closed"
+
+
+def test_api_latency_sensor():
+    """Test the latency sensor reports the p95 of its API method."""
+    from unittest.mock import MagicMock
+    from custom_components.zeekr_ev.request_stats import ZeekrRequestStats
+    from custom_components.zeekr_ev.sensor import ZeekrAPILatencySensor
+
+    class MockCoordinator:
+        def __init__(self):
+            self.data = {}
+            self.request_stats = ZeekrRequestStats(MagicMock(), "entry1")
+
+    coordinator = MockCoordinator()
+    sensor = ZeekrAPILatencySensor(coordinator, "entry1", "get_status")
+    assert sensor.native_value is None
+
+    coordinator.request_stats.record_call("get_status", "VIN1", 0.2)
+    assert sensor.native_value == 250
+    assert sensor.extra_state_attributes["vehicles"]["VIN1"]["count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_api_rate_sensors(hass, mock_config_entry):
+    """Test the rolling request rate sensors read the stats ring buffer."""
+    from unittest.mock import MagicMock, patch
+    from custom_components.zeekr_ev.const import DOMAIN
+    from custom_components.zeekr_ev.request_stats import ZeekrRequestStats
+    from custom_components.zeekr_ev.sensor import async_setup_entry
+
+    class MockCoordinator:
+        def __init__(self):
+            self.data = {}
+            self.client = None
+            self.request_stats = ZeekrRequestStats(MagicMock(), "entry1")
+
+    coordinator = MockCoordinator()
+    coordinator.request_stats.inc_request()
+    hass.data[DOMAIN] = {mock_config_entry.entry_id: coordinator}
+    async_add_entities = MagicMock()
+    with patch("custom_components.zeekr_ev.sensor.zeekr_app_sig_module", MagicMock()):
+        await async_setup_entry(hass, mock_config_entry, async_add_entities)
+
+    sensors = {e.unique_id: e for e in async_add_entities.call_args[0][0]}
+    assert sensors["test_entry_id_api_requests_5m"].native_value == 1
+    assert sensors["test_entry_id_api_invokes_24h"].native_value == 0
+
+
+@pytest.mark.asyncio
+async def test_api_rate_sensor_rolls_between_polls(hass):
+    """Test the rate sensors write their state every minute without a poll."""
+    from datetime import timedelta
+    from unittest.mock import AsyncMock, MagicMock, patch
+    from custom_components.zeekr_ev.sensor import ZeekrAPIRateSensor
+
+    coordinator = MagicMock()
+    sensor = ZeekrAPIRateSensor(coordinator, "entry1", "api_requests_5m", "API Requests Last 5 Minutes", lambda stats: 0)
+    sensor.hass = hass
+    sensor.async_write_ha_state = MagicMock()
+
+    with patch("homeassistant.helpers.update_coordinator.CoordinatorEntity.async_added_to_hass", AsyncMock()), \
+            patch("custom_components.zeekr_ev.sensor.async_track_time_interval") as track:
+        await sensor.async_added_to_hass()
+
+    _, roll, interval = track.call_args[0]
+    assert interval == timedelta(minutes=1)
+    roll(None)
+    sensor.async_write_ha_state.assert_called_once()
@@ -0,0 +1,41 @@
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from custom_components.zeekr_ev.session import ZeekrSessionStore
+
+
+def _saved(store):
+    """Return the payload handed to Store.async_delay_save."""
+    data_func = store._store.async_delay_save.call_args[0][0]
+    return data_func()
+
+
+@pytest.mark.asyncio
+async def test_session_round_trip_without_password(hass):
+    store = ZeekrSessionStore(hass, "entry1", "secret")
+    store._store.async_delay_save = MagicMock()
+
+    store.async_save({"username": "user", "password": "secret", "bearer_token": "bearer"})
+    payload = _saved(store)
+    assert "bearer" not in payload["session"]
+
+    store._store.async_load = AsyncMock(return_value=payload)
+    assert await store.async_load() == {"username": "user", "bearer_token": "bearer"}
+
+
+@pytest.mark.asyncio
+async def test_session_rejected_after_password_change_or_expiry(hass):
+    store = ZeekrSessionStore(hass, "entry1", "secret")
+    store._store.async_delay_save = MagicMock()
+    store.async_save({"bearer_token": "bearer"})
+    payload = _saved(store)
+
+    other = ZeekrSessionStore(hass, "entry1", "changed")
+    other._store.async_load = AsyncMock(return_value=payload)
+    assert await other.async_load() is None
+
+    payload["saved_at"] = (datetime.now() - timedelta(days=31)).isoformat()
+    store._store.async_load = AsyncMock(return_value=payload)
+    assert await store.async_load() is None
@@ -1,7 +1,8 @@
-from unittest.mock import MagicMock, AsyncMock, patch
+from unittest.mock import MagicMock
 import asyncio
 import pytest
 from custom_components.zeekr_ev.switch import ZeekrSwitch, async_setup_entry
+from custom_components.zeekr_ev.confirm import AnyExcept
 from custom_components.zeekr_ev.const import DOMAIN
 
 
@@ -17,15 +18,20 @@ class MockCoordinator:
     def __init__(self, data):
         self.data = data
         self.vehicles = {}
-        self.async_inc_invoke = AsyncMock()
+        self.inc_invoke = MagicMock()
+        self.async_confirm = MagicMock()
         self.steering_wheel_duration = 15
 
+    async def async_call(self, func, *args):
+        return func(*args)
+
+    async def async_send_command(self, vehicle, command, service_id, setting):
+        self.inc_invoke()
+        return vehicle.do_remote_control(command, service_id, setting)
+
     def get_vehicle_by_vin(self, vin):
         return self.vehicles.get(vin)
 
-    def inc_invoke(self):
-        pass
-
     async def async_request_refresh(self):
         pass
 
@@ -159,10 +165,11 @@ async def test_charging_switch():
     coordinator.data[vin]["additionalVehicleStatus"]["electricVehicleStatus"]["chargerState"] = "26"
     assert switch.is_on is False
 
-    # Test Turn On
-    with patch("asyncio.sleep", new_callable=AsyncMock):
-        vehicle_mock.get_charging_status = MagicMock(return_value={"chargerState": "2"})
-        await switch.async_turn_on()
+    # Test Turn On: returns straight away and confirms in the background
+    await switch.async_turn_on()
+    vehicle_mock.get_charging_status.assert_not_called()
+    path = ("additionalVehicleStatus", "electricVehicleStatus", "chargerState")
+    coordinator.async_confirm.assert_called_with(vin, "status", {path: ("1", "2")})
 
     vehicle_mock.do_remote_control.assert_called_with(
         "start",
@@ -283,6 +290,10 @@ async def test_steering_wheel_switch():
     # Optimistic update
     assert coordinator.data[vin]["additionalVehicleStatus"]["climateStatus"]["steerWhlHeatingSts"] == "2"
     switch.async_write_ha_state.assert_called()
+    # Off is any value but "1", as is_on reads it
+    expected = coordinator.async_confirm.call_args.args[2]
+    path = ("additionalVehicleStatus", "climateStatus", "steerWhlHeatingSts")
+    assert isinstance(expected[path], AnyExcept) and expected[path] == ("1",)
 
 
 @pytest.mark.asyncio
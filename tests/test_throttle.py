@@ -0,0 +1,57 @@
+from unittest.mock import patch
+
+import pytest
+
+from custom_components.zeekr_ev.throttle import ZeekrThrottle
+
+MONOTONIC = "custom_components.zeekr_ev.throttle.time.monotonic"
+
+
+def test_throttle_unlimited_until_throttled():
+    throttle = ZeekrThrottle()
+    with patch(MONOTONIC, return_value=100):
+        assert throttle.reserve() == 0
+        assert throttle.reserve() == 0
+
+        throttle.record_throttled()
+        assert throttle.rate == 0.5
+        # A burst of throttled responses halves the rate once
+        throttle.record_throttled()
+        assert throttle.rate == 0.5
+
+        assert throttle.reserve() == 0
+        assert throttle.reserve() == 2
+        assert throttle.reserve() == 4
+
+
+def test_throttle_tightens_and_relaxes_over_time():
+    throttle = ZeekrThrottle()
+    with patch(MONOTONIC, return_value=0):
+        throttle.record_throttled()
+    with patch(MONOTONIC, return_value=10):
+        throttle.record_throttled()
+    assert throttle.rate == 0.25
+
+    # Each quiet minute adds a little back
+    with patch(MONOTONIC, return_value=130):
+        throttle.reserve()
+    assert throttle.rate == pytest.approx(0.35)
+
+    # Eventually requests are no longer paced
+    with patch(MONOTONIC, return_value=10000):
+        assert throttle.reserve() == 0
+    assert throttle.rate is None
+
+
+def test_priority_requests_skip_the_background_queue():
+    throttle = ZeekrThrottle()
+    with patch(MONOTONIC, return_value=100):
+        throttle.record_throttled()
+        # A poll's worth of background requests is queued
+        assert [throttle.reserve() for _ in range(4)] == [0, 2, 4, 6]
+
+        # Commands wait only for each other
+        assert throttle.reserve(priority=True) == 0
+        assert throttle.reserve(priority=True) == 2
+        # and push later background requests back
+        assert throttle.reserve() == 12
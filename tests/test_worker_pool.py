@@ -0,0 +1,48 @@
+import asyncio
+import threading
+
+import pytest
+
+from custom_components.zeekr_ev.worker_pool import ZeekrWorkerPool
+
+
+@pytest.mark.asyncio
+async def test_run_returns_result_and_records_wait():
+    pool = ZeekrWorkerPool(2)
+    try:
+        assert await pool.async_run(lambda a, b: a + b, 1, 2) == 3
+        assert pool.completed == 1
+        assert pool.queue_depth == 0
+        assert pool.active == 0
+        assert pool.average_wait >= 0
+    finally:
+        pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_concurrency_is_bounded():
+    pool = ZeekrWorkerPool(1)
+    release = threading.Event()
+    try:
+        first = asyncio.ensure_future(pool.async_run(release.wait, 5))
+        second = asyncio.ensure_future(pool.async_run(lambda: "done"))
+        await asyncio.sleep(0.05)
+        assert pool.active == 1
+        assert pool.queue_depth == 1
+
+        release.set()
+        assert await second == "done"
+        assert await first is True
+        assert pool.queue_depth == 0
+    finally:
+        release.set()
+        pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_run_after_shutdown_raises():
+    pool = ZeekrWorkerPool(1)
+    pool.shutdown()
+    with pytest.raises(RuntimeError):
+        await pool.async_run(lambda: None)
+    assert pool.queue_depth == 0